@@ -0,0 +1,73 @@
+"""Compare the HTML fast path with Docling on the saved page corpus.
+
+    python -m benchmarks.extraction [--corpus benchmarks/corpus] [--repeat 5] [--no-docling]
+
+Reports per-page latency (median of ``--repeat`` runs), words extracted and, for
+the fast path, the quality-check verdict that would send the page to Docling.
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.extraction.html_extractor import HTMLMarkdownExtractor
+from src.extraction.provider import ExtractionError
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+
+
+def _time(convert: Callable[[str], str], source: str, repeat: int) -> tuple[float, str]:
+    durations = []
+    result = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = convert(source)
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations), result
+
+
+def _fast_path(extractor: HTMLMarkdownExtractor, source: str, repeat: int) -> tuple[float, str, str]:
+    try:
+        seconds, markdown = _time(extractor.extract, source, repeat)
+    except ExtractionError as exc:
+        return 0.0, "", f"fallback: {exc}"
+    return seconds, markdown, "ok"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-docling", action="store_true", help="Only benchmark the HTML fast path")
+    args = parser.parse_args()
+
+    docling: Callable[[str], str] | None = None
+    if not args.no_docling:
+        try:
+            from src.job_description_data_extraction import create_markdown_converter
+
+            started = time.perf_counter()
+            docling = create_markdown_converter()
+            print(f"Docling converter initialized in {time.perf_counter() - started:.2f}s")
+        except ImportError:
+            print("Docling is not installed; benchmarking the HTML fast path only")
+
+    extractor = HTMLMarkdownExtractor()
+    print(f"{'page':<32} {'html ms':>9} {'words':>6} {'docling ms':>11} {'words':>6}  verdict")
+    fast_total = docling_total = 0.0
+    for page in sorted(args.corpus.glob("*.htm*")):
+        fast_s, markdown, verdict = _fast_path(extractor, str(page), args.repeat)
+        fast_total += fast_s
+        docling_column = f"{'-':>11} {'-':>6}"
+        if docling is not None:
+            docling_s, docling_markdown = _time(docling, str(page), args.repeat)
+            docling_total += docling_s
+            docling_column = f"{docling_s * 1000:>11.1f} {len(docling_markdown.split()):>6}"
+        print(f"{page.name:<32} {fast_s * 1000:>9.2f} {len(markdown.split()):>6} {docling_column}  {verdict}")
+    print(f"Total: html {fast_total * 1000:.1f} ms" + (f", docling {docling_total * 1000:.1f} ms" if docling else ""))
+
+
+if __name__ == "__main__":
+    main()
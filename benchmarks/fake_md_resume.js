@@ -0,0 +1,23 @@
+#!/usr/bin/env node
+// Stand-in for md-resume.js used by the offline benchmarks.
+//
+// Accepts the same arguments (<input.md> --output <file.pdf> --paper A4 --font-size 12),
+// waits FAKE_PDF_DELAY_MS milliseconds to simulate browser rendering and writes a
+// minimal PDF containing the markdown length.
+
+const fs = require("node:fs");
+
+const args = process.argv.slice(2);
+const input = args[0];
+const outputIndex = args.indexOf("--output");
+if (!input || outputIndex === -1 || !args[outputIndex + 1]) {
+  console.error("usage: fake_md_resume.js <input.md> --output <file.pdf> [--paper A4] [--font-size 12]");
+  process.exit(2);
+}
+const output = args[outputIndex + 1];
+const delay = Number(process.env.FAKE_PDF_DELAY_MS ?? 0);
+
+const markdown = fs.readFileSync(input, "utf8");
+setTimeout(() => {
+  fs.writeFileSync(output, `%PDF-1.4\n% fake resume, ${markdown.length} chars of markdown\n%%EOF\n`);
+}, delay);
@@ -0,0 +1,152 @@
+"""Local stand-ins for the network services the pipeline talks to."""
+
+import asyncio
+import random
+import re
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from src.llm.provider import LLMProvider
+from src.models.experience_data import ExperienceData
+from src.models.job_keywords import JobDescriptionKeywords, SkillRequirement
+from src.models.resume_patch import ResumePatch
+from src.models.skill_gap import SkillGap, SkillGapAnalysis
+from src.models.tailoring import TailoredResume
+from src.tracing.tracer import record_usage
+
+FAKE_PDF_CLI = Path(__file__).parent / "fake_md_resume.js"
+
+_HEADING_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+
+KEYWORDS = JobDescriptionKeywords(
+    job_title="Senior Backend Engineer",
+    seniority_level="Senior",
+    years_of_experience="5+",
+    company_name="Northwind Analytics",
+    department_or_team="Platform",
+    skill_requirements=[
+        SkillRequirement(skills=["Python", "Go", "PostgreSQL", "Kafka"], category="technical", importance="required"),
+        SkillRequirement(skills=["Kubernetes", "Terraform"], category="technical", importance="preferred"),
+        SkillRequirement(skills=["Mentoring"], category="soft", importance="preferred"),
+    ],
+    key_responsibilities=["Build forecast services", "Own the event pipeline", "Mentor engineers"],
+    industry_domain="Retail analytics",
+    keywords_for_ats=["Python", "Go", "Kafka", "PostgreSQL", "Kubernetes", "Terraform"],
+    summary_of_role="Build and operate the services that deliver demand forecasts to stores.",
+)
+
+GAPS = SkillGapAnalysis(
+    gaps=[SkillGap(skill="Kafka", category="technical", importance="required", context="Owns the event pipeline")]
+)
+
+
+class FakeLLMProvider(LLMProvider):
+    """Returns canned structured outputs after a log-normally distributed delay.
+
+    ``latency_s`` is the median call latency and ``latency_sigma`` the spread of
+    its logarithm; token counts are drawn the same way around their medians and
+    reported to the active tracer like a real provider would. The job title is
+    taken from the posting's first heading so each job gets its own output folder.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        experience_data: ExperienceData,
+        latency_s: float = 0.2,
+        latency_sigma: float = 0.5,
+        input_tokens: int = 3000,
+        output_tokens: int = 800,
+        token_sigma: float = 0.3,
+        seed: int = 0,
+    ) -> None:
+        self._experience_data = experience_data
+        self._latency_s = latency_s
+        self._latency_sigma = latency_sigma
+        self._input_tokens = input_tokens
+        self._output_tokens = output_tokens
+        self._token_sigma = token_sigma
+        self._random = random.Random(seed)
+        self.calls = 0
+
+    @property
+    def model(self) -> str:
+        return "fake-model"
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        self.calls += 1
+        if self._latency_s > 0:
+            await asyncio.sleep(self._random.lognormvariate(0, self._latency_sigma) * self._latency_s)
+        record_usage(
+            round(self._random.lognormvariate(0, self._token_sigma) * self._input_tokens),
+            round(self._random.lognormvariate(0, self._token_sigma) * self._output_tokens),
+        )
+        return output_model.model_validate(self._response(prompt, output_model).model_dump())
+
+    def _response(self, prompt: str, output_model: type[BaseModel]) -> BaseModel:
+        heading = _HEADING_RE.search(prompt)
+        keywords = KEYWORDS.model_copy(update={"job_title": heading.group(1)}) if heading else KEYWORDS
+        if output_model is JobDescriptionKeywords:
+            return keywords
+        if output_model is SkillGapAnalysis:
+            return GAPS
+        if output_model is TailoredResume:
+            return TailoredResume(keywords=keywords, skill_gaps=GAPS, adjusted_resume=self._experience_data)
+        if output_model is ResumePatch:
+            return ResumePatch(summary=self._experience_data.summary)
+        if output_model is ExperienceData:
+            return self._experience_data
+        raise TypeError(f"No canned response for {output_model.__name__}")
+
+
+class _FixtureHandler(SimpleHTTPRequestHandler):
+    """Serves /jobs/<n>/<page> from the corpus, tagging the job title with <n> so every posting is distinct."""
+
+    def __init__(self, *args, corpus: Path, **kwargs) -> None:
+        self._corpus = corpus
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self) -> None:
+        parts = self.path.strip("/").split("/")
+        page = self._corpus / parts[-1] if len(parts) == 3 and parts[0] == "jobs" else None
+        if page is None or not page.is_file():
+            self.send_error(404)
+            return
+        tag = f"(#{parts[1]})"
+        html = page.read_text(encoding="utf-8")
+        html = html.replace("</h1>", f" {tag}</h1>", 1).replace('"title": "', f'"title": "{tag} ', 1)
+        body = html.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class FixtureJobServer:
+    """Local HTTP server standing in for job boards, backed by saved pages."""
+
+    def __init__(self, corpus: Path, host: str = "127.0.0.1") -> None:
+        self._server = ThreadingHTTPServer((host, 0), partial(_FixtureHandler, corpus=corpus))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "FixtureJobServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def url(self, job: int, page: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/jobs/{job}/{page}"
@@ -0,0 +1,187 @@
+"""Offline throughput benchmark of the full tailoring pipeline.
+
+    python -m benchmarks.pipeline [--sizes 1,10,100,1000] [--llm-latency-ms 200] [--json results.json]
+
+Runs PipelineRuntime, the same runtime ``main.py`` uses, with local stand-ins:
+FakeLLMProvider for the LLM, a local HTTP server serving the pages in
+benchmarks/corpus, and benchmarks/fake_md_resume.js in place of md-resume.js.
+Scheduler, extraction, caches, rendering and the PDF subprocess run for real.
+Reports jobs/sec, per-stage latency percentiles and peak RSS per batch size.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import SecretStr
+
+from benchmarks.fakes import FAKE_PDF_CLI, FakeLLMProvider, FixtureJobServer
+from src.data.json_file_provider import JsonFileDataProvider
+from src.extraction.html_extractor import HTMLMarkdownExtractor
+from src.extraction.provider import ExtractionError
+from src.llm.provider import LLMProvider
+from src.llm.traced_provider import TracingLLMProvider
+from src.models.experience_data import ExperienceData
+from src.pipeline.runtime import PipelineRuntime
+from src.settings import BASE_DIR, Settings
+from src.tracing.tracer import percentile
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+
+
+class OfflineRuntime(PipelineRuntime):
+    """PipelineRuntime whose LLM provider is the given fake instead of a configured backend."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        experience_data: ExperienceData,
+        personal_data: dict[str, Any],
+        llm: LLMProvider,
+    ) -> None:
+        self._fake_llm = llm
+        super().__init__(settings, experience_data, personal_data)
+
+    def _build_provider(self) -> LLMProvider:
+        return TracingLLMProvider(self._fake_llm)
+
+
+def _peak_rss_mb() -> tuple[float, float]:
+    """Peak RSS of this process and of the largest finished child (the PDF CLI), in MB."""
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return own / 2**20, children / 2**20
+
+
+def _usable_pages(corpus: Path) -> list[str]:
+    """Corpus pages the HTML fast path accepts; the others would need Docling."""
+    extractor = HTMLMarkdownExtractor()
+    pages = []
+    for page in sorted(corpus.glob("*.htm*")):
+        try:
+            extractor.convert(page.read_text(encoding="utf-8"))
+        except ExtractionError:
+            continue
+        pages.append(page.name)
+    return pages
+
+
+def _settings(work_dir: Path, args: argparse.Namespace) -> Settings:
+    return Settings.model_construct(
+        llm_api_key=SecretStr("offline"),
+        llm_provider="openai",
+        md_j2_template=BASE_DIR / "templates" / "resume_template.md.j2",
+        master_json=BASE_DIR / "data" / "example_master_data.json",
+        personal_json=BASE_DIR / "data" / "example_personal_data.json",
+        cli_converter_path=FAKE_PDF_CLI,
+        output_dir=work_dir / "outputs",
+        tailoring_mode=args.tailoring_mode,
+        max_concurrent_jobs=args.concurrency,
+        llm_concurrency=args.llm_concurrency,
+        pdf_concurrency=args.pdf_concurrency,
+        conversion_cache_dir=work_dir / "markdown" if args.caches else None,
+        run_manifest_path=work_dir / "manifest.jsonl" if args.caches else None,
+        posting_index_path=work_dir / "postings.sqlite3" if args.caches else None,
+    )
+
+
+async def _run_batch(size: int, server: FixtureJobServer, pages: list[str], args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory(prefix="pipeline-bench-") as tmp:
+        settings = _settings(Path(tmp), args)
+        data_provider = JsonFileDataProvider()
+        experience_data = data_provider.load_experience_data(settings.master_json)
+        personal_data = data_provider.load_personal_data(settings.personal_json)
+        llm = FakeLLMProvider(
+            experience_data,
+            latency_s=args.llm_latency_ms / 1000,
+            latency_sigma=args.llm_latency_sigma,
+            input_tokens=args.input_tokens,
+            output_tokens=args.output_tokens,
+        )
+        urls = [server.url(job, pages[job % len(pages)]) for job in range(size)]
+
+        started = time.perf_counter()
+        async with OfflineRuntime(settings, experience_data, personal_data, llm) as runtime:
+            outcomes = await runtime.run(urls)
+        elapsed = time.perf_counter() - started
+
+        durations = runtime.tracer.stage_durations()
+        own_rss, child_rss = _peak_rss_mb()
+        return {
+            "jobs": size,
+            "failed": sum(not outcome.succeeded for outcome in outcomes),
+            "seconds": elapsed,
+            "jobs_per_s": size / elapsed,
+            "llm_calls": llm.calls,
+            "peak_rss_mb": own_rss,
+            "peak_child_rss_mb": child_rss,
+            "stages": {
+                stage: {
+                    "count": len(values),
+                    "p50_ms": percentile(values, 50) * 1000,
+                    "p95_ms": percentile(values, 95) * 1000,
+                    "p99_ms": percentile(values, 99) * 1000,
+                }
+                for stage, values in sorted(durations.items())
+            },
+        }
+
+
+def _print_result(result: dict) -> None:
+    print(
+        f"\n{result['jobs']} job(s): {result['jobs_per_s']:.2f} jobs/s in {result['seconds']:.2f}s, "
+        f"{result['failed']} failed, {result['llm_calls']} LLM calls, "
+        f"peak RSS {result['peak_rss_mb']:.0f} MB (PDF CLI {result['peak_child_rss_mb']:.0f} MB)"
+    )
+    print(f"  {'stage':<28} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for stage, stats in result["stages"].items():
+        print(
+            f"  {stage:<28} {stats['count']:>6} {stats['p50_ms']:>9.1f} "
+            f"{stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f}"
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1,10,100,1000", help="Comma-separated batch sizes")
+    parser.add_argument("--llm-latency-ms", type=float, default=200.0, help="Median fake LLM latency")
+    parser.add_argument("--llm-latency-sigma", type=float, default=0.5, help="Log-normal spread of LLM latency")
+    parser.add_argument("--input-tokens", type=int, default=3000, help="Median prompt tokens per call")
+    parser.add_argument("--output-tokens", type=int, default=800, help="Median completion tokens per call")
+    parser.add_argument("--pdf-delay-ms", type=int, default=50, help="Simulated PDF rendering time")
+    parser.add_argument("--tailoring-mode", choices=["staged", "fused"], default="staged")
+    parser.add_argument("--concurrency", type=int, default=4, help="max_concurrent_jobs")
+    parser.add_argument("--llm-concurrency", type=int, default=8)
+    parser.add_argument("--pdf-concurrency", type=int, default=2)
+    parser.add_argument("--caches", action="store_true", help="Enable conversion cache, manifest and posting index")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    os.environ["FAKE_PDF_DELAY_MS"] = str(args.pdf_delay_ms)
+    pages = _usable_pages(args.corpus)
+    if not pages:
+        parser.error(f"No pages in {args.corpus} pass the HTML fast path")
+
+    results = []
+    with FixtureJobServer(args.corpus) as server:
+        for size in (int(value) for value in args.sizes.split(",")):
+            result = await _run_batch(size, server, pages, args)
+            _print_result(result)
+            results.append(result)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
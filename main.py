@@ -2,24 +2,21 @@ import argparse
 import asyncio
 import json
 import logging
-import re
 from datetime import datetime
-from pathlib import Path
+from typing import Any
 
 from dotenv import dotenv_values
 
-from src.agents.extract_job_keywords import extract_job_keywords
-from src.agents.analyze_skill_gaps import analyze_skill_gaps
-from src.agents.adjust_data import adjust_data
-from src.job_description_data_extraction import docling_url_to_markdown
 from src.data.json_file_provider import JsonFileDataProvider
-from src.rendering.jinja_renderer import Jinja2TemplateRenderer
-from src.export.markdown_to_pdf_exporter import MarkdownToPDFExporter
-from src.models.extraction_run import JobKeywordResult
-from src.llm.factory import create_llm_provider
-from src.storage.local_file_storage import LocalFileFileStorage
+from src.models.experience_data import ExperienceData
+from src.pipeline.job_source import STDIN, read_job_requests
 from src.settings import ENV_FILE, Settings
 
+# Pipeline, exporter and service modules are imported inside the command that needs them,
+# so `--help` and the base-resume path start without loading the LLM SDKs or asyncio servers.
+
+DEFAULT_PORT = 7777
+
 
 def setup_logging(level="INFO"):
     """Configure logging with nice format."""
@@ -34,54 +31,101 @@ def setup_logging(level="INFO"):
 def parse_args():
     parser = argparse.ArgumentParser(description="Resume generator")
 
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["run", "serve", "export"],
+        default="run",
+        help="'run' tailors job_urls_file once; 'serve' starts the HTTP service on port; "
+        "'export' writes runs from run_store_path back to per-job folders",
+    )
     parser.add_argument("--llm-api-key", dest="llm_api_key", type=str)
+    parser.add_argument(
+        "--tailoring-mode",
+        dest="tailoring_mode",
+        choices=["staged", "fused"],
+        help="Override tailoring_mode from config.toml for this run",
+    )
+    parser.add_argument(
+        "--jobs",
+        dest="jobs",
+        help="Stream jobs from a JSON Lines file ('-' reads stdin): one URL string or "
+        '{"url"|"text", "source", "metadata"} object per line',
+    )
+    parser.add_argument("--company", help="export: only runs whose company contains this text")
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="export: only runs created on or after this ISO date",
+    )
     return parser.parse_args()
 
 
-def _sanitize(name: str) -> str:
-    """Sanitize a string for use in filenames."""
-    return re.sub(r"[^\w\-]", "_", name).strip("_").lower()
-
-
-def _build_output_dir(base: str | Path, company: str = "base", title: str = "resume") -> Path:
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-    return Path(base) / f"{timestamp}_{_sanitize(company)}_{_sanitize(title)}"
-
-
 async def main():
     args = parse_args()
     env_values = dotenv_values(ENV_FILE)
     llm_api_key = args.llm_api_key or env_values.get("LLM_API_KEY")
-    settings = Settings(llm_api_key=llm_api_key) if llm_api_key else Settings()
+    overrides = {"llm_api_key": llm_api_key, "tailoring_mode": args.tailoring_mode}
+    settings = Settings(**{key: value for key, value in overrides.items() if value})
     logger = setup_logging(settings.log_level)
 
     logger.info("Starting resume generator")
-    logger.info(f"Config - PORT: {settings.port}")
+    logger.info(f"Config - HOST: {settings.host} PORT: {settings.port}")
     logger.info(f"Config - MD_J2_TEMPLATE: {settings.md_j2_template}")
     logger.info(f"Config - MASTER_JSON: {settings.master_json}")
     logger.info(f"Config - PERSONAL_JSON: {settings.personal_json}")
     logger.info(f"Config - CLI_CONVERTER_PATH: {settings.cli_converter_path}")
     logger.info(f"Config - JOB_URLS_FILE: {settings.job_urls_file}")
+    logger.info(
+        f"Config - CONCURRENCY: jobs={settings.max_concurrent_jobs} docling={settings.docling_concurrency} "
+        f"llm={settings.llm_concurrency} pdf={settings.pdf_concurrency}"
+    )
+    logger.info(f"Config - TAILORING_MODE: {settings.tailoring_mode}")
     logger.info(f"Log level: {settings.log_level}")
 
+    if args.command == "export":
+        export_runs(settings, company=args.company, since=args.since)
+        return
+
     data_provider = JsonFileDataProvider()
 
     experience_data = data_provider.load_experience_data(settings.master_json)
     personal_data = data_provider.load_personal_data(settings.personal_json)
 
+    if args.command == "serve":
+        await serve(settings, experience_data, personal_data)
+        return
+
+    jobs_input = args.jobs
+    if jobs_input is None and settings.job_urls_file and settings.job_urls_file.suffix == ".jsonl":
+        jobs_input = settings.job_urls_file
+    if jobs_input is not None:
+        from src.pipeline.runtime import PipelineRuntime
+
+        logger.info("Streaming jobs from %s", "stdin" if jobs_input == STDIN else jobs_input)
+        async with PipelineRuntime(settings, experience_data, personal_data) as runtime:
+            tally = await runtime.stream(read_job_requests(jobs_input))
+        logger.info(tally.summary())
+        runtime.log_summary()
+        return
+
     if not settings.job_urls_file:
         logger.info("No job URLs file configured — generating base resume only")
+        from src.export.markdown_to_pdf_exporter import MarkdownToPDFExporter
+        from src.pipeline.job_pipeline import build_output_dir
+        from src.rendering.jinja_renderer import Jinja2TemplateRenderer
+
         combined = {**experience_data.model_dump(), **personal_data}
-        renderer = Jinja2TemplateRenderer(settings.md_j2_template)
+        renderer = Jinja2TemplateRenderer(settings.md_j2_template, settings.template_bytecode_cache_dir)
         exporter = MarkdownToPDFExporter(
             renderer=renderer,
             cli_path=settings.cli_converter_path,
             paper=settings.pdf_paper_size,
             font_size=settings.pdf_font_size,
         )
-        output_dir = _build_output_dir(settings.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        exporter.export(data=combined, output_path=output_dir / settings.pdf_filename)
+        output_dir = build_output_dir(settings.output_dir)
+        await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
+        await exporter.export_async(combined, output_dir / settings.pdf_filename)
         return
 
     job_urls = json.loads(settings.job_urls_file.read_text(encoding="utf-8"))
@@ -89,45 +133,50 @@ async def main():
         logger.info("Job URLs file is empty — skipping tailored generation")
         return
 
-    provider = create_llm_provider(
-        llm_provider=settings.llm_provider,
-        llm_api_key=settings.llm_api_key.get_secret_value(),
-        model=settings.llm_model,
-    )
+    from src.pipeline.runtime import PipelineRuntime
+    from src.pipeline.scheduler import summarize_outcomes
 
-    renderer = Jinja2TemplateRenderer(settings.md_j2_template)
-    exporter = MarkdownToPDFExporter(
-        renderer=renderer,
-        cli_path=settings.cli_converter_path,
-        paper=settings.pdf_paper_size,
-        font_size=settings.pdf_font_size,
-    )
+    async with PipelineRuntime(settings, experience_data, personal_data) as runtime:
+        outcomes = await runtime.run(job_urls)
 
-    for url in job_urls:
-        logger.info("Processing job URL: %s", url)
+    logger.info(summarize_outcomes(outcomes))
+    runtime.log_summary()
 
-        markdown_content = docling_url_to_markdown(url)
-        logger.info("Extracted %d chars of markdown from %s", len(markdown_content), url)
 
-        keywords = await extract_job_keywords(markdown_content, provider)
+def export_runs(settings: Settings, company: str | None = None, since: datetime | None = None) -> None:
+    from src.storage.sqlite_run_store import RunStore
 
-        output_dir = _build_output_dir(settings.output_dir, keywords.company_name, keywords.job_title)
-        job_storage = LocalFileFileStorage(base_dir=output_dir)
-
-        job_storage.save_model(
-            JobKeywordResult(source_url=url, keywords=keywords),
-            Path(settings.keywords_filename),
+    logger = logging.getLogger(__name__)
+    if settings.run_store_path is None or not settings.run_store_path.exists():
+        logger.error("No run store to export; set run_store_path in config.toml")
+        return
+    store = RunStore(settings.run_store_path)
+    try:
+        runs = store.find_runs(company=company, since=since)
+        files = store.export_folders(runs=runs)
+    finally:
+        store.close()
+    logger.info("Exported %d run(s), %d file(s)", len(runs), files)
+
+
+async def serve(settings: Settings, experience_data: ExperienceData, personal_data: dict[str, Any]) -> None:
+    from src.pipeline.runtime import PipelineRuntime
+    from src.service.http_server import TailoringHTTPServer
+    from src.service.jobs import JobManager
+
+    logger = logging.getLogger(__name__)
+    async with PipelineRuntime(settings, experience_data, personal_data) as runtime:
+        manager = JobManager(
+            runtime.process, max_concurrent=settings.max_concurrent_jobs, artifacts=runtime.artifacts
         )
-
-        gaps = await analyze_skill_gaps(experience_data, keywords, provider)
-        job_storage.save_model(gaps, Path(settings.gaps_filename))
-
-        adjusted = await adjust_data(experience_data, keywords, gaps, provider)
-
-        combined = {**adjusted.model_dump(), **personal_data}
-        exporter.export(data=combined, output_path=output_dir / settings.pdf_filename)
-
-        logger.info("Generated tailored resume: %s", output_dir / settings.pdf_filename)
+        server = TailoringHTTPServer(manager, host=settings.host, port=settings.port or DEFAULT_PORT)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+            await manager.aclose()
+            runtime.log_summary()
+    logger.info("Server stopped")
 
 
 if __name__ == "__main__":
@@ -1,34 +1,172 @@
+import json
+import logging
+
+from pydantic import ValidationError
+
+from src.agents.postprocess import replace_em_dash, replace_em_dashes
 from src.llm.provider import LLMProvider
+from src.matching.relevance import TrimmedResume, restore_trimmed, trim_to_budget
 from src.models.experience_data import ExperienceData
 from src.models.job_keywords import JobDescriptionKeywords
+from src.models.resume_patch import ResumePatch
 from src.models.skill_gap import SkillGapAnalysis
 from src.prompts.prompter import Prompter
 
+logger = logging.getLogger(__name__)
+
+
+class PatchError(ValueError):
+    """A resume patch that does not fit the resume it was generated for."""
+
 
 async def adjust_data(
     experience_data: ExperienceData,
     job_keywords: JobDescriptionKeywords,
     skill_gaps: SkillGapAnalysis,
     provider: LLMProvider,
+    token_budget: int | None = None,
+    patch: bool = True,
+) -> ExperienceData:
+    """Tailor resume data for a specific job posting. Same type in, same type out.
+
+    With ``patch``, the model returns only its edits (a :class:`ResumePatch`),
+    which are validated and applied to ``experience_data`` locally; if the patch
+    is invalid, the full resume is regenerated instead. With a ``token_budget``,
+    only the most job-relevant bullets, publications and awards are sent (as
+    compact JSON); the rest are carried through unchanged.
+    """
+    trimmed = trim_to_budget(experience_data, job_keywords, token_budget) if token_budget is not None else None
+    if patch:
+        try:
+            return await _adjust_with_patch(experience_data, job_keywords, skill_gaps, provider, trimmed)
+        except (ValidationError, PatchError) as exc:
+            logger.warning("Invalid resume patch, regenerating the full resume instead: %s", exc)
+
+    if trimmed is None:
+        prompt = Prompter.render(
+            "adjust_data",
+            experience_data=experience_data.model_dump_json(indent=2),
+            job_keywords=job_keywords.model_dump_json(indent=2),
+            skill_gaps=skill_gaps.model_dump_json(indent=2),
+        )
+        adjusted = await provider.generate_structured(prompt, ExperienceData)
+        return replace_em_dashes(adjusted)
+
+    prompt = Prompter.render(
+        "adjust_data",
+        experience_data=trimmed.data.model_dump_json(),
+        job_keywords=job_keywords.model_dump_json(),
+        skill_gaps=skill_gaps.model_dump_json(),
+    )
+    adjusted = replace_em_dashes(await provider.generate_structured(prompt, ExperienceData))
+    return restore_trimmed(adjusted, trimmed, experience_data)
+
+
+async def _adjust_with_patch(
+    experience_data: ExperienceData,
+    job_keywords: JobDescriptionKeywords,
+    skill_gaps: SkillGapAnalysis,
+    provider: LLMProvider,
+    trimmed: TrimmedResume | None,
 ) -> ExperienceData:
-    """Tailor resume data for a specific job posting. Same type in, same type out."""
-    prompt = Prompter.load("adjust_data").format(
-        experience_data=experience_data.model_dump_json(indent=2),
-        job_keywords=job_keywords.model_dump_json(indent=2),
-        skill_gaps=skill_gaps.model_dump_json(indent=2),
+    indent = 2 if trimmed is None else None
+    prompt = Prompter.render(
+        "adjust_data_patch",
+        experience_data=json.dumps(_indexed(trimmed.data if trimmed else experience_data), indent=indent),
+        job_keywords=job_keywords.model_dump_json(indent=indent),
+        skill_gaps=skill_gaps.model_dump_json(indent=indent),
     )
-    adjusted = await provider.generate_structured(prompt, ExperienceData)
-    return _replace_em_dashes(adjusted)
+    patch = await provider.generate_structured(prompt, ResumePatch)
+    return apply_patch(experience_data, patch, trimmed)
+
+
+def _indexed(data: ExperienceData) -> dict:
+    """The parts of the resume a patch can change, with the indices it refers to them by."""
+    return {
+        "summary": data.summary,
+        "experience": [
+            {
+                "entry": entry_index,
+                "title": entry.title,
+                "company": entry.company,
+                "date": entry.date,
+                "bullets": [{"bullet": index, "text": bullet} for index, bullet in enumerate(entry.bullets)],
+            }
+            for entry_index, entry in enumerate(data.experience)
+        ],
+        "skills": data.skills.model_dump(),
+    }
+
+
+def apply_patch(original: ExperienceData, patch: ResumePatch, trimmed: TrimmedResume | None = None) -> ExperienceData:
+    """Apply ``patch`` to a copy of ``original``; raises PatchError if it does not fit.
+
+    Indices refer to what the model was shown: ``trimmed.data`` when the resume
+    was trimmed. Held-back bullets and entries keep their place after the
+    reordered ones, as with :func:`restore_trimmed`. Em dashes are replaced
+    only in the text the patch rewrites.
+    """
+    if trimmed is None:
+        entry_indices = list(range(len(original.experience)))
+        bullet_indices = {index: list(range(len(entry.bullets))) for index, entry in enumerate(original.experience)}
+    else:
+        entry_indices, bullet_indices = trimmed.entry_indices, trimmed.bullet_indices
+
+    def sent_bullets(entry: int) -> list[int]:
+        _check_index(entry, len(entry_indices), "entry")
+        return bullet_indices[entry_indices[entry]]
+
+    adjusted = original.model_copy(deep=True)
+    if patch.summary is not None:
+        if not patch.summary.strip():
+            raise PatchError("summary is empty")
+        adjusted.summary = replace_em_dash(patch.summary)
+
+    rewritten: set[tuple[int, int]] = set()
+    for rewrite in patch.bullet_rewrites:
+        sent = sent_bullets(rewrite.entry)
+        _check_index(rewrite.bullet, len(sent), f"bullet of entry {rewrite.entry}")
+        if (rewrite.entry, rewrite.bullet) in rewritten:
+            raise PatchError(f"bullet {rewrite.bullet} of entry {rewrite.entry} is rewritten twice")
+        if not rewrite.text.strip():
+            raise PatchError(f"bullet {rewrite.bullet} of entry {rewrite.entry} is rewritten as empty")
+        rewritten.add((rewrite.entry, rewrite.bullet))
+        adjusted.experience[entry_indices[rewrite.entry]].bullets[sent[rewrite.bullet]] = replace_em_dash(
+            rewrite.text
+        )
+
+    reordered: set[int] = set()
+    for order in patch.bullet_orders:
+        sent = sent_bullets(order.entry)
+        if order.entry in reordered:
+            raise PatchError(f"bullets of entry {order.entry} are reordered twice")
+        _check_permutation(order.order, len(sent), f"bullet order of entry {order.entry}")
+        reordered.add(order.entry)
+        entry = adjusted.experience[entry_indices[order.entry]]
+        sent_set = set(sent)
+        held_back = [bullet for index, bullet in enumerate(entry.bullets) if index not in sent_set]
+        entry.bullets = [entry.bullets[sent[index]] for index in order.order] + held_back
+
+    if patch.entry_order:
+        _check_permutation(patch.entry_order, len(entry_indices), "entry order")
+        ordered = [entry_indices[index] for index in patch.entry_order]
+        ordered_set = set(ordered)
+        ordered += [index for index in range(len(original.experience)) if index not in ordered_set]
+        adjusted.experience = [adjusted.experience[index] for index in ordered]
+
+    if patch.skills is not None:
+        for category, skills in patch.skills:
+            if sorted(skills) != sorted(getattr(original.skills, category)):
+                raise PatchError(f"skills in {category!r} were added or removed, not only reordered")
+        adjusted.skills = patch.skills.model_copy()
+    return adjusted
+
 
+def _check_index(index: int, size: int, what: str) -> None:
+    if not 0 <= index < size:
+        raise PatchError(f"{what} index {index} is out of range (0-{size - 1})")
 
-def _replace_em_dashes(data: ExperienceData) -> ExperienceData:
-    def replace(text: str) -> str:
-        return text.replace("—", "-")
 
-    data.summary = replace(data.summary)
-    for entry in data.experience:
-        entry.title = replace(entry.title)
-        entry.company = replace(entry.company)
-        entry.date = replace(entry.date)
-        entry.bullets = [replace(bullet) for bullet in entry.bullets]
-    return data
+def _check_permutation(order: list[int], size: int, what: str) -> None:
+    if sorted(order) != list(range(size)):
+        raise PatchError(f"{what} {order} does not list each of the {size} indices exactly once")
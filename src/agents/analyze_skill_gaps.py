@@ -1,18 +1,96 @@
+import logging
+
 from src.llm.provider import LLMProvider
+from src.matching.relevance import trim_to_budget
+from src.matching.skill_index import SkillIndex, normalize_skill
 from src.models.experience_data import ExperienceData
-from src.models.job_keywords import JobDescriptionKeywords
-from src.models.skill_gap import SkillGapAnalysis
+from src.models.job_keywords import JobDescriptionKeywords, SkillRequirement
+from src.models.skill_gap import SkillGap, SkillGapAnalysis
 from src.prompts.prompter import Prompter
 
+logger = logging.getLogger(__name__)
+
 
 async def analyze_skill_gaps(
     experience_data: ExperienceData,
     job_keywords: JobDescriptionKeywords,
     provider: LLMProvider,
+    skill_index: SkillIndex | None = None,
+    token_budget: int | None = None,
 ) -> SkillGapAnalysis:
-    """Identify gaps between a candidate's resume and job requirements."""
-    prompt = Prompter.load("analyze_skill_gaps").format(
-        experience_data=experience_data.model_dump_json(indent=2),
-        job_keywords=job_keywords.model_dump_json(indent=2),
+    """Identify gaps between a candidate's resume and job requirements.
+
+    With a ``skill_index``, clear hits and misses are decided locally and only the
+    uncertain skills are sent to the LLM. With a ``token_budget``, the resume in
+    the prompt is trimmed to its most job-relevant parts.
+    """
+    if skill_index is None:
+        return await _llm_skill_gaps(experience_data, job_keywords, provider, token_budget)
+
+    present: set[str] = set()
+    missing: list[SkillGap] = []
+    uncertain: list[SkillRequirement] = []
+    for requirement in job_keywords.skill_requirements:
+        deferred = []
+        for skill in requirement.skills:
+            match skill_index.classify(skill, requirement.category):
+                case "present":
+                    present.add(normalize_skill(skill))
+                case "missing":
+                    missing.append(_missing_gap(skill, requirement))
+                case "uncertain":
+                    deferred.append(skill)
+        if deferred:
+            uncertain.append(requirement.model_copy(update={"skills": deferred}))
+
+    logger.info(
+        "Local skill matching: %d present, %d missing, %d deferred to the LLM",
+        len(present),
+        len(missing),
+        sum(len(requirement.skills) for requirement in uncertain),
+    )
+    if not uncertain:
+        return SkillGapAnalysis(gaps=missing)
+
+    llm_analysis = await _llm_skill_gaps(
+        experience_data,
+        job_keywords.model_copy(update={"skill_requirements": uncertain}),
+        provider,
+        token_budget,
     )
+    decided = present | {normalize_skill(gap.skill) for gap in missing}
+    llm_gaps = [gap for gap in llm_analysis.gaps if normalize_skill(gap.skill) not in decided]
+    return SkillGapAnalysis(gaps=missing + llm_gaps)
+
+
+async def _llm_skill_gaps(
+    experience_data: ExperienceData,
+    job_keywords: JobDescriptionKeywords,
+    provider: LLMProvider,
+    token_budget: int | None,
+) -> SkillGapAnalysis:
+    if token_budget is None:
+        prompt = Prompter.render(
+            "analyze_skill_gaps",
+            experience_data=experience_data.model_dump_json(indent=2),
+            job_keywords=job_keywords.model_dump_json(indent=2),
+        )
+    else:
+        prompt = Prompter.render(
+            "analyze_skill_gaps",
+            experience_data=trim_to_budget(experience_data, job_keywords, token_budget).data.model_dump_json(),
+            job_keywords=job_keywords.model_dump_json(),
+        )
     return await provider.generate_structured(prompt, SkillGapAnalysis)
+
+
+def _missing_gap(skill: str, requirement: SkillRequirement) -> SkillGap:
+    return SkillGap(
+        skill=skill,
+        category=requirement.category,
+        importance=requirement.importance,
+        context=(
+            f"The posting lists {skill} as a {requirement.importance} {requirement.category} skill. "
+            f"It is missing: the resume names it in neither the skills section nor any experience bullet."
+        ),
+    )
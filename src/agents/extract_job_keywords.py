@@ -8,5 +8,5 @@ async def extract_job_keywords(
     provider: LLMProvider,
 ) -> JobDescriptionKeywords:
     """Extract structured keywords from a job description markdown string."""
-    prompt = Prompter.load("extract_job_keywords").format(markdown_content=markdown_content)
+    prompt = Prompter.render("extract_job_keywords", markdown_content=markdown_content)
     return await provider.generate_structured(prompt, JobDescriptionKeywords)
@@ -0,0 +1,16 @@
+from src.models.experience_data import ExperienceData
+
+
+def replace_em_dash(text: str) -> str:
+    return text.replace("—", "-")
+
+
+def replace_em_dashes(data: ExperienceData) -> ExperienceData:
+    """Swap em dashes for hyphens in every generated text field of a resume, in place."""
+    data.summary = replace_em_dash(data.summary)
+    for entry in data.experience:
+        entry.title = replace_em_dash(entry.title)
+        entry.company = replace_em_dash(entry.company)
+        entry.date = replace_em_dash(entry.date)
+        entry.bullets = [replace_em_dash(bullet) for bullet in entry.bullets]
+    return data
@@ -0,0 +1,21 @@
+from src.agents.postprocess import replace_em_dashes
+from src.llm.provider import LLMProvider
+from src.models.experience_data import ExperienceData
+from src.models.tailoring import TailoredResume
+from src.prompts.prompter import Prompter
+
+
+async def tailor_resume(
+    markdown_content: str,
+    experience_data: ExperienceData,
+    provider: LLMProvider,
+) -> TailoredResume:
+    """Extract keywords, analyze gaps and tailor the resume in a single model round trip."""
+    prompt = Prompter.render(
+        "tailor_resume",
+        markdown_content=markdown_content,
+        experience_data=experience_data.model_dump_json(indent=2),
+    )
+    tailored = await provider.generate_structured(prompt, TailoredResume)
+    tailored.adjusted_resume = replace_em_dashes(tailored.adjusted_resume)
+    return tailored
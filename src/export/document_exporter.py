@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, Dict
 
@@ -8,3 +10,16 @@ class DocumentExporter(ABC):
     def export(self, data: Dict[str, Any], output_path: Path) -> Path:
         """Export data to a document at output_path."""
         ...
+
+    async def export_async(self, data: Dict[str, Any], output_path: Path) -> Path:
+        """Export without blocking the event loop. Defaults to running ``export`` on a thread."""
+        return await asyncio.to_thread(self.export, data, output_path)
+
+    async def export_many(
+        self, jobs: Iterable[tuple[Dict[str, Any], Path]]
+    ) -> list[Path | BaseException]:
+        """Export every (data, output_path) pair concurrently; failures are returned in place."""
+        return await asyncio.gather(
+            *(self.export_async(data, output_path) for data, output_path in jobs),
+            return_exceptions=True,
+        )
@@ -5,6 +5,7 @@ from typing import Any, Dict
 
 from src.export.document_exporter import DocumentExporter
 from src.rendering.provider import TemplateRenderer
+from src.tracing.tracer import span
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +30,9 @@ class MarkdownToPDFExporter(DocumentExporter):
         output_path = Path(output_path)
         md_path = output_path.with_suffix(".md")
 
-        rendered = self._renderer.render(data)
-        md_path.write_text(rendered, encoding="utf-8")
+        with span("render"):
+            rendered = self._renderer.render(data)
+            md_path.write_text(rendered, encoding="utf-8")
         logger.info("Generated markdown: %s", md_path)
 
         cmd = [
@@ -46,7 +48,8 @@ class MarkdownToPDFExporter(DocumentExporter):
         ]
 
         logger.debug("Running: %s", " ".join(cmd))
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        with span("pdf", mode="cli"):
+            result = subprocess.run(cmd, capture_output=True, text=True)
 
         if result.returncode != 0:
             logger.error("STDOUT: %s", result.stdout)
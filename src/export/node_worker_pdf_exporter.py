@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Dict
+
+from src.export.markdown_to_pdf_exporter import MarkdownToPDFExporter
+from src.export.node_worker_pool import NodeWorkerPool
+from src.rendering.provider import TemplateRenderer
+from src.tracing.tracer import span
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("pdf_worker.mjs")
+
+
+class NodeWorkerPDFExporter(MarkdownToPDFExporter):
+    """Renders PDFs through persistent Node workers instead of one CLI process per resume.
+
+    The rendered markdown is sent to the worker in memory and styled with
+    md-resume's theme (``stylesheets``, or the .css files of the md-resume
+    package). The synchronous ``export`` still falls back to the one-shot CLI.
+    """
+
+    def __init__(
+        self,
+        renderer: TemplateRenderer,
+        cli_path: Path,
+        paper: str = "A4",
+        font_size: int = 12,
+        workers: int = 1,
+        job_timeout: float = 120.0,
+        worker_script: Path = WORKER_SCRIPT,
+        command: list[str] | None = None,
+        stylesheets: Iterable[Path] = (),
+    ) -> None:
+        super().__init__(renderer=renderer, cli_path=cli_path, paper=paper, font_size=font_size)
+        theme = [arg for stylesheet in stylesheets for arg in ("--stylesheet", str(stylesheet))]
+        self._pool = NodeWorkerPool(
+            command=command or ["node", str(worker_script), str(self._cli_path), *theme],
+            size=workers,
+            job_timeout=job_timeout,
+        )
+
+    async def start(self) -> None:
+        await self._pool.start()
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+    async def export_async(self, data: Dict[str, Any], output_path: Path) -> Path:
+        output_path = Path(output_path).resolve()
+        await asyncio.to_thread(output_path.parent.mkdir, parents=True, exist_ok=True)
+        with span("render"):
+            markdown = self._renderer.render(data)
+        with span("pdf", mode="worker"):
+            response = await self._pool.submit(
+                {
+                    "markdown": markdown,
+                    "output": str(output_path),
+                    "paper": self._paper,
+                    "fontSize": self._font_size,
+                }
+            )
+        if not response.get("ok"):
+            raise RuntimeError(f"PDF generation failed: {response.get('error', 'unknown error')}")
+        logger.info("Generated PDF: %s", output_path)
+        return output_path
+
+    async def export_many(
+        self, jobs: Iterable[tuple[Dict[str, Any], Path]]
+    ) -> list[Path | BaseException]:
+        await self._pool.start()
+        return await super().export_many(jobs)
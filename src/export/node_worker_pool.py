@@ -0,0 +1,161 @@
+import asyncio
+import itertools
+import json
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class _ProtocolError(Exception):
+    """A worker answered out of turn; its output can no longer be trusted."""
+
+
+class _NodeWorker:
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def request(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        self.process.stdin.write((json.dumps(payload) + "\n").encode("utf-8"))
+        await self.process.stdin.drain()
+        line = await asyncio.wait_for(self.process.stdout.readline(), timeout)
+        if not line:
+            raise EOFError("PDF worker closed its output")
+        response = json.loads(line)
+        if response.get("id") != payload["id"]:
+            raise _ProtocolError(f"PDF worker answered request {response.get('id')!r} instead of {payload['id']!r}")
+        return response
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        if self.alive:
+            self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout)
+            except TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+
+    async def kill(self) -> None:
+        if self.alive:
+            self.process.kill()
+        await self.process.wait()
+
+
+class NodeWorkerPool:
+    """Pool of long-lived renderer processes speaking a JSON-lines protocol.
+
+    Each worker prints ``{"ready": true}`` once warmed up, then answers every
+    request line ``{"id", ...}`` with ``{"id", "ok", "error"?}``. A worker that
+    crashes is replaced and the job retried once; a worker that exceeds the job
+    timeout is killed and replaced.
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        size: int = 1,
+        job_timeout: float = 120.0,
+        startup_timeout: float = 60.0,
+    ) -> None:
+        if size < 1:
+            raise ValueError("NodeWorkerPool needs at least one worker")
+        self._command = command
+        self._size = size
+        self._job_timeout = job_timeout
+        self._startup_timeout = startup_timeout
+        self._ids = itertools.count(1)
+        self._slots: asyncio.Queue[_NodeWorker | None] | None = None
+
+    async def __aenter__(self) -> "NodeWorkerPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._slots is not None:
+            return
+        self._slots = asyncio.Queue()
+        workers = await asyncio.gather(*(self._spawn() for _ in range(self._size)))
+        for worker in workers:
+            self._slots.put_nowait(worker)
+        logger.info("Started %d PDF worker(s): %s", self._size, " ".join(self._command))
+
+    async def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one job to an idle worker and return its response."""
+        if self._slots is None:
+            await self.start()
+        for attempt in (1, 2):
+            worker = await self._acquire()
+            request = {"id": next(self._ids), **payload}
+            try:
+                response = await worker.request(request, self._job_timeout)
+            except TimeoutError:
+                await self._discard(worker)
+                raise RuntimeError(f"PDF worker timed out after {self._job_timeout:.0f}s") from None
+            except (EOFError, ConnectionError, json.JSONDecodeError, _ProtocolError) as exc:
+                await self._discard(worker)
+                if attempt == 2:
+                    raise RuntimeError("PDF worker crashed twice while rendering") from exc
+                logger.warning("PDF worker crashed (%s); retrying on a fresh worker", exc)
+                continue
+            except asyncio.CancelledError:
+                await self._discard(worker)
+                raise
+            except Exception:
+                # E.g. a response line over the stream limit; the worker's output is out of step now.
+                await self._discard(worker)
+                raise
+            self._slots.put_nowait(worker)
+            return response
+        raise AssertionError("unreachable")
+
+    async def close(self) -> None:
+        slots = self._slots
+        self._slots = None
+        if slots is None:
+            return
+        workers = []
+        while not slots.empty():
+            worker = slots.get_nowait()
+            if worker is not None:
+                workers.append(worker)
+        await asyncio.gather(*(worker.stop() for worker in workers))
+        logger.info("Stopped PDF worker pool")
+
+    async def _acquire(self) -> _NodeWorker:
+        worker = await self._slots.get()
+        if worker is not None and worker.alive:
+            return worker
+        try:
+            return await self._spawn()
+        except BaseException:
+            self._slots.put_nowait(None)
+            raise
+
+    async def _discard(self, worker: _NodeWorker) -> None:
+        await worker.kill()
+        if self._slots is not None:
+            self._slots.put_nowait(None)
+
+    async def _spawn(self) -> _NodeWorker:
+        process = await asyncio.create_subprocess_exec(
+            *self._command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        worker = _NodeWorker(process)
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), self._startup_timeout)
+            if not line or not json.loads(line).get("ready"):
+                raise RuntimeError(f"PDF worker failed to start: {line!r}")
+        except BaseException:
+            await worker.kill()
+            raise
+        logger.debug("PDF worker pid=%s ready", process.pid)
+        return worker
@@ -0,0 +1,146 @@
+// Long-lived PDF renderer for NodeWorkerPDFExporter.
+//
+// Usage: node pdf_worker.mjs <path/to/md-resume.js> [--stylesheet <theme.css>]...
+//
+// Resolves the markdown and browser dependencies from the md-resume package,
+// launches one browser and then reads JSON-lines jobs from stdin:
+//   {"id": 1, "markdown": "...", "output": "/abs/resume.pdf", "paper": "A4", "fontSize": 12}
+// and answers each with {"id": 1, "ok": true} or {"id": 1, "ok": false, "error": "..."}.
+// A {"ready": true} line is printed once the browser is up.
+//
+// Pages are styled with md-resume's own theme: the stylesheets given with
+// --stylesheet, or else every .css file shipped in the md-resume package. The
+// iconify runtime is inlined from the package's dependencies, so rendering
+// never waits on a CDN.
+
+import { existsSync, readdirSync, readFileSync } from "node:fs";
+import { createRequire } from "node:module";
+import path from "node:path";
+import { createInterface } from "node:readline";
+
+const [cliPath, ...options] = process.argv.slice(2);
+if (!cliPath) {
+  console.error("usage: pdf_worker.mjs <md-resume.js> [--stylesheet <theme.css>]...");
+  process.exit(2);
+}
+const stylesheets = options.flatMap((option, i) => (options[i - 1] === "--stylesheet" ? [option] : []));
+
+const requireFromCli = createRequire(path.resolve(cliPath));
+const puppeteer = requireFromCli("puppeteer");
+const MarkdownIt = requireFromCli("markdown-it");
+
+// Icon data still comes from the iconify API; a page never waits longer than this for it.
+const ICON_TIMEOUT_MS = 3000;
+const FALLBACK_CSS = `
+  body { font-family: system-ui, sans-serif; line-height: 1.35; margin: 0; }
+  h1 { text-align: center; margin-bottom: 0.2em; }
+  h2 { border-bottom: 1px solid #444; margin-top: 1em; }
+  ul { margin: 0.2em 0 0.6em; }
+`;
+
+function packageRoot(start) {
+  let dir = path.dirname(path.resolve(start));
+  while (!existsSync(path.join(dir, "package.json"))) {
+    const parent = path.dirname(dir);
+    if (parent === dir) return path.dirname(path.resolve(start));
+    dir = parent;
+  }
+  return dir;
+}
+
+function cssFiles(dir) {
+  return readdirSync(dir, { withFileTypes: true })
+    .sort((a, b) => a.name.localeCompare(b.name))
+    .flatMap((entry) => {
+      const full = path.join(dir, entry.name);
+      if (entry.isDirectory()) return entry.name === "node_modules" || entry.name.startsWith(".") ? [] : cssFiles(full);
+      return entry.name.endsWith(".css") ? [full] : [];
+    });
+}
+
+function themeCss() {
+  const files = stylesheets.length ? stylesheets : cssFiles(packageRoot(cliPath));
+  if (!files.length) {
+    console.error("pdf_worker: no md-resume stylesheet found, using the fallback style");
+    return FALLBACK_CSS;
+  }
+  return files.map((file) => readFileSync(file, "utf8")).join("\n");
+}
+
+function iconifyScript() {
+  for (const name of ["@iconify/iconify", "@iconify/iconify/dist/iconify.min.js"]) {
+    try {
+      return readFileSync(requireFromCli.resolve(name), "utf8");
+    } catch {
+      // Try the next entry point.
+    }
+  }
+  console.error("pdf_worker: @iconify/iconify not found in the md-resume package, icons are not rendered");
+  return "";
+}
+
+const markdown = new MarkdownIt({ html: true, linkify: true });
+const css = themeCss();
+// Keep "</script>" inside the inlined library from closing the tag early.
+const iconify = iconifyScript().replaceAll("</script", "<\\/script");
+const browser = await puppeteer.launch({ headless: true });
+
+function send(message) {
+  process.stdout.write(JSON.stringify(message) + "\n");
+}
+
+function toHtml(source, fontSize) {
+  return `<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+${iconify ? `<script>${iconify}</script>` : ""}
+<style>${css}</style>
+<style>body { font-size: ${fontSize}px; }</style>
+</head>
+<body>${markdown.render(source)}</body>
+</html>`;
+}
+
+async function render(job) {
+  const page = await browser.newPage();
+  try {
+    await page.setContent(toHtml(job.markdown, job.fontSize ?? 12), { waitUntil: "load" });
+    if (iconify) {
+      // Iconify replaces each placeholder span with an inline SVG once the icon data arrives.
+      await page
+        .waitForFunction(() => !document.querySelector("span.iconify"), { timeout: ICON_TIMEOUT_MS })
+        .catch(() => {});
+    }
+    await page.pdf({
+      path: job.output,
+      format: job.paper ?? "A4",
+      printBackground: true,
+      margin: { top: "12mm", bottom: "12mm", left: "12mm", right: "12mm" },
+    });
+  } finally {
+    await page.close();
+  }
+}
+
+send({ ready: true });
+
+const lines = createInterface({ input: process.stdin, crlfDelay: Infinity });
+for await (const line of lines) {
+  if (!line.trim()) continue;
+  let job;
+  try {
+    job = JSON.parse(line);
+  } catch (err) {
+    send({ id: null, ok: false, error: `invalid job: ${err.message}` });
+    continue;
+  }
+  try {
+    await render(job);
+    send({ id: job.id, ok: true });
+  } catch (err) {
+    send({ id: job.id, ok: false, error: String(err?.stack ?? err) });
+  }
+}
+
+await browser.close();
@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+
+from src.job_description_data_extraction import create_markdown_converter
+
+logger = logging.getLogger(__name__)
+
+ConverterFactory = Callable[[], Callable[[str], str]]
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _worker_main(conn: Connection, converter_factory: ConverterFactory) -> None:
+    try:
+        convert = converter_factory()
+    except Exception as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}", _rss_bytes()))
+        conn.close()
+        return
+    conn.send(("ready", None, _rss_bytes()))
+    while True:
+        source = conn.recv()
+        if source is None:
+            break
+        try:
+            conn.send(("ok", convert(source), _rss_bytes()))
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}", _rss_bytes()))
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, process: BaseProcess, conn: Connection) -> None:
+        self.process = process
+        self.conn = conn
+        self.documents = 0
+        self.rss_bytes = 0
+
+    def request(self, source: str) -> tuple[str, str, int]:
+        self.conn.send(source)
+        return self.conn.recv()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class DoclingWorkerPool:
+    """Warm pool of Docling converters, one per worker process.
+
+    Each worker initializes its converter once and serves documents until it has
+    converted ``max_documents_per_worker`` documents or its RSS passes
+    ``max_rss_mb``; it is then replaced by a fresh process. A replacement that
+    fails to start is retried with backoff; if it still fails, the slot is
+    respawned by the next ``convert``, which raises when that fails too.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_documents_per_worker: int | None = 50,
+        max_rss_mb: int | None = None,
+        converter_factory: ConverterFactory = create_markdown_converter,
+        start_method: str = "spawn",
+        respawn_attempts: int = 3,
+        respawn_backoff_s: float = 1.0,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("DoclingWorkerPool needs at least one worker")
+        self._size = workers
+        self._max_documents = max_documents_per_worker
+        self._max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self._converter_factory = converter_factory
+        self._context = multiprocessing.get_context(start_method)
+        self._respawn_attempts = max(respawn_attempts, 1)
+        self._respawn_backoff_s = respawn_backoff_s
+        # None marks a slot whose worker could not be restarted.
+        self._idle: asyncio.Queue[_Worker | None] | None = None
+        self._workers: set[_Worker] = set()
+        self._background: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> "DoclingWorkerPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._idle is not None:
+            return
+        self._idle = asyncio.Queue()
+        workers = await asyncio.gather(*(asyncio.to_thread(self._spawn) for _ in range(self._size)))
+        for worker in workers:
+            self._idle.put_nowait(worker)
+        logger.info("Docling worker pool started with %d worker(s)", self._size)
+
+    async def convert(self, source: str) -> str:
+        if self._idle is None:
+            await self.start()
+        worker = await self._idle.get()
+        if worker is None:
+            worker = await self._respawn_slot()
+        try:
+            status, payload, rss_bytes = await asyncio.to_thread(worker.request, source)
+        except (EOFError, OSError) as exc:
+            self._replace(worker)
+            raise RuntimeError(f"Docling worker died while converting {source}") from exc
+        except asyncio.CancelledError:
+            self._replace(worker)
+            raise
+
+        worker.documents += 1
+        worker.rss_bytes = rss_bytes
+        if self._should_recycle(worker):
+            self._replace(worker)
+        else:
+            self._idle.put_nowait(worker)
+
+        if status != "ok":
+            raise RuntimeError(f"Docling failed to convert {source}: {payload}")
+        return payload
+
+    async def convert_many(self, sources: Iterable[str]) -> list[str | BaseException]:
+        """Convert all sources concurrently; failures are returned in place of markdown."""
+        return await asyncio.gather(*(self.convert(source) for source in sources), return_exceptions=True)
+
+    async def close(self) -> None:
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        workers = list(self._workers)
+        self._workers.clear()
+        self._idle = None
+        await asyncio.gather(*(asyncio.to_thread(worker.stop) for worker in workers))
+        logger.info("Docling worker pool stopped")
+
+    async def _respawn_slot(self) -> _Worker:
+        try:
+            return await asyncio.to_thread(self._spawn)
+        except BaseException as exc:
+            if self._idle is not None:
+                self._idle.put_nowait(None)
+            if isinstance(exc, Exception):
+                raise RuntimeError("No Docling worker available: restarting one failed") from exc
+            raise
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._converter_factory),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        try:
+            status, payload, rss_bytes = parent_conn.recv()
+        except (EOFError, OSError) as exc:
+            parent_conn.close()
+            process.join()
+            raise RuntimeError(f"Docling worker failed to start (exit code {process.exitcode})") from exc
+        if status != "ready":
+            parent_conn.close()
+            process.terminate()
+            process.join()
+            raise RuntimeError(f"Docling worker failed to start: {payload}")
+        worker = _Worker(process, parent_conn)
+        worker.rss_bytes = rss_bytes
+        self._workers.add(worker)
+        logger.debug("Started Docling worker pid=%s", process.pid)
+        return worker
+
+    def _should_recycle(self, worker: _Worker) -> bool:
+        if self._max_documents is not None and worker.documents >= self._max_documents:
+            return True
+        return self._max_rss_bytes is not None and worker.rss_bytes >= self._max_rss_bytes
+
+    def _replace(self, worker: _Worker) -> None:
+        self._workers.discard(worker)
+        logger.info(
+            "Recycling Docling worker pid=%s after %d document(s), rss=%.0f MB",
+            worker.process.pid,
+            worker.documents,
+            worker.rss_bytes / (1024 * 1024),
+        )
+        task = asyncio.create_task(self._recycle(worker))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _recycle(self, worker: _Worker) -> None:
+        await asyncio.to_thread(worker.stop)
+        replacement = None
+        for attempt in range(self._respawn_attempts):
+            if self._idle is None:
+                return
+            if attempt:
+                await asyncio.sleep(self._respawn_backoff_s * 2 ** (attempt - 1))
+            try:
+                replacement = await asyncio.to_thread(self._spawn)
+                break
+            except Exception:
+                logger.warning("Failed to start a replacement Docling worker (attempt %d)", attempt + 1, exc_info=True)
+        if self._idle is None:
+            if replacement is not None:
+                self._workers.discard(replacement)
+                await asyncio.to_thread(replacement.stop)
+            return
+        if replacement is None:
+            logger.error("Giving up on a Docling worker after %d attempt(s)", self._respawn_attempts)
+        self._idle.put_nowait(replacement)
@@ -0,0 +1,437 @@
+import html
+import json
+import logging
+import re
+import urllib.request
+from collections.abc import Callable, Iterator
+from functools import partial
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from src.extraction.provider import ExtractionError, MarkdownExtractor
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (compatible; resume-tailor/1.0)"
+
+_DOCUMENT_SUFFIXES = {".pdf", ".doc", ".docx", ".odt", ".rtf", ".pptx"}
+_HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml"}
+_SKIP_TAGS = {
+    "script", "style", "noscript", "template", "svg", "nav", "header", "footer",
+    "aside", "form", "button", "iframe", "select", "dialog", "head",
+}
+_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr",
+}
+_PARAGRAPH_TAGS = {
+    "p", "div", "section", "article", "main", "blockquote", "table", "figure", "dl", "dt", "dd", "details",
+}
+_HEADINGS = {f"h{level}": level for level in range(1, 7)}
+# Start tags that implicitly close an open element, as HTML allows for </p>, </li>, </td>, ...:
+# tag -> (open tags it closes, tags bounding the search for them).
+_P_CLOSERS = {
+    "p", "div", "section", "article", "main", "aside", "nav", "header", "footer", "ul", "ol", "dl", "table",
+    "pre", "blockquote", "figure", "form", "details", "hr", *_HEADINGS,
+}
+_IMPLIED_END: dict[str, tuple[set[str], set[str]]] = {
+    **{tag: ({"p"}, {"button", "li", "td", "th", "table", "caption"}) for tag in _P_CLOSERS},
+    "li": ({"li"}, {"ul", "ol"}),
+    "dt": ({"dt", "dd"}, {"dl"}),
+    "dd": ({"dt", "dd"}, {"dl"}),
+    "td": ({"td", "th"}, {"tr", "table"}),
+    "th": ({"td", "th"}, {"tr", "table"}),
+    "tr": ({"tr"}, {"table", "thead", "tbody", "tfoot"}),
+    "option": ({"option"}, {"select", "datalist", "optgroup"}),
+    "optgroup": ({"optgroup", "option"}, {"select"}),
+}
+_CONTENT_HINT_RE = re.compile(r"job[-_]?(post|description|details|content|body)|posting|description", re.I)
+_SPACES_RE = re.compile(r"[ \t\r\f\v\xa0]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_WORD_RE = re.compile(r"\w+")
+
+
+class _Element:
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag: str, attrs: dict[str, str], parent: "_Element | None") -> None:
+        self.tag = tag
+        self.attrs = attrs
+        self.children: list[_Element | str] = []
+        self.parent = parent
+
+    def iter(self) -> Iterator["_Element"]:
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed([child for child in element.children if isinstance(child, _Element)]))
+
+    def text(self) -> str:
+        parts: list[str] = []
+        stack: list[_Element | str] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            else:
+                stack.extend(reversed(node.children))
+        return "".join(parts)
+
+
+class _TreeBuilder(HTMLParser):
+    """Tolerant DOM builder: unknown end tags are ignored, unclosed elements close with their parent.
+
+    Elements whose end tag HTML lets authors omit (``p``, ``li``, ``td``, ...) are
+    closed by the next sibling's start tag rather than swallowing it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = _Element("#document", {}, None)
+        self._current = self.root
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _IMPLIED_END:
+            self._close_implied(*_IMPLIED_END[tag])
+        element = _Element(tag, {name: value or "" for name, value in attrs}, self._current)
+        self._current.children.append(element)
+        if tag not in _VOID_TAGS:
+            self._current = element
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._current.children.append(_Element(tag, {name: value or "" for name, value in attrs}, self._current))
+
+    def handle_endtag(self, tag: str) -> None:
+        element = self._current
+        while element.parent is not None and element.tag != tag:
+            element = element.parent
+        if element.parent is not None:
+            self._current = element.parent
+
+    def handle_data(self, data: str) -> None:
+        self._current.children.append(data)
+
+    def _close_implied(self, closes: set[str], boundaries: set[str]) -> None:
+        element = self._current
+        while element.parent is not None and element.tag not in boundaries:
+            if element.tag in closes:
+                self._current = element.parent
+                return
+            element = element.parent
+
+
+def _parse(markup: str) -> _Element:
+    builder = _TreeBuilder()
+    builder.feed(markup)
+    builder.close()
+    return builder.root
+
+
+def _find(root: _Element, tag: str) -> _Element | None:
+    return next((element for element in root.iter() if element.tag == tag), None)
+
+
+class _Measure:
+    """Visible and link word counts per element, computed once bottom-up."""
+
+    def __init__(self, root: _Element) -> None:
+        self._counts: dict[int, tuple[int, int]] = {}
+        self._measure(root)
+
+    def words(self, element: _Element) -> int:
+        return self._counts[id(element)][0]
+
+    def link_ratio(self, element: _Element) -> float:
+        words, link_words = self._counts[id(element)]
+        return link_words / words if words else 0.0
+
+    def _measure(self, root: _Element) -> None:
+        # Post-order walk with an explicit stack: each element is visited again once its children are counted.
+        stack = [(root, False, False)]
+        while stack:
+            element, in_link, children_done = stack.pop()
+            if element.tag in _SKIP_TAGS:
+                self._counts[id(element)] = (0, 0)
+                continue
+            in_link = in_link or element.tag == "a"
+            if not children_done:
+                stack.append((element, in_link, True))
+                stack.extend((child, in_link, False) for child in element.children if isinstance(child, _Element))
+                continue
+            words = link_words = 0
+            for child in element.children:
+                if isinstance(child, str):
+                    count = len(_WORD_RE.findall(child))
+                    words += count
+                    link_words += count if in_link else 0
+                else:
+                    child_words, child_link_words = self._counts[id(child)]
+                    words += child_words
+                    link_words += child_link_words
+            self._counts[id(element)] = (words, link_words)
+
+
+def _content_root(body: _Element, measure: _Measure) -> _Element:
+    """The element most likely holding the posting: a hinted container unless it misses most of the text."""
+    candidates = [
+        element
+        for element in body.iter()
+        if element.tag in ("main", "article")
+        or element.attrs.get("role") == "main"
+        or _CONTENT_HINT_RE.search(f"{element.attrs.get('id', '')} {element.attrs.get('class', '')}")
+    ]
+    if not candidates:
+        return body
+    best = max(candidates, key=measure.words)
+    return best if measure.words(best) >= measure.words(body) / 4 else body
+
+
+class _Emit:
+    """Deferred output: appends ``format(parts)`` to ``out`` once an element's children are rendered."""
+
+    __slots__ = ("out", "format", "parts")
+
+    def __init__(self, out: list[str], format: Callable[[list[Any]], str], parts: list[Any]) -> None:
+        self.out = out
+        self.format = format
+        self.parts = parts
+
+    def __call__(self) -> None:
+        self.out.append(self.format(self.parts))
+
+
+def _squash(parts: list[str]) -> str:
+    return _SPACES_RE.sub(" ", "".join(parts).replace("\n", " ")).strip()
+
+
+def _heading(level: int, parts: list[str]) -> str:
+    return f"\n\n{'#' * level} {_squash(parts)}\n\n"
+
+
+def _list_item(marker: str, parts: list[str]) -> str:
+    return f"\n{marker} {''.join(parts).lstrip()}"
+
+
+def _table_row(cells: list[list[str]]) -> str:
+    return "\n" + " | ".join(_squash(cell) for cell in cells)
+
+
+def _emphasis(marker: str, parts: list[str]) -> str:
+    text = _squash(parts)
+    return f"{marker}{text}{marker}" if text else ""
+
+
+def _blank_line(_: list[str]) -> str:
+    return "\n\n"
+
+
+def _render(root: _Element, out: list[str]) -> None:
+    """Append the markdown for ``root`` to ``out``.
+
+    Walks with an explicit stack so deeply nested pages cannot exhaust the
+    interpreter's recursion limit.
+    """
+    stack: list[tuple[_Element | str, list[str], tuple[str, ...]] | _Emit] = [(root, out, ())]
+
+    def children(element: _Element, into: list[str], lists: tuple[str, ...]) -> None:
+        stack.extend((child, into, lists) for child in reversed(element.children))
+
+    while stack:
+        item = stack.pop()
+        if isinstance(item, _Emit):
+            item()
+            continue
+        node, into, lists = item
+        if isinstance(node, str):
+            into.append(_SPACES_RE.sub(" ", node.replace("\n", " ")))
+            continue
+        tag = node.tag
+        if tag in _SKIP_TAGS:
+            continue
+        if tag in _HEADINGS:
+            parts: list[str] = []
+            stack.append(_Emit(into, partial(_heading, _HEADINGS[tag]), parts))
+            children(node, parts, ())
+        elif tag in ("ul", "ol"):
+            stack.append(_Emit(into, _blank_line, []))
+            children(node, into, (*lists, "1." if tag == "ol" else "-"))
+        elif tag == "li":
+            parts = []
+            marker = lists[-1] if lists else "-"
+            stack.append(_Emit(into, partial(_list_item, marker), parts))
+            children(node, parts, lists)
+        elif tag == "tr":
+            cells = [child for child in node.children if isinstance(child, _Element) and child.tag in ("td", "th")]
+            rendered: list[list[str]] = [[] for _ in cells]
+            stack.append(_Emit(into, _table_row, rendered))
+            for cell, parts in zip(cells, rendered):
+                children(cell, parts, ())
+        elif tag == "pre":
+            into.append(f"\n\n```\n{node.text().strip(chr(10))}\n```\n\n")
+        elif tag == "br":
+            into.append("\n")
+        elif tag == "hr":
+            into.append("\n\n---\n\n")
+        elif tag in ("strong", "b", "em", "i"):
+            parts = []
+            marker = "**" if tag in ("strong", "b") else "*"
+            stack.append(_Emit(into, partial(_emphasis, marker), parts))
+            children(node, parts, ())
+        elif tag in _PARAGRAPH_TAGS:
+            into.append("\n\n")
+            stack.append(_Emit(into, _blank_line, []))
+            children(node, into, lists)
+        else:
+            children(node, into, lists)
+
+
+def _to_markdown(element: _Element) -> str:
+    out: list[str] = []
+    _render(element, out)
+    lines = (_SPACES_RE.sub(" ", line).strip() for line in "".join(out).split("\n"))
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(lines)).strip()
+
+
+def _job_posting(root: _Element) -> dict[str, Any] | None:
+    """schema.org JobPosting from JSON-LD, which most job boards embed for search engines."""
+    for script in root.iter():
+        if script.tag != "script" or script.attrs.get("type", "").lower() != "application/ld+json":
+            continue
+        try:
+            stack = [json.loads(script.text())]
+        except ValueError:
+            continue
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                types = item.get("@type")
+                if "JobPosting" in (types if isinstance(types, list) else [types]) and isinstance(
+                    item.get("description"), str
+                ):
+                    return item
+                stack.extend(value for key, value in item.items() if key == "@graph")
+    return None
+
+
+def _posting_markdown(posting: dict[str, Any]) -> str:
+    description = posting["description"]
+    if "<" not in description and "&lt;" in description:
+        description = html.unescape(description)
+    lines = [f"# {html.unescape(str(posting.get('title', ''))).strip()}"] if posting.get("title") else []
+    organization = posting.get("hiringOrganization")
+    if isinstance(organization, dict) and organization.get("name"):
+        lines.append(f"**Company:** {organization['name']}")
+    locations = posting.get("jobLocation")
+    for location in locations if isinstance(locations, list) else [locations]:
+        address = location.get("address") if isinstance(location, dict) else None
+        if isinstance(address, dict):
+            parts = [address.get(key) for key in ("addressLocality", "addressRegion", "addressCountry")]
+            place = ", ".join(str(part) for part in parts if isinstance(part, str) and part)
+            if place:
+                lines.append(f"**Location:** {place}")
+    if posting.get("employmentType"):
+        employment = posting["employmentType"]
+        lines.append(f"**Employment type:** {', '.join(employment) if isinstance(employment, list) else employment}")
+    return "\n\n".join([*lines, _to_markdown(_parse(description))]).strip()
+
+
+class HTMLMarkdownExtractor(MarkdownExtractor):
+    """Stdlib-only HTML to markdown for job board pages.
+
+    Uses the page's schema.org ``JobPosting`` description when present, otherwise
+    the main content container. Raises ``ExtractionError`` for documents (PDF,
+    DOCX, ...), non-HTML responses and pages failing the quality checks (too few
+    words or mostly links, typical of JavaScript shells and login walls) so the
+    caller can fall back to Docling.
+    """
+
+    name = "html"
+    version = "2"
+
+    def __init__(
+        self,
+        min_words: int = 120,
+        max_link_ratio: float = 0.5,
+        timeout: float = 20.0,
+        max_bytes: int = 5 * 1024 * 1024,
+    ) -> None:
+        self._min_words = min_words
+        self._max_link_ratio = max_link_ratio
+        self._timeout = timeout
+        self._max_bytes = max_bytes
+
+    def extract(self, source: str) -> str:
+        return self.convert(self._fetch(source))
+
+    def convert(self, markup: str) -> str:
+        try:
+            return self._convert(markup)
+        except ExtractionError:
+            raise
+        except Exception as exc:
+            # Docling can still handle pages this parser chokes on.
+            raise ExtractionError(f"could not parse page: {type(exc).__name__}: {exc}") from exc
+
+    def _convert(self, markup: str) -> str:
+        root = _parse(markup)
+        posting = _job_posting(root)
+        if posting is not None:
+            markdown = _posting_markdown(posting)
+            if self.quality_problem(markdown) is None:
+                return markdown
+
+        body = _find(root, "body") or root
+        measure = _Measure(root)
+        content = _content_root(body, measure)
+        markdown = _to_markdown(content)
+        problem = self.quality_problem(markdown, measure.link_ratio(content))
+        if problem is not None:
+            raise ExtractionError(problem)
+        title = _find(root, "title")
+        if not markdown.startswith("#") and title is not None and title.text().strip():
+            markdown = f"# {_SPACES_RE.sub(' ', title.text()).strip()}\n\n{markdown}"
+        return markdown
+
+    def quality_problem(self, markdown: str, link_ratio: float = 0.0) -> str | None:
+        """Why the markdown is unusable as a job description, or None when it looks fine."""
+        words = len(_WORD_RE.findall(markdown))
+        if words < self._min_words:
+            return f"only {words} words of content"
+        if link_ratio > self._max_link_ratio:
+            return f"{link_ratio:.0%} of the text is links"
+        return None
+
+    def _fetch(self, source: str) -> str:
+        parts = urlsplit(source)
+        suffix = Path(parts.path).suffix.lower()
+        if suffix in _DOCUMENT_SUFFIXES:
+            raise ExtractionError(f"{suffix} documents are converted with Docling")
+        if parts.scheme not in ("http", "https"):
+            path = Path(source)
+            if suffix not in (".html", ".htm") or not path.is_file():
+                raise ExtractionError("not an HTML page")
+            return path.read_text(encoding="utf-8", errors="replace")
+
+        request = urllib.request.Request(
+            source,
+            headers={"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.5"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                content_type = response.headers.get_content_type()
+                if content_type not in _HTML_CONTENT_TYPES:
+                    raise ExtractionError(f"unsupported content type {content_type}")
+                body = response.read(self._max_bytes + 1)
+                charset = response.headers.get_content_charset() or "utf-8"
+        except OSError as exc:
+            raise ExtractionError(f"fetch failed: {exc}") from exc
+        if len(body) > self._max_bytes:
+            raise ExtractionError("page is larger than the fast path handles")
+        try:
+            return body.decode(charset, errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
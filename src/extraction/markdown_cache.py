@@ -0,0 +1,242 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid"}
+
+
+class CacheEntry(BaseModel):
+    url: str
+    converter_version: str
+    created_at: float
+    conversion_seconds: float = 0.0
+    size_bytes: int
+
+
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_served: int = 0
+    bytes_stored: int = 0
+    conversion_seconds_saved: float = 0.0
+
+    def merged(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            **{name: getattr(self, name) + getattr(other, name) for name in CacheStats.model_fields}
+        )
+
+
+Revalidator = Callable[[str, CacheEntry], bool]
+"""Called for an expired entry; returning True marks it fresh again."""
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings share a cache entry."""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def http_not_modified_revalidator(url: str, entry: CacheEntry, timeout: float = 10.0) -> bool:
+    """Conditional HEAD request; a 304 response means the cached conversion is still valid."""
+    request = urllib.request.Request(
+        url,
+        method="HEAD",
+        headers={"If-Modified-Since": formatdate(entry.created_at, usegmt=True)},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout):
+            return False
+    except urllib.error.HTTPError as exc:
+        return exc.code == 304
+    except OSError:
+        logger.debug("Revalidation request failed for %s", url, exc_info=True)
+        return False
+
+
+class MarkdownCache:
+    """Content-addressed on-disk cache of converted job descriptions.
+
+    Entries are keyed by normalized URL plus converter version, expire after
+    ``ttl_seconds`` (unless ``revalidate`` confirms them) and are evicted least
+    recently used first once the cache grows past ``max_bytes``.
+    """
+
+    _STATS_FILE = "stats.json"
+
+    def __init__(
+        self,
+        directory: Path,
+        converter_version: str,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        revalidate: Revalidator | None = None,
+    ) -> None:
+        self._dir = Path(directory)
+        self._entries_dir = self._dir / "entries"
+        self._entries_dir.mkdir(parents=True, exist_ok=True)
+        self._converter_version = converter_version
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._revalidate = revalidate
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._index = self._load_index()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters for this process only; see ``lifetime_stats`` for the persisted totals."""
+        return self._stats.model_copy()
+
+    def lifetime_stats(self) -> CacheStats:
+        return self._read_persisted_stats().merged(self._stats)
+
+    def key(self, url: str) -> str:
+        payload = f"{normalize_url(url)}\n{self._converter_version}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> str | None:
+        key = self.key(url)
+        with self._lock:
+            entry = self._read_entry(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+        if self._is_expired(entry) and not self._try_revalidate(key, url, entry):
+            with self._lock:
+                self._stats.expired += 1
+                self._stats.misses += 1
+                self._remove(key)
+            return None
+        with self._lock:
+            try:
+                markdown = self._markdown_path(key).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                self._stats.misses += 1
+                self._index.pop(key, None)
+                return None
+            self._touch(key)
+            self._stats.hits += 1
+            self._stats.bytes_served += entry.size_bytes
+            self._stats.conversion_seconds_saved += entry.conversion_seconds
+        return markdown
+
+    def put(self, url: str, markdown: str, conversion_seconds: float = 0.0) -> None:
+        key = self.key(url)
+        data = markdown.encode("utf-8")
+        entry = CacheEntry(
+            url=normalize_url(url),
+            converter_version=self._converter_version,
+            created_at=time.time(),
+            conversion_seconds=conversion_seconds,
+            size_bytes=len(data),
+        )
+        with self._lock:
+            markdown_path = self._markdown_path(key)
+            markdown_path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(markdown_path, data)
+            _atomic_write(self._meta_path(key), entry.model_dump_json().encode("utf-8"))
+            self._index[key] = (time.time(), entry.size_bytes)
+            self._stats.stores += 1
+            self._stats.bytes_stored += entry.size_bytes
+            self._evict()
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return sum(size for _, size in self._index.values())
+
+    def save_stats(self) -> CacheStats:
+        """Fold this session's counters into the persisted totals and reset them."""
+        with self._lock:
+            totals = self._read_persisted_stats().merged(self._stats)
+            _atomic_write(self._dir / self._STATS_FILE, totals.model_dump_json(indent=2).encode("utf-8"))
+            self._stats = CacheStats()
+        return totals
+
+    def _load_index(self) -> dict[str, tuple[float, int]]:
+        index: dict[str, tuple[float, int]] = {}
+        for markdown_path in self._entries_dir.glob("*/*.md"):
+            stat = markdown_path.stat()
+            index[markdown_path.stem] = (stat.st_mtime, stat.st_size)
+        return index
+
+    def _read_entry(self, key: str) -> CacheEntry | None:
+        if key not in self._index:
+            return None
+        try:
+            return CacheEntry.model_validate_json(self._meta_path(key).read_bytes())
+        except (FileNotFoundError, ValueError):
+            self._remove(key)
+            return None
+
+    def _is_expired(self, entry: CacheEntry) -> bool:
+        return self._ttl_seconds is not None and time.time() - entry.created_at > self._ttl_seconds
+
+    def _try_revalidate(self, key: str, url: str, entry: CacheEntry) -> bool:
+        if self._revalidate is None or not self._revalidate(url, entry):
+            return False
+        refreshed = entry.model_copy(update={"created_at": time.time()})
+        with self._lock:
+            _atomic_write(self._meta_path(key), refreshed.model_dump_json().encode("utf-8"))
+            self._stats.revalidated += 1
+        return True
+
+    def _touch(self, key: str) -> None:
+        now = time.time()
+        os.utime(self._markdown_path(key), (now, now))
+        self._index[key] = (now, self._index[key][1])
+
+    def _evict(self) -> None:
+        if self._max_bytes is None:
+            return
+        total = sum(size for _, size in self._index.values())
+        for key, (_, size) in sorted(self._index.items(), key=lambda item: item[1][0]):
+            if total <= self._max_bytes:
+                break
+            self._remove(key)
+            total -= size
+            self._stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._index.pop(key, None)
+        self._markdown_path(key).unlink(missing_ok=True)
+        self._meta_path(key).unlink(missing_ok=True)
+
+    def _read_persisted_stats(self) -> CacheStats:
+        path = self._dir / self._STATS_FILE
+        if not path.exists():
+            return CacheStats()
+        return CacheStats.model_validate_json(path.read_bytes())
+
+    def _markdown_path(self, key: str) -> Path:
+        return self._entries_dir / key[:2] / f"{key}.md"
+
+    def _meta_path(self, key: str) -> Path:
+        return self._entries_dir / key[:2] / f"{key}.json"
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
@@ -0,0 +1,210 @@
+import re
+from collections import defaultdict
+
+from pydantic import BaseModel
+
+from src.llm.tokens import CHARS_PER_TOKEN, estimate_tokens
+
+# Bump when the heuristics change so stored cleaned descriptions are regenerated.
+CLEANER_VERSION = "3"
+
+_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)|<!--\s*image\s*-->", re.IGNORECASE)
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_WORD_RE = re.compile(r"\w+")
+_LIST_ITEM_RE = re.compile(r"^\s*([-*+]|\d+\.)\s")
+_BOILERPLATE_RE = re.compile(
+    r"cookie|accept all|privacy (policy|settings)|terms of (use|service)|all rights reserved|©|copyright"
+    r"|sign (in|up)|log ?in|create an? (account|job alert)|subscribe|newsletter|share (this|on)"
+    r"|skip to (main )?content|back to (jobs|search|top)|apply (now|for this job)|report (this )?job",
+    re.IGNORECASE,
+)
+_OFF_TOPIC_SECTION_RE = re.compile(
+    r"similar (jobs|offers|positions|roles)|related (jobs|offers|positions)|recommended (jobs|for you)"
+    r"|you (may|might) also like|more jobs|other (jobs|offers|openings)|people also viewed|latest jobs",
+    re.IGNORECASE,
+)
+# Blocks with at least this many words are treated as posting prose.
+_SUBSTANTIAL_WORDS = 20
+# Short prose blocks matching boilerplate phrases are dropped outside the posting, or anywhere when the
+# phrases make up at least this share of their words; longer ones and lists may be part of the posting.
+_BOILERPLATE_MAX_WORDS = 40
+_BOILERPLATE_DOMINANT_RATIO = 0.5
+_MAX_LINK_RATIO = 0.5
+
+
+class CleanedMarkdown(BaseModel):
+    markdown: str
+    tokens_before: int
+    tokens_after: int
+    blocks_dropped: int = 0
+    truncated: bool = False
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+def _words(text: str) -> int:
+    return len(_WORD_RE.findall(text))
+
+
+def _link_ratio(block: str) -> float:
+    words = _words(_LINK_RE.sub(r"\1", block))
+    link_words = sum(_words(match.group(1)) for match in _LINK_RE.finditer(block))
+    return link_words / words if words else 0.0
+
+
+def _heading_level(block: str) -> int | None:
+    match = _HEADING_RE.match(block)
+    return len(match.group(1)) if match and "\n" not in block else None
+
+
+def _normalized(block: str) -> str:
+    return " ".join(_WORD_RE.findall(_LINK_RE.sub(r"\1", block).lower()))
+
+
+def _is_noise(block: str) -> bool:
+    if not _IMAGE_RE.sub("", block).strip():
+        return True
+    return _LINK_RE.search(block) is not None and _link_ratio(block) > _MAX_LINK_RATIO
+
+
+def _boilerplate_share(block: str) -> float | None:
+    """Share of a short prose block's words taken by boilerplate phrases; None if it is not a candidate.
+
+    Lists are never candidates: requirement bullets mention logins, sign-ups and newsletters too.
+    """
+    if _LIST_ITEM_RE.match(block) or _heading_level(block) is not None:
+        return None
+    text = _LINK_RE.sub(r"\1", block)
+    words = _words(text)
+    matches = list(_BOILERPLATE_RE.finditer(text))
+    if not matches or words > _BOILERPLATE_MAX_WORDS:
+        return None
+    return sum(_words(match.group(0)) for match in matches) / words if words else 1.0
+
+
+def _drop_list_link_lines(block: str) -> str:
+    """Remove list items that are nothing but a link, as in menus embedded in a list."""
+    lines = [
+        line
+        for line in block.split("\n")
+        if not (_LIST_ITEM_RE.match(line) and _link_ratio(line) > _MAX_LINK_RATIO)
+    ]
+    return "\n".join(lines).strip()
+
+
+def _posting_span(blocks: list[str], boilerplate: set[int]) -> tuple[int, int]:
+    """Block range of the posting body: from the header lines above the first prose block to the end.
+
+    Blocks in ``boilerplate`` neither start the body nor extend it at either end.
+    """
+    substantial = [
+        i for i, block in enumerate(blocks) if i not in boilerplate and _words(block) >= _SUBSTANTIAL_WORDS
+    ]
+    if not substantial:
+        return 0, len(blocks)
+    start = substantial[0]
+    # Keep the title, company, location, salary and other short header lines directly above the body.
+    while start > 0 and start - 1 not in boilerplate and (
+        _heading_level(blocks[start - 1]) is not None or _words(blocks[start - 1]) < _SUBSTANTIAL_WORDS
+    ):
+        start -= 1
+    # Chrome after the posting was dropped block by block above; only dangling headings and footers remain.
+    end = len(blocks)
+    while end - 1 > substantial[-1] and (_heading_level(blocks[end - 1]) is not None or end - 1 in boilerplate):
+        end -= 1
+    return start, end
+
+
+def _truncate(blocks: list[str], token_budget: int) -> tuple[list[str], bool]:
+    kept: list[str] = []
+    used = 0
+    for block in blocks:
+        cost = estimate_tokens(block) + 1
+        if used + cost > token_budget:
+            if not kept:
+                kept.append(block[: token_budget * CHARS_PER_TOKEN].rstrip())
+            return kept, True
+        kept.append(block)
+        used += cost
+    return kept, False
+
+
+def clean_job_markdown(markdown: str, token_budget: int | None = None) -> CleanedMarkdown:
+    """Strip job-board chrome from extracted markdown before it is sent to the LLM.
+
+    Drops image placeholders, link-heavy and boilerplate blocks (navigation,
+    cookie banners, share and apply buttons), off-topic sections such as
+    "Similar jobs" and repeated blocks, keeps the span around the posting's
+    prose and, when ``token_budget`` is set, truncates at a block boundary.
+    """
+    blocks = [block.strip() for block in re.split(r"\n\s*\n", markdown.strip()) if block.strip()]
+    kept: list[str] = []
+    boilerplate: set[int] = set()
+    seen: set[str] = set()
+    skip_below: int | None = None
+    for block in blocks:
+        level = _heading_level(block)
+        if skip_below is not None:
+            if level is None or level > skip_below:
+                continue
+            skip_below = None
+        if level is not None and _OFF_TOPIC_SECTION_RE.search(block):
+            skip_below = level
+            continue
+        block = _drop_list_link_lines(block)
+        if not block or _is_noise(block):
+            continue
+        key = _normalized(block)
+        if key in seen:
+            continue
+        share = _boilerplate_share(block)
+        if share is not None and share >= _BOILERPLATE_DOMINANT_RATIO:
+            continue
+        seen.add(key)
+        if share is not None:
+            boilerplate.add(len(kept))
+        kept.append(block)
+
+    start, end = _posting_span(kept, boilerplate)
+    body = kept[start:end]
+    truncated = False
+    if token_budget is not None:
+        body, truncated = _truncate(body, token_budget)
+
+    cleaned = "\n\n".join(body)
+    if not cleaned.strip():
+        # Nothing recognisable as a posting survived; better to send the original than nothing.
+        cleaned = markdown.strip()
+    return CleanedMarkdown(
+        markdown=cleaned,
+        tokens_before=estimate_tokens(markdown),
+        tokens_after=estimate_tokens(cleaned),
+        blocks_dropped=len(blocks) - len(body),
+        truncated=truncated,
+    )
+
+
+class CleaningStats:
+    """Running token savings per job board (URL host)."""
+
+    def __init__(self) -> None:
+        self._boards: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+
+    def add(self, board: str, result: CleanedMarkdown) -> None:
+        totals = self._boards[board]
+        totals[0] += 1
+        totals[1] += result.tokens_before
+        totals[2] += result.tokens_after
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+    def summary(self) -> str:
+        lines = [f"{'job board':<40} {'jobs':>5} {'tokens before':>14} {'after':>9} {'saved':>7}"]
+        for board, (jobs, before, after) in sorted(self._boards.items(), key=lambda item: -item[1][1]):
+            saved = 1 - after / before if before else 0.0
+            lines.append(f"{board:<40} {jobs:>5} {before:>14} {after:>9} {saved:>7.0%}")
+        return "Job description cleaning\n" + "\n".join(lines)
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+from src.job_description_data_extraction import docling_version
+
+
+class ExtractionError(Exception):
+    """The extractor cannot produce usable markdown for a source; another extractor should try."""
+
+
+class MarkdownExtractor(ABC):
+    name: str = "extractor"
+    version: str = "1"
+
+    @abstractmethod
+    def extract(self, source: str) -> str:
+        """Fetch the source (URL or local path) and return the job description as markdown."""
+        ...
+
+
+def converter_version(extractor: MarkdownExtractor | None) -> str:
+    """Version tag for cached conversions, covering the fast extractor and the Docling fallback."""
+    if extractor is None:
+        return docling_version()
+    return f"{extractor.name}-{extractor.version}+{docling_version()}"
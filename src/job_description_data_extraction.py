@@ -1,11 +1,38 @@
+import functools
 import logging
-
-from docling.document_converter import DocumentConverter
+from collections.abc import Callable
+from importlib import metadata
 
 logger = logging.getLogger(__name__)
 
-def docling_url_to_markdown(url: str) -> str:
-    logger.info("Docling: Converting %s to markdown...", url)
+
+def docling_version() -> str:
+    """Version tag for cached conversions; a Docling upgrade invalidates them."""
+    try:
+        return f"docling-{metadata.version('docling')}"
+    except metadata.PackageNotFoundError:
+        return "docling-unknown"
+
+
+def create_markdown_converter() -> Callable[[str], str]:
+    """Build a Docling converter once and return a source -> markdown callable."""
+    from docling.document_converter import DocumentConverter
+
     converter = DocumentConverter()
-    result = converter.convert(url)
-    return result.document.export_to_markdown()
+
+    def convert(source: str) -> str:
+        logger.info("Docling: Converting %s to markdown...", source)
+        result = converter.convert(source)
+        return result.document.export_to_markdown()
+
+    return convert
+
+
+@functools.cache
+def shared_markdown_converter() -> Callable[[str], str]:
+    """Process-wide converter so models are loaded once, not per document."""
+    return create_markdown_converter()
+
+
+def docling_url_to_markdown(url: str) -> str:
+    return shared_markdown_converter()(url)
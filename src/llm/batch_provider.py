@@ -0,0 +1,131 @@
+import asyncio
+import itertools
+import logging
+import time
+
+from pydantic import BaseModel, ValidationError
+
+from src.llm.batch_transport import TERMINAL_STATUSES, BatchRequest, BatchTransport
+from src.llm.provider import LLMProvider
+from src.prompts.prompter import Prompt
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingCall:
+    def __init__(self, request: BatchRequest, future: asyncio.Future[BaseModel]) -> None:
+        self.request = request
+        self.future = future
+
+
+class BatchLLMProvider(LLMProvider):
+    """Collects concurrent ``generate_structured`` calls into provider batch jobs.
+
+    Calls arriving within ``collect_window`` seconds of each other are submitted
+    together (at most ``max_batch_size`` per batch). Because every job in a run
+    reaches the same stage at roughly the same time, each pipeline stage ends up
+    as one batch: all keyword prompts, then all gap prompts, then all adjust prompts.
+    """
+
+    def __init__(
+        self,
+        transport: BatchTransport,
+        collect_window: float = 5.0,
+        max_batch_size: int = 1000,
+        poll_interval: float = 30.0,
+        timeout: float = 24 * 3600,
+    ) -> None:
+        self._transport = transport
+        self._collect_window = collect_window
+        self._max_batch_size = max_batch_size
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+        self._ids = itertools.count(1)
+        self._pending: list[_PendingCall] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    @property
+    def name(self) -> str:
+        return self._transport.name
+
+    @property
+    def model(self) -> str:
+        return self._transport.model
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        loop = asyncio.get_running_loop()
+        call = _PendingCall(
+            request=BatchRequest(
+                custom_id=f"req-{next(self._ids)}",
+                prompt=prompt,
+                output_model=output_model,
+                prefix_length=prompt.prefix_length if isinstance(prompt, Prompt) else 0,
+            ),
+            future=loop.create_future(),
+        )
+        self._pending.append(call)
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        else:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush_handle = loop.call_later(self._collect_window, self._flush)
+        return await call.future
+
+    async def aclose(self) -> None:
+        """Submit anything still pending and wait for all batches to finish."""
+        self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        calls, self._pending = self._pending, []
+        if not calls:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(calls))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, calls: list[_PendingCall]) -> None:
+        try:
+            await self._complete(calls)
+        except Exception as exc:
+            for call in calls:
+                if not call.future.done():
+                    call.future.set_exception(exc)
+        except BaseException:
+            for call in calls:
+                call.future.cancel()
+            raise
+
+    async def _complete(self, calls: list[_PendingCall]) -> None:
+        batch_id = await self._transport.submit([call.request for call in calls])
+        logger.info("Submitted %s batch %s with %d request(s)", self.name, batch_id, len(calls))
+
+        deadline = time.monotonic() + self._timeout
+        while (status := await self._transport.status(batch_id)) not in TERMINAL_STATUSES:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Batch {batch_id} did not finish within {self._timeout:.0f}s")
+            logger.debug("Batch %s is %s", batch_id, status)
+            await asyncio.sleep(self._poll_interval)
+        if status != "completed":
+            raise RuntimeError(f"Batch {batch_id} ended with status {status}")
+
+        results = {result.custom_id: result for result in await self._transport.results(batch_id)}
+        logger.info("Batch %s completed with %d result(s)", batch_id, len(results))
+        for call in calls:
+            if call.future.done():
+                continue
+            result = results.get(call.request.custom_id)
+            if result is None or result.text is None:
+                error = result.error if result is not None else "missing from batch output"
+                call.future.set_exception(RuntimeError(f"Batch request {call.request.custom_id} failed: {error}"))
+                continue
+            try:
+                call.future.set_result(call.request.output_model.model_validate_json(result.text))
+            except ValidationError as exc:
+                call.future.set_exception(exc)
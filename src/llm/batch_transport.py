@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+BatchStatus = Literal["pending", "running", "completed", "failed", "cancelled", "expired"]
+TERMINAL_STATUSES: frozenset[BatchStatus] = frozenset({"completed", "failed", "cancelled", "expired"})
+
+
+class BatchRequest(BaseModel):
+    custom_id: str
+    prompt: str
+    output_model: type[BaseModel]
+    prefix_length: int = Field(default=0, description="Length of the prompt's shared, cacheable prefix")
+
+
+class BatchResult(BaseModel):
+    custom_id: str
+    text: str | None = None
+    error: str | None = None
+
+
+class BatchTransport(ABC):
+    """Submits a set of structured-output requests as one provider batch job and collects the results."""
+
+    name: str = "batch"
+    model: str = ""
+
+    @abstractmethod
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        """Create a batch job for the requests and return its id."""
+        ...
+
+    @abstractmethod
+    async def status(self, batch_id: str) -> BatchStatus:
+        """Return the current status of the batch job."""
+        ...
+
+    @abstractmethod
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        """Return the raw JSON text (or error) of every request in a completed batch."""
+        ...
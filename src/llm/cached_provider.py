@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, ValidationError
+
+from src.llm.provider import DelegatingLLMProvider, LLMProvider
+from src.tracing.tracer import set_attribute
+
+logger = logging.getLogger(__name__)
+
+CacheMode = Literal["use", "bypass", "refresh"]
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def schema_hash(output_model: type[BaseModel]) -> str:
+    return _sha256(json.dumps(output_model.model_json_schema(), sort_keys=True))
+
+
+class ResponseCacheStore:
+    """Single-file SQLite store of validated structured responses."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            provider TEXT NOT NULL,
+            model TEXT NOT NULL,
+            prompt_hash TEXT NOT NULL,
+            schema_hash TEXT NOT NULL,
+            output_model TEXT NOT NULL,
+            response TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._SCHEMA)
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._max_age_seconds = max_age_seconds
+        self.evict()
+
+    def get(self, key: str) -> str | None:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            if self._max_age_seconds is not None and time.time() - created_at > self._max_age_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            return response
+
+    def put(
+        self,
+        key: str,
+        *,
+        provider: str,
+        model: str,
+        prompt_hash: str,
+        schema_hash: str,
+        output_model: str,
+        response: str,
+    ) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, prompt_hash, schema_hash, output_model, response, now, now),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def evict(self) -> int:
+        """Drop entries older than the age limit, then the least recently used beyond the size limit."""
+        removed = 0
+        with self._lock, self._conn:
+            if self._max_age_seconds is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (time.time() - self._max_age_seconds,)
+                )
+                removed += cursor.rowcount
+            if self._max_entries is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+                    ")",
+                    (self._max_entries,),
+                )
+                removed += cursor.rowcount
+        if removed:
+            logger.info("Evicted %d cached LLM response(s)", removed)
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachingLLMProvider(DelegatingLLMProvider):
+    """Serves repeated structured calls from a local store instead of the remote API.
+
+    Entries are keyed by provider, model, prompt hash and output-model schema hash.
+    ``mode="bypass"`` neither reads nor writes the cache; ``mode="refresh"`` skips
+    reads but stores the fresh responses.
+    """
+
+    _EVICT_EVERY = 100
+
+    def __init__(self, provider: LLMProvider, store: ResponseCacheStore, mode: CacheMode = "use") -> None:
+        super().__init__(provider)
+        self._store = store
+        self._mode = mode
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        if self._mode == "bypass":
+            return await self._provider.generate_structured(prompt, output_model)
+
+        prompt_hash = _sha256(prompt)
+        model_schema_hash = schema_hash(output_model)
+        key = _sha256("\n".join((self.name, self.model, prompt_hash, model_schema_hash)))
+
+        if self._mode == "use":
+            cached = await asyncio.to_thread(self._store.get, key)
+            if cached is not None:
+                try:
+                    result = output_model.model_validate_json(cached)
+                except ValidationError:
+                    logger.warning("Discarding cached %s that no longer validates", output_model.__name__)
+                    await asyncio.to_thread(self._store.delete, key)
+                else:
+                    self.hits += 1
+                    set_attribute("cache", "hit")
+                    logger.debug("LLM cache hit for %s", output_model.__name__)
+                    return result
+
+        self.misses += 1
+        set_attribute("cache", "miss")
+        result = await self._provider.generate_structured(prompt, output_model)
+        await asyncio.to_thread(
+            self._store.put,
+            key,
+            provider=self.name,
+            model=self.model,
+            prompt_hash=prompt_hash,
+            schema_hash=model_schema_hash,
+            output_model=output_model.__name__,
+            response=result.model_dump_json(),
+        )
+        self._writes += 1
+        if self._writes % self._EVICT_EVERY == 0:
+            await asyncio.to_thread(self._store.evict)
+        return result
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from src.llm.tokens import estimate_tokens
+from src.prompts.prompter import Prompt
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry[H]:
+    def __init__(self) -> None:
+        self.uses = 0
+        self.handle: H | None = None
+        self.expires_at = 0.0
+        self.pending: asyncio.Future[H | None] | None = None
+        self.failed = False
+
+
+class SharedPrefixCache[H]:
+    """Provider-side cache handles for the shared prefixes of prompts.
+
+    A handle is created through ``create(prefix, ttl_s)`` once a prefix of at
+    least ``min_tokens`` estimated tokens has been used ``min_uses`` times, so a
+    resume trimmed differently for every job never pays for a cache of its own.
+    Concurrent callers share one creation, handles are renewed with
+    ``refresh(handle, ttl_s)`` when less than a fifth of their TTL remains, and
+    the least recently used handle is deleted beyond ``max_entries``. A prefix
+    whose cache cannot be created is not tried again.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[str, float], Awaitable[H]],
+        refresh: Callable[[H, float], Awaitable[None]],
+        delete: Callable[[H], Awaitable[None]],
+        ttl_s: float = 3600.0,
+        min_tokens: int = 1024,
+        min_uses: int = 2,
+        max_entries: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._create = create
+        self._refresh = refresh
+        self._delete = delete
+        self._ttl_s = ttl_s
+        self._min_tokens = min_tokens
+        self._min_uses = min_uses
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry[H]] = OrderedDict()
+        self.created = 0
+        self.refreshed = 0
+
+    async def handle(self, prompt: Prompt) -> H | None:
+        """Cache handle for the prompt's prefix, or None to send the prompt uncached.
+
+        Prompts with nothing after the prefix are always sent uncached: the request
+        would otherwise carry no content of its own.
+        """
+        if not prompt.prefix_length or not prompt.suffix.strip() or estimate_tokens(prompt.prefix) < self._min_tokens:
+            return None
+        key = prompt.prefix_key
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry()
+            await self._evict()
+        self._entries.move_to_end(key)
+        entry.uses += 1
+        if entry.failed or entry.uses < self._min_uses:
+            return None
+        if entry.pending is not None:
+            return await asyncio.shield(entry.pending)
+
+        pending = entry.pending = asyncio.get_running_loop().create_future()
+        handle: H | None = None
+        try:
+            handle = await self._current(entry, prompt.prefix)
+        except Exception as exc:
+            logger.warning(
+                "Could not cache a %d-char prompt prefix, sending it uncached: %s", prompt.prefix_length, exc
+            )
+            entry.failed = True
+            entry.handle = None
+        finally:
+            # Callers waiting on this creation go uncached if it was cancelled.
+            entry.pending = None
+            pending.set_result(handle)
+        return handle
+
+    def invalidate(self, prompt: Prompt) -> None:
+        """Forget the handle for the prompt's prefix, e.g. after the provider reported it missing."""
+        entry = self._entries.get(prompt.prefix_key)
+        if entry is not None:
+            entry.handle = None
+
+    async def aclose(self) -> None:
+        entries, self._entries = list(self._entries.values()), OrderedDict()
+        await asyncio.gather(
+            *(self._delete_quietly(entry.handle) for entry in entries if entry.handle is not None)
+        )
+
+    async def _current(self, entry: _Entry[H], prefix: str) -> H:
+        now = self._clock()
+        if entry.handle is not None and entry.expires_at - now > self._ttl_s / 5:
+            return entry.handle
+        if entry.handle is not None:
+            try:
+                await self._refresh(entry.handle, self._ttl_s)
+                self.refreshed += 1
+                entry.expires_at = now + self._ttl_s
+                return entry.handle
+            except Exception as exc:
+                logger.info("Could not renew a prompt prefix cache, creating a new one: %s", exc)
+        entry.handle = await self._create(prefix, self._ttl_s)
+        entry.expires_at = now + self._ttl_s
+        self.created += 1
+        return entry.handle
+
+    async def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            _, entry = self._entries.popitem(last=False)
+            if entry.handle is not None:
+                await self._delete_quietly(entry.handle)
+
+    async def _delete_quietly(self, handle: H) -> None:
+        try:
+            await self._delete(handle)
+        except Exception as exc:
+            logger.debug("Could not delete prompt prefix cache: %s", exc)
@@ -1,26 +1,70 @@
 import logging
 
+from src.llm.batch_provider import BatchLLMProvider
 from src.llm.provider import LLMProvider
-from src.llm.gemini_provider import GeminiProvider
-from src.llm.openai_provider import OpenAIProvider
 
 logger = logging.getLogger(__name__)
 
+# Provider SDKs (openai, google-genai) take hundreds of milliseconds to import, so each
+# backend module is imported only when that backend is selected.
+
 
 def create_llm_provider(
     *,
     llm_provider: str,
     llm_api_key: str | None,
     model: str | None = None,
+    context_cache_ttl_s: float | None = None,
+    context_cache_min_tokens: int = 1024,
 ) -> LLMProvider:
     model_kwargs = {"model": model} if model else {}
     match llm_provider:
         case "gemini":
-            client = GeminiProvider(api_key=llm_api_key, **model_kwargs)
-            logger.info("Using Gemini provider (model=%s)", client._model)
+            from src.llm.gemini_provider import GeminiProvider
+
+            client = GeminiProvider(
+                api_key=llm_api_key,
+                context_cache_ttl_s=context_cache_ttl_s,
+                context_cache_min_tokens=context_cache_min_tokens,
+                **model_kwargs,
+            )
+            logger.info("Using Gemini provider (model=%s)", client.model)
         case "openai":
+            from src.llm.openai_provider import OpenAIProvider
+
+            # OpenAI caches shared prompt prefixes automatically; there is nothing to manage.
             client = OpenAIProvider(api_key=llm_api_key, **model_kwargs)
-            logger.info("Using OpenAI provider (model=%s)", client._model)
+            logger.info("Using OpenAI provider (model=%s)", client.model)
+        case _:
+            raise ValueError(f"Unknown LLM provider: {llm_provider}")
+    return client
+
+
+def create_batch_llm_provider(
+    *,
+    llm_provider: str,
+    llm_api_key: str | None,
+    model: str | None = None,
+    collect_window: float = 5.0,
+    max_batch_size: int = 1000,
+    poll_interval: float = 30.0,
+) -> BatchLLMProvider:
+    model_kwargs = {"model": model} if model else {}
+    match llm_provider:
+        case "gemini":
+            from src.llm.gemini_batch_transport import GeminiBatchTransport
+
+            transport = GeminiBatchTransport(api_key=llm_api_key, **model_kwargs)
+        case "openai":
+            from src.llm.openai_batch_transport import OpenAIBatchTransport
+
+            transport = OpenAIBatchTransport(api_key=llm_api_key, **model_kwargs)
         case _:
             raise ValueError(f"Unknown LLM provider: {llm_provider}")
-    return client
\ No newline at end of file
+    logger.info("Using %s batch mode (model=%s)", llm_provider, transport.model)
+    return BatchLLMProvider(
+        transport,
+        collect_window=collect_window,
+        max_batch_size=max_batch_size,
+        poll_interval=poll_interval,
+    )
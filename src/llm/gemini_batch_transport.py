@@ -0,0 +1,75 @@
+import logging
+
+from google import genai
+
+from src.llm.batch_transport import BatchRequest, BatchResult, BatchStatus, BatchTransport
+
+logger = logging.getLogger(__name__)
+
+_STATUS_MAP: dict[str, BatchStatus] = {
+    "JOB_STATE_PENDING": "pending",
+    "JOB_STATE_QUEUED": "pending",
+    "JOB_STATE_RUNNING": "running",
+    "JOB_STATE_SUCCEEDED": "completed",
+    "JOB_STATE_PARTIALLY_SUCCEEDED": "completed",
+    "JOB_STATE_FAILED": "failed",
+    "JOB_STATE_CANCELLED": "cancelled",
+    "JOB_STATE_EXPIRED": "expired",
+}
+
+
+class GeminiBatchTransport(BatchTransport):
+    """Gemini Batch API transport using inlined requests.
+
+    Inlined responses come back in request order, so the custom ids of each
+    submitted batch are kept to map them back.
+    """
+
+    name = "gemini"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-3-flash-preview",
+        client: genai.Client | None = None,
+    ) -> None:
+        self._client = client or genai.Client(api_key=api_key)
+        self.model = model
+        self._custom_ids: dict[str, list[str]] = {}
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        inlined = [
+            genai.types.InlinedRequest(
+                contents=request.prompt,
+                config=genai.types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    response_schema=request.output_model,
+                ),
+            )
+            for request in requests
+        ]
+        job = await self._client.aio.batches.create(
+            model=self.model,
+            src=inlined,
+            config={"display_name": f"agentic-recruitment-{requests[0].custom_id}"},
+        )
+        self._custom_ids[job.name] = [request.custom_id for request in requests]
+        return job.name
+
+    async def status(self, batch_id: str) -> BatchStatus:
+        job = await self._client.aio.batches.get(name=batch_id)
+        return _STATUS_MAP.get(job.state.name, "running")
+
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        job = await self._client.aio.batches.get(name=batch_id)
+        custom_ids = self._custom_ids.pop(batch_id, [])
+        responses = job.dest.inlined_responses if job.dest else None
+        if not responses:
+            return []
+        results: list[BatchResult] = []
+        for custom_id, inlined in zip(custom_ids, responses):
+            if inlined.error is not None:
+                results.append(BatchResult(custom_id=custom_id, error=str(inlined.error)))
+            else:
+                results.append(BatchResult(custom_id=custom_id, text=inlined.response.text))
+        return results
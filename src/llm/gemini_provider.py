@@ -1,21 +1,107 @@
+import logging
+
 from google import genai
+from google.genai import errors
 from pydantic import BaseModel
 
+from src.llm.context_cache import SharedPrefixCache
 from src.llm.provider import LLMProvider
+from src.prompts.prompter import Prompt
+from src.tracing.tracer import record_usage
+
+logger = logging.getLogger(__name__)
 
 
 class GeminiProvider(LLMProvider):
-    def __init__(self, api_key: str, model: str = "gemini-3-flash-preview") -> None:
+    """Gemini structured generation.
+
+    With ``context_cache_ttl_s``, the shared prefix of a :class:`Prompt`
+    (instructions and resume) is stored once as explicit cached content and
+    referenced by every later call, instead of being processed again per job.
+    """
+
+    name = "gemini"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-3-flash-preview",
+        context_cache_ttl_s: float | None = None,
+        context_cache_min_tokens: int = 1024,
+    ) -> None:
         self._client = genai.Client(api_key=api_key)
         self._model = model
+        self._context_cache = (
+            SharedPrefixCache(
+                self._create_cache,
+                self._refresh_cache,
+                self._delete_cache,
+                ttl_s=context_cache_ttl_s,
+                min_tokens=context_cache_min_tokens,
+            )
+            if context_cache_ttl_s
+            else None
+        )
+
+    @property
+    def model(self) -> str:
+        return self._model
 
     async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
-        response = await self._client.aio.models.generate_content(
+        cached_content = None
+        if self._context_cache is not None and isinstance(prompt, Prompt):
+            cached_content = await self._context_cache.handle(prompt)
+        try:
+            response = await self._generate(prompt.suffix if cached_content else prompt, output_model, cached_content)
+        except errors.ClientError as exc:
+            # The cache expired or was deleted server-side; send the whole prompt instead.
+            if cached_content is None or exc.code not in (403, 404):
+                raise
+            logger.info("Cached prompt prefix %s is gone, sending the full prompt", cached_content)
+            self._context_cache.invalidate(prompt)
+            response = await self._generate(prompt, output_model, None)
+        usage = response.usage_metadata
+        if usage is not None:
+            record_usage(
+                usage.prompt_token_count,
+                usage.candidates_token_count,
+                cached_tokens=usage.cached_content_token_count,
+            )
+        return output_model.model_validate_json(response.text)
+
+    async def aclose(self) -> None:
+        if self._context_cache is not None:
+            await self._context_cache.aclose()
+
+    async def _generate(
+        self, contents: str, output_model: type[BaseModel], cached_content: str | None
+    ) -> genai.types.GenerateContentResponse:
+        return await self._client.aio.models.generate_content(
             model=self._model,
-            contents=prompt,
+            contents=contents,
             config=genai.types.GenerateContentConfig(
                 response_mime_type="application/json",
                 response_schema=output_model,
+                cached_content=cached_content,
             ),
         )
-        return output_model.model_validate_json(response.text)
+
+    async def _create_cache(self, prefix: str, ttl_s: float) -> str:
+        cache = await self._client.aio.caches.create(
+            model=self._model,
+            config=genai.types.CreateCachedContentConfig(
+                contents=[prefix],
+                ttl=f"{ttl_s:.0f}s",
+                display_name="resume-prompt-prefix",
+            ),
+        )
+        logger.info("Cached a %d-char prompt prefix as %s for %.0fs", len(prefix), cache.name, ttl_s)
+        return cache.name
+
+    async def _refresh_cache(self, name: str, ttl_s: float) -> None:
+        await self._client.aio.caches.update(
+            name=name, config=genai.types.UpdateCachedContentConfig(ttl=f"{ttl_s:.0f}s")
+        )
+
+    async def _delete_cache(self, name: str) -> None:
+        await self._client.aio.caches.delete(name=name)
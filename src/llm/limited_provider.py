@@ -0,0 +1,17 @@
+import asyncio
+
+from pydantic import BaseModel
+
+from src.llm.provider import DelegatingLLMProvider, LLMProvider
+
+
+class ConcurrencyLimitedLLMProvider(DelegatingLLMProvider):
+    """Caps the number of in-flight calls to the wrapped provider."""
+
+    def __init__(self, provider: LLMProvider, semaphore: asyncio.Semaphore) -> None:
+        super().__init__(provider)
+        self._semaphore = semaphore
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        async with self._semaphore:
+            return await self._provider.generate_structured(prompt, output_model)
@@ -0,0 +1,117 @@
+import json
+import logging
+
+from openai import AsyncOpenAI, pydantic_function_tool
+from pydantic import BaseModel
+
+from src.llm.batch_transport import BatchRequest, BatchResult, BatchStatus, BatchTransport
+from src.llm.openai_provider import prompt_cache_key, prompt_input
+from src.prompts.prompter import Prompt
+
+logger = logging.getLogger(__name__)
+
+_STATUS_MAP: dict[str, BatchStatus] = {
+    "validating": "pending",
+    "in_progress": "running",
+    "finalizing": "running",
+    "cancelling": "running",
+    "completed": "completed",
+    "failed": "failed",
+    "expired": "expired",
+    "cancelled": "cancelled",
+}
+
+
+def strict_json_schema(output_model: type[BaseModel]) -> dict:
+    """Strict JSON schema for ``output_model``, built by the SDK's public function-tool helper.
+
+    ``responses.parse`` derives the same strict schema internally for online calls;
+    batch request lines have to carry it themselves.
+    """
+    return pydantic_function_tool(output_model)["function"]["parameters"]
+
+
+class OpenAIBatchTransport(BatchTransport):
+    """OpenAI Batch API transport targeting the Responses endpoint."""
+
+    name = "openai"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-5-mini",
+        completion_window: str = "24h",
+        client: AsyncOpenAI | None = None,
+    ) -> None:
+        self._client = client or AsyncOpenAI(api_key=api_key)
+        self.model = model
+        self._completion_window = completion_window
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        lines = [json.dumps(self._request_line(request)) for request in requests]
+        upload = await self._client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await self._client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/responses",
+            completion_window=self._completion_window,
+        )
+        return batch.id
+
+    async def status(self, batch_id: str) -> BatchStatus:
+        batch = await self._client.batches.retrieve(batch_id)
+        return _STATUS_MAP.get(batch.status, "running")
+
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        batch = await self._client.batches.retrieve(batch_id)
+        results: list[BatchResult] = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self._client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    results.append(self._parse_line(json.loads(line)))
+        return results
+
+    def _request_line(self, request: BatchRequest) -> dict:
+        prompt = Prompt(request.prompt[: request.prefix_length], request.prompt[request.prefix_length :])
+        cache_key = prompt_cache_key(prompt)
+        return {
+            "custom_id": request.custom_id,
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": {
+                "model": self.model,
+                "input": prompt_input(prompt),
+                **({"prompt_cache_key": cache_key} if cache_key else {}),
+                "text": {
+                    "format": {
+                        "type": "json_schema",
+                        "name": request.output_model.__name__,
+                        "schema": strict_json_schema(request.output_model),
+                        "strict": True,
+                    }
+                },
+            },
+        }
+
+    @staticmethod
+    def _parse_line(line: dict) -> BatchResult:
+        custom_id = line["custom_id"]
+        if line.get("error"):
+            return BatchResult(custom_id=custom_id, error=json.dumps(line["error"]))
+        response = line.get("response") or {}
+        if response.get("status_code") != 200:
+            return BatchResult(custom_id=custom_id, error=json.dumps(response.get("body")))
+        for item in response["body"].get("output", []):
+            if item.get("type") != "message":
+                continue
+            for part in item.get("content", []):
+                if part.get("type") == "output_text":
+                    return BatchResult(custom_id=custom_id, text=part["text"])
+                if part.get("type") == "refusal":
+                    return BatchResult(custom_id=custom_id, error=f"refusal: {part.get('refusal')}")
+        return BatchResult(custom_id=custom_id, error="no output text in response")
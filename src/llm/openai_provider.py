@@ -2,19 +2,52 @@ from openai import AsyncOpenAI
 from pydantic import BaseModel
 
 from src.llm.provider import LLMProvider
+from src.prompts.prompter import Prompt
+from src.tracing.tracer import record_usage
+
+
+def prompt_input(prompt: str) -> list[dict[str, str]]:
+    """Responses API input with the shared prompt prefix as its own leading message.
+
+    OpenAI caches prompt prefixes automatically; keeping the instructions and
+    resume byte-identical and first lets every job after the first reuse them.
+    """
+    if isinstance(prompt, Prompt) and prompt.prefix_length and prompt.suffix:
+        return [{"role": "user", "content": prompt.prefix}, {"role": "user", "content": prompt.suffix}]
+    return [{"role": "user", "content": prompt}]
+
+
+def prompt_cache_key(prompt: str) -> str | None:
+    """Routes requests sharing a prefix to the same cache; None for prompts without one."""
+    return f"prefix-{prompt.prefix_key}" if isinstance(prompt, Prompt) and prompt.prefix_length else None
 
 
 class OpenAIProvider(LLMProvider):
+    name = "openai"
+
     def __init__(self, api_key: str, model: str = "gpt-5-mini") -> None:
         self._client = AsyncOpenAI(api_key=api_key)
         self._model = model
 
+    @property
+    def model(self) -> str:
+        return self._model
+
     async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        cache_key = prompt_cache_key(prompt)
         response = await self._client.responses.parse(
             model=self._model,
-            input=[{"role": "user", "content": prompt}],
+            input=prompt_input(prompt),
             text_format=output_model,
+            **({"prompt_cache_key": cache_key} if cache_key else {}),
         )
+        if response.usage is not None:
+            details = response.usage.input_tokens_details
+            record_usage(
+                response.usage.input_tokens,
+                response.usage.output_tokens,
+                cached_tokens=details.cached_tokens if details is not None else None,
+            )
         result = response.output_parsed
         if result is None:
             raise ValueError(
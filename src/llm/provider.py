@@ -4,7 +4,35 @@ from pydantic import BaseModel
 
 
 class LLMProvider(ABC):
+    name: str = "llm"
+
+    @property
+    def model(self) -> str:
+        """Model identifier used for requests; empty when not applicable."""
+        return ""
+
     @abstractmethod
     async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
         """Generate a structured response conforming to the given Pydantic model."""
         ...
+
+    async def aclose(self) -> None:
+        """Release provider-side resources such as prompt caches."""
+
+
+class DelegatingLLMProvider(LLMProvider, ABC):
+    """Base for providers that wrap another provider and add behaviour around its calls."""
+
+    def __init__(self, provider: LLMProvider) -> None:
+        self._provider = provider
+
+    @property
+    def name(self) -> str:
+        return self._provider.name
+
+    @property
+    def model(self) -> str:
+        return self._provider.model
+
+    async def aclose(self) -> None:
+        await self._provider.aclose()
@@ -0,0 +1,261 @@
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from collections import deque
+
+from pydantic import BaseModel, Field, ValidationError
+
+from src.llm.provider import DelegatingLLMProvider, LLMProvider
+from src.llm.tokens import estimate_tokens
+from src.tracing.tracer import percentile, record_retry, set_attribute
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+class RateLimits(BaseModel):
+    requests_per_minute: float | None = Field(default=None, gt=0)
+    tokens_per_minute: float | None = Field(default=None, gt=0)
+
+
+class TokenBucket:
+    """Refills continuously at ``per_minute / 60`` units per second up to ``capacity``."""
+
+    def __init__(self, per_minute: float, capacity: float | None = None) -> None:
+        self._rate = per_minute / 60
+        self._capacity = capacity or per_minute
+        self._available = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        # Requests larger than the bucket would wait forever; let them drain it instead.
+        amount = min(amount, self._capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._available >= amount:
+                    self._available -= amount
+                    return
+                await asyncio.sleep((amount - self._available) / self._rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._available = min(self._capacity, self._available + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+class ProviderRateLimiter:
+    """Request and token buckets per provider/model, shared by every wrapper that uses it.
+
+    ``limits`` is keyed by ``"<provider>:<model>"`` or ``"<provider>"``; keys that
+    match neither fall back to ``default``. A ``Retry-After`` from one call pauses
+    every caller of the same provider/model.
+    """
+
+    def __init__(self, limits: dict[str, RateLimits] | None = None, default: RateLimits | None = None) -> None:
+        self._limits = limits or {}
+        self._default = default or RateLimits()
+        self._buckets: dict[str, tuple[TokenBucket | None, TokenBucket | None]] = {}
+        self._paused_until: dict[str, float] = {}
+
+    async def acquire(self, provider: str, model: str, tokens: int) -> None:
+        key = f"{provider}:{model}"
+        while (delay := self._paused_until.get(key, 0.0) - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        requests, token_bucket = self._buckets_for(key, provider)
+        if requests is not None:
+            await requests.acquire()
+        if token_bucket is not None:
+            await token_bucket.acquire(tokens)
+
+    def pause(self, provider: str, model: str, seconds: float) -> None:
+        key = f"{provider}:{model}"
+        self._paused_until[key] = max(self._paused_until.get(key, 0.0), time.monotonic() + seconds)
+
+    def _buckets_for(self, key: str, provider: str) -> tuple[TokenBucket | None, TokenBucket | None]:
+        if key not in self._buckets:
+            limits = self._limits.get(key) or self._limits.get(provider) or self._default
+            self._buckets[key] = (
+                TokenBucket(limits.requests_per_minute) if limits.requests_per_minute else None,
+                TokenBucket(limits.tokens_per_minute) if limits.tokens_per_minute else None,
+            )
+        return self._buckets[key]
+
+
+def status_code(exc: BaseException) -> int | None:
+    """HTTP status of an SDK error (``status_code`` on OpenAI, ``code`` on google-genai)."""
+    for attribute in ("status_code", "code"):
+        value = getattr(exc, attribute, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Delay requested by the server via ``retry-after-ms`` or ``Retry-After``, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    if (milliseconds := headers.get("retry-after-ms")) is not None:
+        try:
+            return max(float(milliseconds) / 1000, 0.0)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    code = status_code(exc)
+    if code is not None:
+        return code in RETRYABLE_STATUS_CODES
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    # SDK transport errors (e.g. openai.APIConnectionError) carry no status code.
+    return any(
+        "Connection" in cls.__name__ or "Timeout" in cls.__name__ for cls in type(exc).__mro__
+    )
+
+
+class ResilientLLMProvider(DelegatingLLMProvider):
+    """Throttles, retries and optionally hedges calls to the wrapped provider.
+
+    - Requests and estimated tokens (prompt plus ``output_token_reserve``) are
+      drawn from the shared :class:`ProviderRateLimiter` before every attempt.
+    - Retryable errors (429, 5xx, timeouts, connection errors) back off with full
+      jitter, or exactly as long as the server's ``Retry-After`` asks.
+    - Responses that fail schema validation are re-requested up to
+      ``validation_retries`` times.
+    - With ``hedge_percentile`` set, a call still running past that percentile of
+      recent latencies gets a duplicate request; the first answer wins.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        limiter: ProviderRateLimiter | None = None,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        validation_retries: int = 2,
+        hedge_percentile: float | None = None,
+        hedge_min_samples: int = 20,
+        output_token_reserve: int = 1024,
+    ) -> None:
+        super().__init__(provider)
+        self._limiter = limiter or ProviderRateLimiter()
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._validation_retries = validation_retries
+        self._hedge_percentile = hedge_percentile
+        self._hedge_min_samples = hedge_min_samples
+        self._output_token_reserve = output_token_reserve
+        self._latencies: deque[float] = deque(maxlen=200)
+        self.retries = 0
+        self.hedges = 0
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        tokens = estimate_tokens(prompt) + self._output_token_reserve
+        transient_failures = 0
+        invalid_responses = 0
+        while True:
+            try:
+                return await self._attempt(prompt, output_model, tokens)
+            except ValidationError:
+                invalid_responses += 1
+                if invalid_responses > self._validation_retries:
+                    raise
+                logger.warning(
+                    "%s returned an invalid %s, retrying (%d/%d)",
+                    self.name,
+                    output_model.__name__,
+                    invalid_responses,
+                    self._validation_retries,
+                )
+            except Exception as exc:
+                transient_failures += 1
+                if not is_retryable(exc) or transient_failures > self._max_retries:
+                    raise
+                delay = self._backoff(exc, transient_failures)
+                logger.warning(
+                    "%s call for %s failed with %s, retrying in %.1fs (%d/%d)",
+                    self.name,
+                    output_model.__name__,
+                    type(exc).__name__,
+                    delay,
+                    transient_failures,
+                    self._max_retries,
+                )
+                await asyncio.sleep(delay)
+            self.retries += 1
+            record_retry()
+
+    async def _attempt[T: BaseModel](self, prompt: str, output_model: type[T], tokens: int) -> T:
+        hedge_after = self._hedge_delay()
+        if hedge_after is None:
+            return await self._call(prompt, output_model, tokens)
+
+        primary = asyncio.ensure_future(self._call(prompt, output_model, tokens))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+        except BaseException:
+            # Cancelled while waiting: stop the call so it releases its rate limit and LLM slots.
+            primary.cancel()
+            raise
+        if done:
+            return primary.result()
+
+        self.hedges += 1
+        set_attribute("hedged", True)
+        logger.debug("Hedging %s call after %.1fs", output_model.__name__, hedge_after)
+        pending = {primary, asyncio.ensure_future(self._call(prompt, output_model, tokens))}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _call[T: BaseModel](self, prompt: str, output_model: type[T], tokens: int) -> T:
+        await self._limiter.acquire(self.name, self.model, tokens)
+        started = time.perf_counter()
+        try:
+            result = await self._provider.generate_structured(prompt, output_model)
+        except Exception as exc:
+            if (retry_after := retry_after_seconds(exc)) is not None and status_code(exc) == 429:
+                self._limiter.pause(self.name, self.model, retry_after)
+            raise
+        self._latencies.append(time.perf_counter() - started)
+        return result
+
+    def _hedge_delay(self) -> float | None:
+        if self._hedge_percentile is None or len(self._latencies) < self._hedge_min_samples:
+            return None
+        return percentile(list(self._latencies), self._hedge_percentile)
+
+    def _backoff(self, exc: BaseException, attempt: int) -> float:
+        retry_after = retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(retry_after, self._backoff_max)
+        return random.uniform(0, min(self._backoff_max, self._backoff_base * 2 ** (attempt - 1)))
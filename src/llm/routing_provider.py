@@ -0,0 +1,142 @@
+import logging
+import time
+from collections import deque
+
+from pydantic import BaseModel
+
+from src.llm.provider import LLMProvider
+from src.tracing.tracer import current_span, percentile, set_attribute
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stage of each structured output, used for pinning and per-stage statistics.
+STAGE_BY_OUTPUT_MODEL: dict[str, str] = {
+    "JobDescriptionKeywords": "keywords",
+    "SkillGapAnalysis": "gaps",
+    "ExperienceData": "adjust",
+    "ResumePatch": "adjust",
+    "TailoredResume": "fused",
+}
+
+
+def stage_for(output_model: type[BaseModel]) -> str:
+    return STAGE_BY_OUTPUT_MODEL.get(output_model.__name__, output_model.__name__)
+
+
+class _BackendStats:
+    def __init__(self, window: int) -> None:
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.outcomes: deque[bool] = deque(maxlen=window)
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def p95(self) -> float:
+        return percentile(list(self.latencies), 95)
+
+
+class RoutingLLMProvider(LLMProvider):
+    """Sends each call to the healthiest of several backends and fails over on errors.
+
+    Backends are ranked per stage by moving p95 latency, inflated by their recent
+    error rate. A backend with fewer than ``min_samples`` calls for a stage is
+    tried first so every backend gets measured. ``pins`` restricts a stage
+    (``keywords``, ``gaps``, ``adjust``, ``fused``) to an ordered list of backends,
+    e.g. a cheap model for keyword extraction and a stronger one for ``adjust``.
+    """
+
+    name = "router"
+
+    def __init__(
+        self,
+        backends: dict[str, LLMProvider],
+        pins: dict[str, list[str]] | None = None,
+        window: int = 50,
+        min_samples: int = 3,
+        error_penalty: float = 10.0,
+    ) -> None:
+        if not backends:
+            raise ValueError("RoutingLLMProvider needs at least one backend")
+        unknown = {name for names in (pins or {}).values() for name in names} - backends.keys()
+        if unknown:
+            raise ValueError(f"Pinned backends are not configured: {', '.join(sorted(unknown))}")
+        self._backends = backends
+        self._pins = pins or {}
+        self._window = window
+        self._min_samples = min_samples
+        self._error_penalty = error_penalty
+        self._stats: dict[tuple[str, str], _BackendStats] = {}
+
+    @property
+    def backends(self) -> dict[str, LLMProvider]:
+        return self._backends
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        stage = stage_for(output_model)
+        ranked = self.ranking(stage)
+        last_error: Exception | None = None
+        for attempt, backend_name in enumerate(ranked):
+            backend = self._backends[backend_name]
+            self._annotate(backend_name, backend)
+            stats = self._stats_for(backend_name, stage)
+            started = time.perf_counter()
+            try:
+                result = await backend.generate_structured(prompt, output_model)
+            except Exception as exc:
+                stats.outcomes.append(False)
+                last_error = exc
+                if attempt + 1 < len(ranked):
+                    logger.warning(
+                        "Backend %s failed for %s (%s: %s); failing over to %s",
+                        backend_name,
+                        stage,
+                        type(exc).__name__,
+                        exc,
+                        ranked[attempt + 1],
+                    )
+                continue
+            stats.outcomes.append(True)
+            stats.latencies.append(time.perf_counter() - started)
+            return result
+        assert last_error is not None
+        raise last_error
+
+    async def aclose(self) -> None:
+        for backend in self._backends.values():
+            await backend.aclose()
+
+    def ranking(self, stage: str) -> list[str]:
+        """Backends eligible for ``stage``, best first."""
+        candidates = self._pins.get(stage) or list(self._backends)
+        if stage in self._pins:
+            # Pinned order is a preference; only reorder when a backend is clearly unhealthy.
+            return sorted(candidates, key=lambda name: self._stats_for(name, stage).error_rate > 0.5)
+        return sorted(candidates, key=lambda name: self._score(name, stage))
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {
+            f"{backend}/{stage}": {"calls": len(s.outcomes), "p95_s": s.p95(), "error_rate": s.error_rate}
+            for (backend, stage), s in self._stats.items()
+        }
+
+    def _score(self, backend_name: str, stage: str) -> float:
+        stats = self._stats_for(backend_name, stage)
+        if len(stats.outcomes) < self._min_samples:
+            return -1.0 + len(stats.outcomes) / self._min_samples
+        latency = stats.p95() if stats.latencies else float("inf")
+        return latency * (1 + self._error_penalty * stats.error_rate)
+
+    def _stats_for(self, backend_name: str, stage: str) -> _BackendStats:
+        key = (backend_name, stage)
+        if key not in self._stats:
+            self._stats[key] = _BackendStats(self._window)
+        return self._stats[key]
+
+    @staticmethod
+    def _annotate(backend_name: str, backend: LLMProvider) -> None:
+        span = current_span()
+        if span is not None:
+            span.provider = backend.name
+            span.model = backend.model
+        set_attribute("backend", backend_name)
@@ -0,0 +1,8 @@
+import math
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap provider-agnostic token estimate (~4 characters per token)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+from src.llm.provider import DelegatingLLMProvider
+from src.tracing.tracer import span
+
+
+class TracingLLMProvider(DelegatingLLMProvider):
+    """Wraps every call in an ``llm.<OutputModel>`` span; providers add token usage to it."""
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        with span(f"llm.{output_model.__name__}", prompt_chars=len(prompt)) as current:
+            if current is not None:
+                current.provider = self.name
+                current.model = self.model
+            return await self._provider.generate_structured(prompt, output_model)
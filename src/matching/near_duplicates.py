@@ -0,0 +1,144 @@
+import hashlib
+import logging
+import random
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_PRIME = (1 << 61) - 1
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_MAX_CANDIDATES = 64
+
+Signature = tuple[int, ...]
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def shingles(text: str, size: int = 5) -> set[int]:
+    """Hashed word ``size``-grams of the text, ignoring case, punctuation and markdown syntax."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {_hash64(" ".join(words).encode("utf-8"))} if words else set()
+    return {_hash64(" ".join(words[i : i + size]).encode("utf-8")) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """MinHash signatures whose agreement rate estimates the Jaccard similarity of shingle sets."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1) -> None:
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, text: str) -> Signature:
+        hashes = shingles(text)
+        if not hashes:
+            return (_PRIME,) * self.num_perm
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self._params)
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+class NearDuplicate(BaseModel):
+    source: str
+    output_dir: Path
+    gaps_key: str | None
+    similarity: float
+
+
+class PostingIndex:
+    """Persistent MinHash LSH index of processed postings (SQLite).
+
+    Signatures are split into ``bands`` bands of ``rows`` values; two postings
+    become candidates when any band hashes to the same bucket. With the default
+    8 x 8 layout the candidate probability rises steeply around 0.77 Jaccard,
+    and candidates are then checked against ``threshold`` using the full
+    signature. A lookup is one indexed query over ``bands`` keys plus a fetch of
+    a handful of candidate signatures, independent of the number of postings.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS postings (
+            id INTEGER PRIMARY KEY,
+            source TEXT NOT NULL,
+            output_dir TEXT NOT NULL,
+            gaps_key TEXT,
+            signature BLOB NOT NULL,
+            created_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS buckets (
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            posting_id INTEGER NOT NULL,
+            PRIMARY KEY (band, bucket, posting_id)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: Path, threshold: float = 0.85, bands: int = 8, rows: int = 8) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._SCHEMA)
+        self._lock = threading.Lock()
+        self._threshold = threshold
+        self._bands = bands
+        self._rows = rows
+        self.hasher = MinHasher(num_perm=bands * rows)
+
+    def find(self, signature: Signature) -> NearDuplicate | None:
+        """Most similar indexed posting at or above the threshold, if any."""
+        keys = self._band_keys(signature)
+        placeholders = ", ".join("(?, ?)" for _ in keys)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.source, p.output_dir, p.gaps_key, p.signature FROM postings p WHERE p.id IN ("
+                f" SELECT DISTINCT posting_id FROM buckets WHERE (band, bucket) IN (VALUES {placeholders})"
+                f" LIMIT {_MAX_CANDIDATES})",
+                [value for key in keys for value in key],
+            ).fetchall()
+
+        best: NearDuplicate | None = None
+        for source, output_dir, gaps_key, blob in rows:
+            score = similarity(signature, tuple(array("Q", blob)))
+            if score >= self._threshold and (best is None or score > best.similarity):
+                best = NearDuplicate(source=source, output_dir=Path(output_dir), gaps_key=gaps_key, similarity=score)
+        return best
+
+    def add(self, signature: Signature, source: str, output_dir: Path, gaps_key: str | None = None) -> None:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO postings (source, output_dir, gaps_key, signature, created_at) VALUES (?, ?, ?, ?, ?)",
+                (source, str(output_dir), gaps_key, array("Q", signature).tobytes(), time.time()),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO buckets VALUES (?, ?, ?)",
+                [(band, bucket, cursor.lastrowid) for band, bucket in self._band_keys(signature)],
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _band_keys(self, signature: Signature) -> list[tuple[int, int]]:
+        keys = []
+        for band in range(self._bands):
+            values = signature[band * self._rows : (band + 1) * self._rows]
+            digest = hashlib.blake2b(array("Q", values).tobytes(), digest_size=8).digest()
+            keys.append((band, int.from_bytes(digest, "big", signed=True)))
+        return keys
@@ -0,0 +1,191 @@
+import logging
+import math
+from collections import Counter
+
+from pydantic import BaseModel
+
+from src.llm.tokens import estimate_tokens
+from src.matching.skill_index import normalize_skill
+from src.models.experience_data import ExperienceData, ExperienceEntry
+from src.models.job_keywords import JobDescriptionKeywords
+
+logger = logging.getLogger(__name__)
+
+_K1 = 1.5
+_B = 0.75
+
+
+class TrimmedResume(BaseModel):
+    """The subset of a resume sent to the model plus what is needed to restore the rest."""
+
+    data: ExperienceData
+    entry_indices: list[int]
+    bullet_indices: dict[int, list[int]]
+    held_back_bullets: int = 0
+    held_back_items: int = 0
+
+    @property
+    def trimmed(self) -> bool:
+        return self.held_back_bullets > 0 or self.held_back_items > 0
+
+
+def _terms(text: str) -> list[str]:
+    return normalize_skill(text).split()
+
+
+def _query_terms(keywords: JobDescriptionKeywords) -> Counter[str]:
+    texts = [keywords.job_title, keywords.industry_domain, *keywords.keywords_for_ats, *keywords.key_responsibilities]
+    for requirement in keywords.skill_requirements:
+        texts.extend(requirement.skills)
+    return Counter(term for text in texts for term in _terms(text))
+
+
+def bm25_scores(documents: list[str], keywords: JobDescriptionKeywords) -> list[float]:
+    """Okapi BM25 score of each document against the extracted job keywords."""
+    tokenized = [_terms(document) for document in documents]
+    if not tokenized:
+        return []
+    query = _query_terms(keywords)
+    avg_length = sum(len(tokens) for tokens in tokenized) / len(tokenized) or 1.0
+    document_frequency = Counter(term for tokens in tokenized for term in set(tokens))
+    total = len(tokenized)
+
+    scores = []
+    for tokens in tokenized:
+        frequencies = Counter(tokens)
+        score = 0.0
+        for term, query_weight in query.items():
+            frequency = frequencies.get(term)
+            if not frequency:
+                continue
+            idf = math.log(1 + (total - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+            norm = frequency + _K1 * (1 - _B + _B * len(tokens) / avg_length)
+            score += query_weight * idf * frequency * (_K1 + 1) / norm
+        scores.append(score)
+    return scores
+
+
+def trim_to_budget(
+    experience_data: ExperienceData,
+    keywords: JobDescriptionKeywords,
+    token_budget: int,
+) -> TrimmedResume:
+    """Keep the bullets, publications and awards most relevant to the job within ``token_budget``.
+
+    Summary, skills and education are always kept. Ranked items are added
+    best-first (top-K) while the compact JSON stays under budget; selected items
+    keep their original order. Only entries with at least one selected bullet are
+    sent; the others are held back whole and re-added by :func:`restore_trimmed`.
+    """
+    bullets = [
+        (entry_index, bullet_index, bullet)
+        for entry_index, entry in enumerate(experience_data.experience)
+        for bullet_index, bullet in enumerate(entry.bullets)
+    ]
+    publications = experience_data.publications
+    awards = experience_data.awards
+    documents = (
+        [bullet for _, _, bullet in bullets]
+        + [f"{publication.title} {publication.conference}" for publication in publications]
+        + [f"{award.title} {award.award}" for award in awards]
+    )
+    scores = bm25_scores(documents, keywords)
+    ranked = sorted(range(len(documents)), key=lambda i: (-scores[i], i))
+
+    base = experience_data.model_copy(
+        update={
+            "experience": [entry.model_copy(update={"bullets": []}) for entry in experience_data.experience],
+            "publications": [],
+            "awards": [],
+        }
+    )
+    used = estimate_tokens(base.model_dump_json())
+    selected: set[int] = set()
+    for item in ranked:
+        cost = estimate_tokens(documents[item]) + 4
+        if used + cost > token_budget:
+            break
+        selected.add(item)
+        used += cost
+
+    bullet_indices: dict[int, list[int]] = {}
+    for item, (entry_index, bullet_index, _) in enumerate(bullets):
+        if item in selected:
+            bullet_indices.setdefault(entry_index, []).append(bullet_index)
+    entry_indices = [index for index in range(len(experience_data.experience)) if index in bullet_indices]
+    offset = len(bullets)
+    kept_publications = [p for i, p in enumerate(publications) if offset + i in selected]
+    offset += len(publications)
+    kept_awards = [a for i, a in enumerate(awards) if offset + i in selected]
+
+    data = experience_data.model_copy(
+        update={
+            "experience": [
+                _with_bullets(experience_data.experience[index], bullet_indices[index]) for index in entry_indices
+            ],
+            "publications": kept_publications,
+            "awards": kept_awards,
+        }
+    )
+    trimmed = TrimmedResume(
+        data=data,
+        entry_indices=entry_indices,
+        bullet_indices=bullet_indices,
+        held_back_bullets=len(bullets) - sum(len(indices) for indices in bullet_indices.values()),
+        held_back_items=len(publications) + len(awards) - len(kept_publications) - len(kept_awards),
+    )
+    if trimmed.trimmed:
+        logger.info(
+            "Trimmed resume to ~%d tokens: held back %d bullet(s) and %d publication/award(s)",
+            used,
+            trimmed.held_back_bullets,
+            trimmed.held_back_items,
+        )
+    return trimmed
+
+
+def restore_trimmed(
+    adjusted: ExperienceData,
+    trimmed: TrimmedResume,
+    original: ExperienceData,
+) -> ExperienceData:
+    """Merge everything that was held back from the model into its adjusted output unchanged.
+
+    Held-back bullets follow the adjusted bullets of their entry, held-back entries
+    follow the adjusted entries, and publications/awards are taken from the original.
+    """
+    by_header = {_header(original.experience[index]): index for index in trimmed.entry_indices}
+    seen: set[int] = set()
+    experience: list[ExperienceEntry] = []
+    for position, entry in enumerate(adjusted.experience):
+        index = by_header.get(_header(entry))
+        if index is None and position < len(trimmed.entry_indices):
+            index = trimmed.entry_indices[position]
+        if index is None or index in seen:
+            experience.append(entry)
+            continue
+        seen.add(index)
+        sent = set(trimmed.bullet_indices.get(index, []))
+        held_back = [bullet for i, bullet in enumerate(original.experience[index].bullets) if i not in sent]
+        experience.append(entry.model_copy(update={"bullets": [*entry.bullets, *held_back]}))
+
+    experience.extend(
+        entry.model_copy(deep=True)
+        for index, entry in enumerate(original.experience)
+        if index not in seen and index not in trimmed.bullet_indices
+    )
+    return adjusted.model_copy(
+        update={
+            "experience": experience,
+            "publications": [publication.model_copy() for publication in original.publications],
+            "awards": [award.model_copy() for award in original.awards],
+        }
+    )
+
+
+def _with_bullets(entry: ExperienceEntry, indices: list[int]) -> ExperienceEntry:
+    return entry.model_copy(update={"bullets": [entry.bullets[i] for i in indices]})
+
+
+def _header(entry: ExperienceEntry) -> tuple[str, str, str]:
+    return entry.title, entry.company, entry.date
@@ -0,0 +1,185 @@
+import re
+from collections import defaultdict
+from typing import Literal
+
+from pydantic import BaseModel
+
+from src.models.experience_data import ExperienceData
+from src.models.job_keywords import SkillCategory
+
+MatchDecision = Literal["present", "missing", "uncertain"]
+
+SKILL_ALIASES: dict[str, str] = {
+    "k8s": "kubernetes",
+    "kube": "kubernetes",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "py": "python",
+    "python3": "python",
+    "nodejs": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "gcp": "google cloud",
+    "google cloud platform": "google cloud",
+    "aws": "amazon web services",
+    "amazon aws": "amazon web services",
+    "ml": "machine learning",
+    "nlp": "natural language processing",
+    "llm": "large language models",
+    "llms": "large language models",
+    "ci/cd": "continuous integration",
+    "cicd": "continuous integration",
+    "sklearn": "scikit-learn",
+    "scikit learn": "scikit-learn",
+    "pytorch": "torch",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "cpp": "c++",
+    "rest api": "rest",
+    "restful": "rest",
+    "restful api": "rest",
+    "restful apis": "rest",
+    "rest apis": "rest",
+}
+
+# Abbreviations with several common meanings; a mention leaves each of them to the LLM.
+_AMBIGUOUS_ABBREVIATIONS: dict[str, frozenset[str]] = {
+    "tf": frozenset({"terraform", "tensorflow"}),
+    "dl": frozenset({"deep learning"}),
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by experience for from in into is knowledge of on or skills strong the to with "
+    "using working understanding proficiency familiarity years".split()
+)
+# Skills that are also everyday words; a lowercase token match says little about them.
+_COMMON_WORD_SKILLS = frozenset(
+    "access agile beam chef dart elm excel express flask go hive julia lean make office pig puppet rest ruby "
+    "rust salt shell spark spring storm swift word".split()
+)
+_LOCAL_CATEGORIES: frozenset[SkillCategory] = frozenset({"technical"})
+_MAX_LOCAL_TOKENS = 3
+_MAX_AMBIGUOUS_LENGTH = 2
+
+
+def _tokens(text: str) -> list[str]:
+    return [token.rstrip("./-") for token in _TOKEN_RE.findall(text.lower())]
+
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase, collapse whitespace and map known aliases (e.g. "k8s" -> "kubernetes")."""
+    normalized = " ".join(_tokens(skill))
+    if normalized in SKILL_ALIASES:
+        return SKILL_ALIASES[normalized]
+    return " ".join(SKILL_ALIASES.get(token, token) for token in normalized.split())
+
+
+def _is_ambiguous(tokens: list[str]) -> bool:
+    """Single short or common-word skills ("R", "Go", "Spring") that plain prose can mention by accident."""
+    return len(tokens) == 1 and (len(tokens[0]) <= _MAX_AMBIGUOUS_LENGTH or tokens[0] in _COMMON_WORD_SKILLS)
+
+
+class SkillEvidence(BaseModel):
+    listed: bool
+    experience_mentions: int
+    partial_overlap: bool
+
+
+class SkillIndex:
+    """Inverted index over the resume text for fast, alias-aware skill lookups.
+
+    Documents are the summary, each experience bullet and each publication/award
+    title; the skills section is kept separately so "listed" and "demonstrated"
+    can be told apart.
+    """
+
+    def __init__(self, experience_data: ExperienceData) -> None:
+        self._listed = {
+            normalize_skill(skill)
+            for skill in (*experience_data.skills.languages, *experience_data.skills.tools)
+        }
+        texts = [experience_data.summary]
+        for entry in experience_data.experience:
+            texts.extend([entry.title, *entry.bullets])
+        texts.extend(publication.title for publication in experience_data.publications)
+        texts.extend(award.title for award in experience_data.awards)
+
+        self._texts = texts
+        self._documents = [normalize_skill(text).split() for text in texts]
+        self._postings: dict[str, set[int]] = defaultdict(set)
+        for doc_id, tokens in enumerate(self._documents):
+            for token in tokens:
+                self._postings[token].add(doc_id)
+
+    def lookup(self, skill: str) -> SkillEvidence:
+        normalized = normalize_skill(skill)
+        tokens = normalized.split()
+        return SkillEvidence(
+            listed=normalized in self._listed,
+            experience_mentions=self._phrase_mentions(tokens),
+            partial_overlap=any(
+                token not in _STOPWORDS and len(token) > 2 and self._known(token) for token in tokens
+            ),
+        )
+
+    def classify(self, skill: str, category: SkillCategory) -> MatchDecision:
+        """Decide locally when the evidence is unambiguous; otherwise defer to the LLM.
+
+        Short or common-word skills only count as present when they are listed
+        in the skills section or written with the skill's own capitalization.
+        """
+        tokens = normalize_skill(skill).split()
+        if category not in _LOCAL_CATEGORIES or not tokens or len(tokens) > _MAX_LOCAL_TOKENS:
+            return "uncertain"
+        evidence = self.lookup(skill)
+        if evidence.experience_mentions > 0:
+            if _is_ambiguous(tokens) and not evidence.listed and not self._cased_mention(skill.strip()):
+                return "uncertain"
+            return "present"
+        if not evidence.listed and not evidence.partial_overlap and not self._abbreviated(" ".join(tokens)):
+            return "missing"
+        return "uncertain"
+
+    def _cased_mention(self, skill: str) -> bool:
+        """Whether ``skill`` appears verbatim, capitalized as given, other than as a sentence's first word."""
+        if skill == skill.lower():
+            return False
+        pattern = re.compile(rf"(?<![\w&+#./-]){re.escape(skill)}(?![\w&+#/-])")
+        for text in self._texts:
+            for match in pattern.finditer(text):
+                before = text[: match.start()].rstrip()
+                if before and not before.endswith((".", "!", "?", ":")):
+                    return True
+        return False
+
+    def _abbreviated(self, skill: str) -> bool:
+        """Whether the resume uses an ambiguous abbreviation that may stand for ``skill``."""
+        return any(
+            skill in meanings and (self._postings.get(abbreviation) or abbreviation in self._listed)
+            for abbreviation, meanings in _AMBIGUOUS_ABBREVIATIONS.items()
+        )
+
+    def _known(self, token: str) -> bool:
+        return bool(self._postings.get(token)) or any(token in skill.split() for skill in self._listed)
+
+    def _phrase_mentions(self, tokens: list[str]) -> int:
+        if not tokens:
+            return 0
+        candidates = set.intersection(*(self._postings.get(token, set()) for token in tokens))
+        width = len(tokens)
+        return sum(
+            1
+            for doc_id in candidates
+            if any(
+                self._documents[doc_id][i : i + width] == tokens
+                for i in range(len(self._documents[doc_id]) - width + 1)
+            )
+        )
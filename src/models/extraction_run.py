@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -11,3 +12,4 @@ class JobKeywordResult(BaseModel):
     timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
     source_url: str = Field(description="URL the keywords were extracted from")
     keywords: JobDescriptionKeywords
+    metadata: dict[str, Any] = Field(default_factory=dict)
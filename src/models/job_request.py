@@ -0,0 +1,22 @@
+from typing import Any
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class JobRequest(BaseModel):
+    """A job to tailor the resume for: a posting URL or the posting text itself."""
+
+    url: str | None = Field(default=None, description="Job posting URL, converted with Docling")
+    text: str | None = Field(default=None, description="Job description as markdown or plain text")
+    source: str | None = Field(default=None, description="Label recorded as the keywords' source_url")
+    metadata: dict[str, Any] = Field(default_factory=dict, description="Caller data stored with the keywords")
+
+    @model_validator(mode="after")
+    def _exactly_one_input(self) -> "JobRequest":
+        if (self.url is None) == (self.text is None):
+            raise ValueError("Provide exactly one of 'url' or 'text'")
+        return self
+
+    @property
+    def label(self) -> str:
+        return self.source or self.url or "inline-text"
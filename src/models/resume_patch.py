@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+
+from src.models.experience_data import Skills
+
+
+class BulletRewrite(BaseModel):
+    entry: int = Field(description="`entry` index of the experience entry")
+    bullet: int = Field(description="`bullet` index of the bullet within that entry")
+    text: str = Field(description="The rewritten bullet")
+
+
+class BulletOrder(BaseModel):
+    entry: int = Field(description="`entry` index of the experience entry")
+    order: list[int] = Field(description="Every `bullet` index of the entry exactly once, most relevant first")
+
+
+class ResumePatch(BaseModel):
+    """Edits to the candidate's resume; everything not mentioned stays exactly as it is."""
+
+    summary: str | None = Field(default=None, description="The rewritten summary, or null to keep it")
+    entry_order: list[int] = Field(
+        default=[], description="Every `entry` index exactly once, most relevant first; empty keeps the order"
+    )
+    bullet_rewrites: list[BulletRewrite] = Field(default=[], description="Bullets to replace, at most one per bullet")
+    bullet_orders: list[BulletOrder] = Field(default=[], description="Entries whose bullets should be reordered")
+    skills: Skills | None = Field(
+        default=None, description="The same skills with each category reordered, or null to keep the order"
+    )
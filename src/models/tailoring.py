@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+from src.models.experience_data import ExperienceData
+from src.models.job_keywords import JobDescriptionKeywords
+from src.models.skill_gap import SkillGapAnalysis
+
+
+class TailoredResume(BaseModel):
+    keywords: JobDescriptionKeywords = Field(description="Structured keywords extracted from the job description")
+    skill_gaps: SkillGapAnalysis = Field(description="Gaps between the candidate's resume and the job requirements")
+    adjusted_resume: ExperienceData = Field(description="The resume data tailored for this job")
@@ -0,0 +1,474 @@
+import asyncio
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
+
+from src.agents.adjust_data import adjust_data
+from src.agents.analyze_skill_gaps import analyze_skill_gaps
+from src.agents.extract_job_keywords import extract_job_keywords
+from src.agents.tailor_resume import tailor_resume
+from src.export.document_exporter import DocumentExporter
+from src.extraction.docling_worker_pool import DoclingWorkerPool
+from src.extraction.markdown_cache import MarkdownCache, normalize_url
+from src.extraction.markdown_cleaner import CLEANER_VERSION, CleaningStats, clean_job_markdown
+from src.extraction.provider import ExtractionError, MarkdownExtractor, converter_version
+from src.job_description_data_extraction import docling_url_to_markdown
+from src.llm.provider import LLMProvider
+from src.matching.near_duplicates import NearDuplicate, PostingIndex, Signature
+from src.matching.skill_index import SkillIndex
+from src.models.experience_data import ExperienceData
+from src.models.extraction_run import JobKeywordResult
+from src.models.job_keywords import JobDescriptionKeywords
+from src.models.job_request import JobRequest
+from src.models.skill_gap import SkillGapAnalysis
+from src.pipeline.run_manifest import RunManifest, StageRecord, content_hash
+from src.pipeline.scheduler import PipelineScheduler
+from src.prompts.prompter import Prompter
+from src.settings import Settings
+from src.storage.file_storage import FileStorage
+from src.storage.local_file_storage import LocalFileFileStorage
+from src.storage.sqlite_run_store import RunStore, url_hash
+from src.storage.write_behind import WriteBehindWriter
+from src.tracing.tracer import set_attribute, span
+
+logger = logging.getLogger(__name__)
+
+MAX_TRACKED_POSTINGS = 10_000
+
+
+def sanitize(name: str) -> str:
+    """Sanitize a string for use in filenames."""
+    return re.sub(r"[^\w\-]", "_", name).strip("_").lower()
+
+
+def build_output_dir(
+    base: str | Path, company: str = "base", title: str = "resume", source: str | None = None
+) -> Path:
+    """Per-job output folder; a short hash of ``source`` keeps same-minute jobs for the same role apart."""
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+    name = f"{timestamp}_{sanitize(company)}_{sanitize(title)}"
+    if source is not None:
+        name += f"_{url_hash(source)[:8]}"
+    return Path(base) / name
+
+
+class _JobContext:
+    """Per-job state threaded through the stages."""
+
+    def __init__(self, request: JobRequest, source: str, markdown: str) -> None:
+        self.request = request
+        self.label = request.label
+        self.source = source
+        self.markdown = markdown
+        self.markdown_hash = content_hash(markdown)
+        self.output_dir: Path | None = None
+        self.signature: Signature | None = None
+        # Artifacts saved through the writer; the job only succeeds once they are written.
+        self.saved: list[tuple[FileStorage, Path]] = []
+
+
+class JobPipeline:
+    """Tailors the resume for a single job posting, stage by stage.
+
+    With a :class:`RunManifest`, every stage is recorded with a hash of its inputs
+    and skipped on later runs while its inputs and artifacts are unchanged.
+    Identical postings within a run (same markdown) are tailored once, and with a
+    :class:`PostingIndex` near-duplicates of earlier postings reuse their keywords
+    (and gap analysis, when the resume and settings are unchanged).
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: Settings,
+        provider: LLMProvider,
+        exporter: DocumentExporter,
+        experience_data: ExperienceData,
+        personal_data: Dict[str, Any],
+        scheduler: PipelineScheduler,
+        docling_pool: DoclingWorkerPool | None = None,
+        markdown_cache: MarkdownCache | None = None,
+        manifest: RunManifest | None = None,
+        posting_index: PostingIndex | None = None,
+        extractor: MarkdownExtractor | None = None,
+        run_store: RunStore | None = None,
+        writer: WriteBehindWriter | None = None,
+    ) -> None:
+        self._settings = settings
+        self._provider = scheduler.limit_llm(provider)
+        self._exporter = exporter
+        self._experience_data = experience_data
+        self._personal_data = personal_data
+        self._scheduler = scheduler
+        self._docling_pool = docling_pool
+        self._markdown_cache = markdown_cache
+        self._manifest = manifest
+        self._posting_index = posting_index
+        self._extractor = extractor
+        self._run_store = run_store
+        self._writer = writer or WriteBehindWriter(
+            write_behind=False, transaction=run_store.batch if run_store is not None else None
+        )
+        self._converter_version = converter_version(extractor)
+        self.cleaning_stats = CleaningStats()
+        self._skill_index = SkillIndex(experience_data) if settings.skill_gap_mode == "hybrid" else None
+        self._resume_hash = content_hash(experience_data.model_dump_json())
+        self._model_tag = f"{settings.llm_provider}:{settings.llm_model or ''}"
+        self._render_hash = content_hash(
+            json.dumps(personal_data, sort_keys=True, default=str),
+            settings.md_j2_template.read_text(encoding="utf-8") if settings.md_j2_template.exists() else "",
+            settings.pdf_paper_size,
+            str(settings.pdf_font_size),
+        )
+        self._postings: OrderedDict[str, asyncio.Future[Path]] = OrderedDict()
+
+    async def process(self, url: str) -> Path:
+        return await self.process_request(JobRequest(url=url))
+
+    async def process_request(self, request: JobRequest) -> Path:
+        with span("job", job=request.label):
+            return await self._process(request)
+
+    async def _process(self, request: JobRequest) -> Path:
+        source = self._source_key(request)
+        markdown_content = await self._job_markdown(request, source)
+        job = _JobContext(request, source, markdown_content)
+
+        existing = self._postings.get(job.markdown_hash)
+        if existing is not None:
+            logger.info("Identical posting already processed in this run, reusing its result: %s", job.label)
+            return await asyncio.shield(existing)
+        future: asyncio.Future[Path] = asyncio.get_running_loop().create_future()
+        self._postings[job.markdown_hash] = future
+        try:
+            output_path = await self._tailor_and_export(job)
+            await self._settle(job)
+        except Exception as exc:
+            del self._postings[job.markdown_hash]
+            future.set_exception(exc)
+            future.exception()  # Mark retrieved when no duplicate is waiting.
+            raise
+        except BaseException:
+            del self._postings[job.markdown_hash]
+            future.cancel()
+            raise
+        future.set_result(output_path)
+        self._forget_old_postings()
+        return output_path
+
+    async def _tailor_and_export(self, job: _JobContext) -> Path:
+        if self._settings.tailoring_mode == "fused":
+            adjusted = await self._tailor_fused(job)
+        else:
+            adjusted = await self._tailor_staged(job)
+
+        output_path = job.output_dir / self._settings.pdf_filename
+        pdf_hash = content_hash(adjusted.model_dump_json(), self._render_hash)
+        if self._completed(job, "pdf", pdf_hash) is not None:
+            logger.info("Resume already rendered for %s: %s", job.label, output_path)
+            return output_path
+
+        combined = {**adjusted.model_dump(), **self._personal_data}
+        # Artifacts are written behind (or to the run store), so the folder may not exist yet.
+        await asyncio.to_thread(job.output_dir.mkdir, parents=True, exist_ok=True)
+        async with self._scheduler.stage("pdf"):
+            await self._exporter.export_async(combined, output_path)
+        self._record(job, "pdf", pdf_hash, self._settings.pdf_filename)
+
+        logger.info("Generated tailored resume: %s", output_path)
+        return output_path
+
+    async def _job_markdown(self, request: JobRequest, source: str) -> str:
+        if request.text is not None:
+            logger.info("Processing inline job description: %s", request.label)
+            return self._clean(request.text, "inline")
+
+        logger.info("Processing job URL: %s", request.url)
+        record = self._completed_source(source, "markdown", self._markdown_input_hash(source))
+        if record is not None:
+            markdown = await self._writer.load_text(
+                self.storage(record.output_dir), Path(self._settings.job_description_filename)
+            )
+            if markdown is not None:
+                logger.info("Reusing converted job description for %s", request.url)
+                return markdown
+
+        markdown = await self._convert(request.url)
+        logger.info("Extracted %d chars of markdown from %s", len(markdown), request.url)
+        return self._clean(markdown, urlsplit(request.url).hostname or "unknown")
+
+    def _clean(self, markdown: str, board: str) -> str:
+        settings = self._settings
+        if not settings.markdown_cleaning:
+            return markdown
+        with span("clean"):
+            cleaned = clean_job_markdown(markdown, token_budget=settings.job_description_token_budget)
+            set_attribute("board", board)
+            set_attribute("tokens_before", cleaned.tokens_before)
+            set_attribute("tokens_after", cleaned.tokens_after)
+        self.cleaning_stats.add(board, cleaned)
+        logger.info(
+            "Cleaned job description from %s: ~%d -> ~%d tokens (%d block(s) dropped%s)",
+            board,
+            cleaned.tokens_before,
+            cleaned.tokens_after,
+            cleaned.blocks_dropped,
+            ", truncated" if cleaned.truncated else "",
+        )
+        return cleaned.markdown
+
+    async def _tailor_staged(self, job: _JobContext) -> ExperienceData:
+        keywords_hash = content_hash(job.markdown_hash, Prompter.version("extract_job_keywords"), self._model_tag)
+        result = await self._reload(job, "keywords", keywords_hash, JobKeywordResult, self._settings.keywords_filename)
+        near_duplicate = None
+        if result is not None:
+            keywords = result.keywords
+        else:
+            near_duplicate = await self._find_near_duplicate(job)
+            reused = await self._load_near_duplicate(near_duplicate, JobKeywordResult, self._settings.keywords_filename)
+            keywords = reused.keywords if reused else await extract_job_keywords(job.markdown, self._provider)
+            await self._save_keywords(job, keywords, keywords_hash)
+
+        budget = self._settings.prompt_resume_token_budget
+        gaps_hash = content_hash(
+            keywords.model_dump_json(),
+            self._resume_hash,
+            Prompter.version("analyze_skill_gaps"),
+            self._settings.skill_gap_mode,
+            str(budget),
+            self._model_tag,
+        )
+        gaps = await self._reload(job, "gaps", gaps_hash, SkillGapAnalysis, self._settings.gaps_filename)
+        if gaps is None and near_duplicate is not None and near_duplicate.gaps_key == gaps_hash:
+            gaps = await self._load_near_duplicate(near_duplicate, SkillGapAnalysis, self._settings.gaps_filename)
+            if gaps is not None:
+                await self._save(job, gaps, self._settings.gaps_filename)
+                self._record(job, "gaps", gaps_hash, self._settings.gaps_filename)
+        if gaps is None:
+            gaps = await analyze_skill_gaps(
+                self._experience_data,
+                keywords,
+                self._provider,
+                self._skill_index,
+                token_budget=budget,
+            )
+            await self._save(job, gaps, self._settings.gaps_filename)
+            self._record(job, "gaps", gaps_hash, self._settings.gaps_filename)
+        if near_duplicate is None:
+            await self._index_posting(job, gaps_key=gaps_hash)
+
+        adjusted_hash = content_hash(
+            keywords.model_dump_json(),
+            gaps.model_dump_json(),
+            self._resume_hash,
+            Prompter.version("adjust_data"),
+            Prompter.version("adjust_data_patch") if self._settings.adjust_output == "patch" else "full",
+            str(budget),
+            self._model_tag,
+        )
+        adjusted = await self._reload(job, "adjusted", adjusted_hash, ExperienceData, self._settings.adjusted_filename)
+        if adjusted is None:
+            adjusted = await adjust_data(
+                self._experience_data,
+                keywords,
+                gaps,
+                self._provider,
+                token_budget=budget,
+                patch=self._settings.adjust_output == "patch",
+            )
+            await self._save(job, adjusted, self._settings.adjusted_filename)
+            self._record(job, "adjusted", adjusted_hash, self._settings.adjusted_filename)
+        return adjusted
+
+    async def _tailor_fused(self, job: _JobContext) -> ExperienceData:
+        fused_hash = content_hash(
+            job.markdown_hash, self._resume_hash, Prompter.version("tailor_resume"), self._model_tag
+        )
+        adjusted = await self._reload(job, "fused", fused_hash, ExperienceData, self._settings.adjusted_filename)
+        if adjusted is not None:
+            return adjusted
+
+        tailored = await tailor_resume(job.markdown, self._experience_data, self._provider)
+        await self._save_keywords(job, tailored.keywords, fused_hash)
+        await self._save(job, tailored.skill_gaps, self._settings.gaps_filename)
+        await self._save(job, tailored.adjusted_resume, self._settings.adjusted_filename)
+        self._record(
+            job,
+            "fused",
+            fused_hash,
+            self._settings.keywords_filename,
+            self._settings.gaps_filename,
+            self._settings.adjusted_filename,
+        )
+        # Fused gaps come from a different prompt, so only the keywords are offered for reuse.
+        await self._index_posting(job, gaps_key=None)
+        return tailored.adjusted_resume
+
+    async def _find_near_duplicate(self, job: _JobContext) -> NearDuplicate | None:
+        if self._posting_index is None:
+            return None
+        job.signature = await asyncio.to_thread(self._posting_index.hasher.signature, job.markdown)
+        match = await asyncio.to_thread(self._posting_index.find, job.signature)
+        if match is not None:
+            logger.info(
+                "%s is a near-duplicate (similarity %.2f) of %s; reusing its results",
+                job.label,
+                match.similarity,
+                match.source,
+            )
+        return match
+
+    async def _load_near_duplicate[T: BaseModel](
+        self, match: NearDuplicate | None, model: type[T], filename: str
+    ) -> T | None:
+        if match is None:
+            return None
+        return await self._writer.load_model(self.storage(match.output_dir), model, Path(filename))
+
+    async def _index_posting(self, job: _JobContext, gaps_key: str | None) -> None:
+        if self._posting_index is None:
+            return
+        if job.signature is None:
+            job.signature = await asyncio.to_thread(self._posting_index.hasher.signature, job.markdown)
+        await asyncio.to_thread(self._posting_index.add, job.signature, job.label, job.output_dir, gaps_key)
+
+    def _forget_old_postings(self) -> None:
+        """Bound the dedupe table so memory stays flat on very large streamed runs."""
+        while len(self._postings) > MAX_TRACKED_POSTINGS:
+            oldest, future = next(iter(self._postings.items()))
+            if not future.done():
+                break
+            del self._postings[oldest]
+
+    async def _save_keywords(self, job: _JobContext, keywords: JobDescriptionKeywords, input_hash: str) -> None:
+        """Assign the job's output directory and persist the keywords and job description."""
+        previous = self._manifest.output_dir(job.source) if self._manifest else None
+        job.output_dir = previous or build_output_dir(
+            self._settings.output_dir, keywords.company_name, keywords.job_title, job.source
+        )
+        await self._save(
+            job,
+            JobKeywordResult(source_url=job.label, keywords=keywords, metadata=job.request.metadata),
+            self._settings.keywords_filename,
+        )
+        await self._save(job, job.markdown, self._settings.job_description_filename)
+        if job.request.url is not None:
+            self._record(
+                job, "markdown", self._markdown_input_hash(job.source), self._settings.job_description_filename
+            )
+        if self._settings.tailoring_mode == "staged":
+            self._record(job, "keywords", input_hash, self._settings.keywords_filename)
+
+    async def _save(self, job: _JobContext, data: BaseModel | str, filename: str) -> None:
+        storage, path = self._job_storage(job), Path(filename)
+        if isinstance(data, str):
+            await self._writer.save_text(storage, data, path)
+        else:
+            await self._writer.save_model(storage, data, path)
+        job.saved.append((storage, path))
+
+    async def _settle(self, job: _JobContext) -> None:
+        """Fail the job if one of its artifacts could not be written."""
+        for storage, path in job.saved:
+            await self._writer.settle(storage, [path])
+
+    def storage(self, directory: Path) -> FileStorage:
+        """Where the artifacts of the job in ``directory`` are kept (its folder or the run store)."""
+        if self._run_store is not None:
+            return self._run_store.storage(directory)
+        return LocalFileFileStorage(base_dir=directory)
+
+    def _job_storage(self, job: _JobContext) -> FileStorage:
+        assert job.output_dir is not None, "output directory is assigned by the keywords stage"
+        return self.storage(job.output_dir)
+
+    async def _reload[T: BaseModel](
+        self, job: _JobContext, stage: str, input_hash: str, model: type[T], filename: str
+    ) -> T | None:
+        record = self._completed(job, stage, input_hash)
+        if record is None:
+            return None
+        loaded = await self._writer.load_model(self.storage(record.output_dir), model, Path(filename))
+        if loaded is None:
+            return None
+        job.output_dir = record.output_dir
+        logger.info("Reusing %s stage for %s from %s", stage, job.label, record.output_dir)
+        return loaded
+
+    def _completed(self, job: _JobContext, stage: str, input_hash: str) -> StageRecord | None:
+        return self._completed_source(job.source, stage, input_hash)
+
+    def _completed_source(self, source: str, stage: str, input_hash: str) -> StageRecord | None:
+        if self._manifest is None:
+            return None
+        return self._manifest.completed(source, stage, input_hash)
+
+    def _record(self, job: _JobContext, stage: str, input_hash: str, *artifacts: str) -> None:
+        """Record the stage once its artifacts are saved, so a failed write is never marked done."""
+        if self._manifest is None:
+            return
+        manifest, source, output_dir = self._manifest, job.source, job.output_dir
+        self._writer.after(
+            self.storage(output_dir),
+            [Path(artifact) for artifact in artifacts],
+            lambda: manifest.record(source, stage, input_hash, output_dir, *artifacts),
+        )
+
+    @staticmethod
+    def _source_key(request: JobRequest) -> str:
+        if request.url is not None:
+            return normalize_url(request.url)
+        return f"text:{content_hash(request.text)}"
+
+    def _markdown_input_hash(self, source: str) -> str:
+        settings = self._settings
+        if not settings.markdown_cleaning:
+            return content_hash(source, self._converter_version)
+        cleaning = f"clean-{CLEANER_VERSION}:{settings.job_description_token_budget}"
+        return content_hash(source, self._converter_version, cleaning)
+
+    async def _convert(self, url: str) -> str:
+        with span("extract"):
+            return await self._lookup_or_convert(url)
+
+    async def _lookup_or_convert(self, url: str) -> str:
+        if self._markdown_cache is None:
+            return await self._extract(url)
+
+        cached = await asyncio.to_thread(self._markdown_cache.get, url)
+        set_attribute("cache", "hit" if cached is not None else "miss")
+        if cached is not None:
+            logger.info("Conversion cache hit for %s", url)
+            return cached
+
+        started = time.perf_counter()
+        markdown = await self._extract(url)
+        await asyncio.to_thread(self._markdown_cache.put, url, markdown, time.perf_counter() - started)
+        return markdown
+
+    async def _extract(self, url: str) -> str:
+        if self._extractor is not None:
+            try:
+                markdown = await asyncio.to_thread(self._extractor.extract, url)
+            except ExtractionError as exc:
+                logger.info("Falling back to Docling for %s: %s", url, exc)
+            else:
+                set_attribute("extractor", self._extractor.name)
+                return markdown
+        set_attribute("extractor", "docling")
+        with span("docling"):
+            return await self._run_docling(url)
+
+    async def _run_docling(self, url: str) -> str:
+        if self._docling_pool is None:
+            return await self._scheduler.offload("docling", docling_url_to_markdown, url)
+        async with self._scheduler.stage("docling"):
+            return await self._docling_pool.convert(url)
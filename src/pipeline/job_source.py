@@ -0,0 +1,56 @@
+import asyncio
+import json
+import logging
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import TextIO
+
+from pydantic import ValidationError
+
+from src.models.job_request import JobRequest
+
+logger = logging.getLogger(__name__)
+
+STDIN = "-"
+
+
+def parse_job_line(line: str) -> JobRequest | None:
+    """Parse one JSON Lines record: a bare URL string or a ``JobRequest`` object.
+
+    Returns None for blank and comment lines; raises ValueError for malformed ones.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    record = json.loads(line)
+    if isinstance(record, str):
+        return JobRequest(url=record)
+    return JobRequest.model_validate(record)
+
+
+async def read_job_requests(source: Path | str) -> AsyncIterator[JobRequest]:
+    """Stream job requests from a JSON Lines file, or stdin when ``source`` is ``"-"``.
+
+    Lines are read one at a time on a worker thread, so only the jobs currently
+    being processed are held in memory. Malformed lines are logged and skipped.
+    """
+    stream: TextIO = sys.stdin if str(source) == STDIN else open(source, encoding="utf-8")
+    skipped = 0
+    try:
+        line_number = 0
+        while line := await asyncio.to_thread(stream.readline):
+            line_number += 1
+            try:
+                request = parse_job_line(line)
+            except (ValueError, ValidationError) as exc:
+                skipped += 1
+                logger.warning("Skipping invalid job on line %d: %s", line_number, exc)
+                continue
+            if request is not None:
+                yield request
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if skipped:
+            logger.warning("Skipped %d invalid job line(s) from %s", skipped, source)
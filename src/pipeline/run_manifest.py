@@ -0,0 +1,95 @@
+import hashlib
+import logging
+import threading
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(*parts: str) -> str:
+    """Stable hash of the inputs a stage depends on."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class StageRecord(BaseModel):
+    source: str = Field(description="Normalized job URL or a hash of inline job text")
+    stage: str
+    input_hash: str
+    output_dir: Path
+    artifacts: list[str] = Field(default_factory=list, description="Files in output_dir written by the stage")
+    completed_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+
+
+class RunManifest:
+    """Append-only JSONL log of completed stages, replayed on start-up to resume a run.
+
+    A stage counts as done only if it was recorded with the same input hash and
+    all of its artifacts still exist (``artifact_exists``, by default on disk),
+    so editing the resume, a prompt or the template invalidates exactly the
+    stages that depend on it.
+    """
+
+    def __init__(self, path: Path, artifact_exists: Callable[[Path], bool] = Path.exists) -> None:
+        self._path = Path(path)
+        self._artifact_exists = artifact_exists
+        self._lock = threading.Lock()
+        self._records: dict[tuple[str, str], StageRecord] = {}
+        self._output_dirs: dict[str, Path] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def completed(self, source: str, stage: str, input_hash: str) -> StageRecord | None:
+        record = self._records.get((source, stage))
+        if record is None or record.input_hash != input_hash:
+            return None
+        if not all(self._artifact_exists(record.output_dir / artifact) for artifact in record.artifacts):
+            return None
+        return record
+
+    def output_dir(self, source: str) -> Path | None:
+        """Output directory assigned to ``source`` by an earlier run, if any."""
+        return self._output_dirs.get(source)
+
+    def record(self, source: str, stage: str, input_hash: str, output_dir: Path, *artifacts: str) -> None:
+        entry = StageRecord(
+            source=source,
+            stage=stage,
+            input_hash=input_hash,
+            output_dir=output_dir,
+            artifacts=list(artifacts),
+        )
+        with self._lock:
+            self._records[(source, stage)] = entry
+            self._output_dirs[source] = output_dir
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("a", encoding="utf-8") as f:
+                f.write(entry.model_dump_json() + "\n")
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        skipped = 0
+        for line in self._path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = StageRecord.model_validate_json(line)
+            except ValidationError:
+                # A crash mid-write leaves a truncated last line; ignore it.
+                skipped += 1
+                continue
+            self._records[(entry.source, entry.stage)] = entry
+            self._output_dirs[entry.source] = entry.output_dir
+        logger.info("Loaded run manifest %s with %d completed stage(s)", self._path, len(self._records))
+        if skipped:
+            logger.warning("Skipped %d unreadable line(s) in %s", skipped, self._path)
@@ -0,0 +1,368 @@
+import hashlib
+import logging
+import os
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+from typing import Any, Dict
+
+from dotenv import dotenv_values
+
+from src.export.document_exporter import DocumentExporter
+from src.export.markdown_to_pdf_exporter import MarkdownToPDFExporter
+from src.export.node_worker_pdf_exporter import NodeWorkerPDFExporter
+from src.extraction.docling_worker_pool import DoclingWorkerPool
+from src.extraction.html_extractor import HTMLMarkdownExtractor
+from src.extraction.markdown_cache import MarkdownCache, http_not_modified_revalidator, normalize_url
+from src.extraction.provider import converter_version
+from src.llm.cached_provider import CachingLLMProvider, ResponseCacheStore
+from src.llm.factory import create_batch_llm_provider, create_llm_provider
+from src.llm.provider import LLMProvider
+from src.llm.resilient_provider import ProviderRateLimiter, RateLimits, ResilientLLMProvider
+from src.llm.routing_provider import RoutingLLMProvider
+from src.llm.traced_provider import TracingLLMProvider
+from src.matching.near_duplicates import PostingIndex
+from src.models.experience_data import ExperienceData
+from src.models.job_request import JobRequest
+from src.pipeline.job_pipeline import JobPipeline
+from src.pipeline.run_manifest import RunManifest
+from src.pipeline.scheduler import JobOutcome, OutcomeTally, PipelineScheduler, StageLimits
+from src.rendering.jinja_renderer import Jinja2TemplateRenderer
+from src.settings import ENV_FILE, LLMBackend, Settings
+from src.storage.file_storage import FileStorage
+from src.storage.sqlite_run_store import RunStore
+from src.storage.write_behind import WriteBehindWriter
+from src.tracing.tracer import Tracer
+
+logger = logging.getLogger(__name__)
+
+
+def stage_limits(settings: Settings) -> StageLimits:
+    """Scheduler limits for the configured LLM mode.
+
+    Batch calls only park a future until their batch completes, so in batch mode
+    up to a full batch of jobs runs at once: every job's keyword prompt lands in
+    one batch, then every gap prompt, then every adjust prompt.
+    """
+    jobs = settings.max_concurrent_jobs
+    llm = settings.llm_concurrency
+    if settings.llm_mode == "batch":
+        jobs = max(jobs, settings.llm_batch_max_size)
+        llm = max(llm, jobs)
+    return StageLimits(
+        jobs=jobs,
+        docling=settings.docling_concurrency,
+        llm=llm,
+        pdf=settings.pdf_concurrency,
+    )
+
+
+class PipelineRuntime:
+    """Everything a tailoring run needs, built once from settings and kept warm.
+
+    The CLI builds one per invocation; ``serve`` mode keeps one for the lifetime
+    of the process so provider clients, the Docling converter, the compiled
+    template and the PDF workers are reused across requests.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        experience_data: ExperienceData,
+        personal_data: Dict[str, Any],
+    ) -> None:
+        self.settings = settings
+        self.response_cache: ResponseCacheStore | None = None
+        self.caching_providers: list[CachingLLMProvider] = []
+        self.provider = self._build_provider()
+        self.exporter = self._build_exporter()
+        self.scheduler = PipelineScheduler(stage_limits(settings))
+        self.docling_pool = (
+            DoclingWorkerPool(
+                workers=settings.docling_workers,
+                max_documents_per_worker=settings.docling_max_documents_per_worker,
+                max_rss_mb=settings.docling_max_rss_mb,
+            )
+            if settings.docling_workers
+            else None
+        )
+        self.extractor = HTMLMarkdownExtractor(min_words=settings.html_min_words) if settings.html_extraction else None
+        self.markdown_cache = (
+            MarkdownCache(
+                settings.conversion_cache_dir,
+                converter_version=converter_version(self.extractor),
+                ttl_seconds=settings.conversion_cache_ttl_hours * 3600
+                if settings.conversion_cache_ttl_hours is not None
+                else None,
+                max_bytes=settings.conversion_cache_max_mb * 1024 * 1024
+                if settings.conversion_cache_max_mb is not None
+                else None,
+                revalidate=http_not_modified_revalidator if settings.conversion_cache_revalidate else None,
+            )
+            if settings.conversion_cache_dir
+            else None
+        )
+        self.posting_index = (
+            PostingIndex(settings.posting_index_path, threshold=settings.near_duplicate_threshold)
+            if settings.posting_index_path
+            else None
+        )
+        self.run_store = RunStore(settings.run_store_path) if settings.run_store_path else None
+        self.writer = WriteBehindWriter(
+            durability=settings.storage_durability,
+            max_batch=settings.storage_max_batch,
+            write_behind=settings.storage_write_behind,
+            transaction=self.run_store.batch if self.run_store is not None else None,
+        )
+        self.pipeline = JobPipeline(
+            settings=settings,
+            provider=self.provider,
+            exporter=self.exporter,
+            experience_data=experience_data,
+            personal_data=personal_data,
+            scheduler=self.scheduler,
+            docling_pool=self.docling_pool,
+            markdown_cache=self.markdown_cache,
+            manifest=RunManifest(
+                settings.run_manifest_path,
+                artifact_exists=self.run_store.has if self.run_store is not None else Path.exists,
+            )
+            if settings.run_manifest_path
+            else None,
+            posting_index=self.posting_index,
+            extractor=self.extractor,
+            run_store=self.run_store,
+            writer=self.writer,
+        )
+        self.tracer = Tracer(trace_dir=settings.trace_dir, prices=settings.llm_prices)
+        if self.tracer.path is not None:
+            logger.info("Writing trace to %s", self.tracer.path)
+
+    async def start(self) -> None:
+        if self.docling_pool is not None:
+            await self.docling_pool.start()
+        if isinstance(self.exporter, NodeWorkerPDFExporter):
+            await self.exporter.start()
+
+    async def run(self, job_urls: list[str]) -> list[JobOutcome]:
+        seen: set[str] = set()
+        unique = []
+        for url in job_urls:
+            if (key := normalize_url(url)) not in seen:
+                seen.add(key)
+                unique.append(url)
+        if len(unique) < len(job_urls):
+            logger.info("Skipping %d duplicate job URL(s)", len(job_urls) - len(unique))
+        with self.tracer.activate():
+            return await self.scheduler.run(unique, self.pipeline.process)
+
+    async def stream(self, requests: AsyncIterable[JobRequest]) -> OutcomeTally:
+        """Process a (possibly unbounded) stream of requests, keeping only running totals."""
+        tally = OutcomeTally()
+        with self.tracer.activate():
+            async for outcome in self.scheduler.stream(
+                _unique_requests(requests), self.pipeline.process_request, label=lambda request: request.label
+            ):
+                tally.add(outcome)
+        return tally
+
+    async def process(self, request: JobRequest) -> Path:
+        with self.tracer.activate():
+            return await self.pipeline.process_request(request)
+
+    async def artifacts(self, output_dir: Path) -> FileStorage:
+        """Storage holding a finished job's artifacts, once queued writes have reached it."""
+        await self.writer.idle()
+        return self.pipeline.storage(output_dir)
+
+    async def aclose(self) -> None:
+        # Drain queued artifact writes first; they still report storage spans to the tracer.
+        await self.writer.aclose()
+        await self.provider.aclose()
+        self.tracer.close()
+        if self.docling_pool is not None:
+            await self.docling_pool.close()
+        if isinstance(self.exporter, NodeWorkerPDFExporter):
+            await self.exporter.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.posting_index is not None:
+            self.posting_index.close()
+        if self.run_store is not None:
+            self.run_store.close()
+        self.scheduler.shutdown()
+
+    async def __aenter__(self) -> "PipelineRuntime":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def log_summary(self) -> None:
+        logger.info(self.tracer.summary())
+        if len(self.pipeline.cleaning_stats):
+            logger.info(self.pipeline.cleaning_stats.summary())
+        if self.caching_providers:
+            logger.info(
+                "LLM response cache: %d hit(s), %d miss(es)",
+                sum(caching.hits for caching in self.caching_providers),
+                sum(caching.misses for caching in self.caching_providers),
+            )
+        if self.markdown_cache is not None:
+            session = self.markdown_cache.stats
+            lifetime = self.markdown_cache.save_stats()
+            logger.info(
+                "Conversion cache: %d hit(s), %d miss(es), %.1f KB served, %.1fs conversion saved "
+                "(lifetime: %d hits, %.1fs saved)",
+                session.hits,
+                session.misses,
+                session.bytes_served / 1024,
+                session.conversion_seconds_saved,
+                lifetime.hits,
+                lifetime.conversion_seconds_saved,
+            )
+
+    def _build_provider(self) -> LLMProvider:
+        settings = self.settings
+        if settings.llm_cache_path:
+            self.response_cache = ResponseCacheStore(
+                settings.llm_cache_path,
+                max_entries=settings.llm_cache_max_entries,
+                max_age_seconds=settings.llm_cache_max_age_days * 86400
+                if settings.llm_cache_max_age_days is not None
+                else None,
+            )
+            logger.info("LLM response cache: %s (mode=%s)", settings.llm_cache_path, settings.llm_cache_mode)
+        if settings.llm_mode == "batch":
+            provider = self._cached(
+                create_batch_llm_provider(
+                    llm_provider=settings.llm_provider,
+                    llm_api_key=settings.llm_api_key.get_secret_value(),
+                    model=settings.llm_model,
+                    collect_window=settings.llm_batch_collect_window_s,
+                    max_batch_size=settings.llm_batch_max_size,
+                    poll_interval=settings.llm_batch_poll_interval_s,
+                )
+            )
+        elif settings.llm_backends:
+            # Backends fail fast so the router fails over and times single attempts;
+            # transient-error retries wrap the router as a whole. Each backend caches
+            # under its own provider and model.
+            limiter = self._rate_limiter()
+            router = RoutingLLMProvider(
+                {
+                    name: self._cached(
+                        self._resilient(
+                            create_llm_provider(
+                                llm_provider=backend.provider,
+                                llm_api_key=self._backend_api_key(backend),
+                                model=backend.model,
+                                context_cache_ttl_s=settings.llm_context_cache_ttl_s,
+                                context_cache_min_tokens=settings.llm_context_cache_min_tokens,
+                            ),
+                            limiter,
+                            max_retries=0,
+                        )
+                    )
+                    for name, backend in settings.llm_backends.items()
+                },
+                pins=settings.llm_stage_backends,
+            )
+            provider = ResilientLLMProvider(
+                router,
+                max_retries=settings.llm_max_retries,
+                backoff_base=settings.llm_backoff_base_s,
+                backoff_max=settings.llm_backoff_max_s,
+                validation_retries=0,
+            )
+            logger.info("Routing LLM calls across backends: %s", ", ".join(settings.llm_backends))
+        else:
+            provider = self._cached(
+                self._resilient(
+                    create_llm_provider(
+                        llm_provider=settings.llm_provider,
+                        llm_api_key=settings.llm_api_key.get_secret_value(),
+                        model=settings.llm_model,
+                        context_cache_ttl_s=settings.llm_context_cache_ttl_s,
+                        context_cache_min_tokens=settings.llm_context_cache_min_tokens,
+                    ),
+                    self._rate_limiter(),
+                )
+            )
+        return TracingLLMProvider(provider)
+
+    def _cached(self, provider: LLMProvider) -> LLMProvider:
+        if self.response_cache is None:
+            return provider
+        caching = CachingLLMProvider(provider, self.response_cache, mode=self.settings.llm_cache_mode)
+        self.caching_providers.append(caching)
+        return caching
+
+    def _rate_limiter(self) -> ProviderRateLimiter:
+        return ProviderRateLimiter(
+            default=RateLimits(
+                requests_per_minute=self.settings.llm_requests_per_minute,
+                tokens_per_minute=self.settings.llm_tokens_per_minute,
+            )
+        )
+
+    def _resilient(
+        self,
+        provider: LLMProvider,
+        limiter: ProviderRateLimiter,
+        max_retries: int | None = None,
+    ) -> ResilientLLMProvider:
+        settings = self.settings
+        return ResilientLLMProvider(
+            provider,
+            limiter=limiter,
+            max_retries=settings.llm_max_retries if max_retries is None else max_retries,
+            backoff_base=settings.llm_backoff_base_s,
+            backoff_max=settings.llm_backoff_max_s,
+            validation_retries=settings.llm_validation_retries,
+            hedge_percentile=settings.llm_hedge_percentile,
+        )
+
+    def _backend_api_key(self, backend: LLMBackend) -> str:
+        if backend.api_key_env:
+            key = os.environ.get(backend.api_key_env) or dotenv_values(ENV_FILE).get(backend.api_key_env)
+            if not key:
+                raise ValueError(f"Environment variable {backend.api_key_env} is not set")
+            return key
+        return self.settings.llm_api_key.get_secret_value()
+
+    def _build_exporter(self) -> DocumentExporter:
+        settings = self.settings
+        renderer = Jinja2TemplateRenderer(settings.md_j2_template, settings.template_bytecode_cache_dir)
+        if settings.pdf_workers:
+            return NodeWorkerPDFExporter(
+                renderer=renderer,
+                cli_path=settings.cli_converter_path,
+                paper=settings.pdf_paper_size,
+                font_size=settings.pdf_font_size,
+                workers=settings.pdf_workers,
+                job_timeout=settings.pdf_job_timeout_s,
+                stylesheets=settings.pdf_worker_stylesheets,
+            )
+        return MarkdownToPDFExporter(
+            renderer=renderer,
+            cli_path=settings.cli_converter_path,
+            paper=settings.pdf_paper_size,
+            font_size=settings.pdf_font_size,
+        )
+
+
+async def _unique_requests(requests: AsyncIterable[JobRequest]) -> AsyncIterator[JobRequest]:
+    """Drop repeated URLs; only a 16-byte digest per URL is kept."""
+    seen: set[bytes] = set()
+    duplicates = 0
+    async for request in requests:
+        if request.url is not None:
+            digest = hashlib.blake2b(normalize_url(request.url).encode("utf-8"), digest_size=16).digest()
+            if digest in seen:
+                duplicates += 1
+                continue
+            seen.add(digest)
+        yield request
+    if duplicates:
+        logger.info("Skipped %d duplicate job URL(s)", duplicates)
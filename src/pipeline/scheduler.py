@@ -0,0 +1,199 @@
+import asyncio
+import contextlib
+import contextvars
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from src.llm.limited_provider import ConcurrencyLimitedLLMProvider
+from src.llm.provider import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+Stage = Literal["docling", "llm", "pdf"]
+
+
+class StageLimits(BaseModel):
+    jobs: int = Field(default=4, ge=1, description="Jobs processed concurrently")
+    docling: int = Field(default=1, ge=1, description="Docling conversions in flight")
+    llm: int = Field(default=8, ge=1, description="LLM calls in flight")
+    pdf: int = Field(default=2, ge=1, description="PDF renders in flight")
+
+
+class JobOutcome(BaseModel):
+    source: str
+    output_path: Path | None = None
+    error: str | None = None
+    duration_s: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class PipelineScheduler:
+    """Runs many jobs at once while bounding each pipeline stage independently.
+
+    Blocking stages (Docling, the PDF subprocess) are offloaded to a thread pool
+    so they never stall the event loop.
+    """
+
+    def __init__(self, limits: StageLimits | None = None) -> None:
+        self._limits = limits or StageLimits()
+        self._semaphores: dict[Stage, asyncio.Semaphore] = {
+            "docling": asyncio.Semaphore(self._limits.docling),
+            "llm": asyncio.Semaphore(self._limits.llm),
+            "pdf": asyncio.Semaphore(self._limits.pdf),
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._limits.docling + self._limits.pdf,
+            thread_name_prefix="pipeline",
+        )
+
+    @property
+    def limits(self) -> StageLimits:
+        return self._limits
+
+    @asynccontextmanager
+    async def stage(self, name: Stage) -> AsyncIterator[None]:
+        async with self._semaphores[name]:
+            yield
+
+    async def offload[R](self, stage: Stage, fn: Callable[..., R], *args: Any) -> R:
+        """Run a blocking callable on the executor while holding the stage's slot.
+
+        The caller's context is copied so tracing spans opened inside ``fn`` nest correctly.
+        """
+        async with self.stage(stage):
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(self._executor, partial(context.run, fn, *args))
+
+    def limit_llm(self, provider: LLMProvider) -> LLMProvider:
+        return ConcurrencyLimitedLLMProvider(provider, self._semaphores["llm"])
+
+    async def run[S](
+        self,
+        sources: Iterable[S] | AsyncIterable[S],
+        job: Callable[[S], Awaitable[Path]],
+        label: Callable[[S], str] = str,
+    ) -> list[JobOutcome]:
+        """Process every source with at most ``limits.jobs`` jobs in flight.
+
+        A failing job is logged and recorded in its outcome; it never aborts the batch.
+        """
+        return [outcome async for outcome in self.stream(sources, job, label)]
+
+    async def stream[S](
+        self,
+        sources: Iterable[S] | AsyncIterable[S],
+        job: Callable[[S], Awaitable[Path]],
+        label: Callable[[S], str] = str,
+    ) -> AsyncIterator[JobOutcome]:
+        """Like :meth:`run`, but yield each outcome as its job finishes.
+
+        Workers pull the next source only when they are free, so an async source
+        is consumed at the pace of the pipeline and at most ``limits.jobs`` jobs
+        are held in memory at once.
+        """
+        pending = aiter(sources) if isinstance(sources, AsyncIterable) else _as_async(sources)
+        pull_lock = asyncio.Lock()
+        outcomes: asyncio.Queue[JobOutcome | None] = asyncio.Queue()
+
+        async def next_source() -> tuple[bool, S | None]:
+            async with pull_lock:
+                try:
+                    return True, await anext(pending)
+                except StopAsyncIteration:
+                    return False, None
+
+        async def worker() -> None:
+            while True:
+                has_next, source = await next_source()
+                if not has_next:
+                    return
+                outcomes.put_nowait(await self._run_one(source, job, label(source)))
+
+        async def produce() -> None:
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for _ in range(self._limits.jobs):
+                        group.create_task(worker())
+            finally:
+                outcomes.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (outcome := await outcomes.get()) is not None:
+                yield outcome
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await producer
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _run_one[S](self, source: S, job: Callable[[S], Awaitable[Path]], name: str) -> JobOutcome:
+        started = time.perf_counter()
+        try:
+            output_path = await job(source)
+        except Exception as exc:
+            logger.exception("Job failed: %s", name)
+            return JobOutcome(
+                source=name,
+                error=f"{type(exc).__name__}: {exc}",
+                duration_s=time.perf_counter() - started,
+            )
+        return JobOutcome(
+            source=name,
+            output_path=output_path,
+            duration_s=time.perf_counter() - started,
+        )
+
+
+class OutcomeTally:
+    """Running totals of a streamed run; keeps only the failures, not every outcome."""
+
+    def __init__(self, max_failures: int | None = 1000) -> None:
+        self.succeeded = 0
+        self.failed = 0
+        self.failures: deque[JobOutcome] = deque(maxlen=max_failures)
+
+    def add(self, outcome: JobOutcome) -> None:
+        if outcome.succeeded:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+            self.failures.append(outcome)
+
+    def summary(self) -> str:
+        total = self.succeeded + self.failed
+        lines = [f"Processed {total} job(s): {self.succeeded} succeeded, {self.failed} failed"]
+        for outcome in self.failures:
+            lines.append(f"  FAILED {outcome.source}: {outcome.error}")
+        if self.failed > len(self.failures):
+            lines.append(f"  ... and {self.failed - len(self.failures)} earlier failure(s)")
+        return "\n".join(lines)
+
+
+def summarize_outcomes(outcomes: Iterable[JobOutcome]) -> str:
+    tally = OutcomeTally(max_failures=None)
+    for outcome in outcomes:
+        tally.add(outcome)
+    return tally.summary()
+
+
+async def _as_async[S](items: Iterable[S]) -> AsyncIterator[S]:
+    for item in items:
+        yield item
@@ -1,10 +1,55 @@
+import functools
+import hashlib
 from pathlib import Path
 
 
+class Prompt(str):
+    """Prompt text that knows where its shared prefix ends.
+
+    The prefix (instructions, plus the resume where it is part of the input) is
+    the same for every job, so providers can cache it; the suffix holds the
+    per-job input. A Prompt is a plain ``str`` to everything else.
+    """
+
+    prefix_length: int
+
+    def __new__(cls, prefix: str, suffix: str = "") -> "Prompt":
+        prompt = super().__new__(cls, prefix + suffix)
+        prompt.prefix_length = len(prefix)
+        return prompt
+
+    @property
+    def prefix(self) -> str:
+        return str(self[: self.prefix_length])
+
+    @property
+    def suffix(self) -> str:
+        return str(self[self.prefix_length :])
+
+    @functools.cached_property
+    def prefix_key(self) -> str:
+        """Short hash identifying the prefix, for provider cache keys."""
+        return hashlib.sha256(self.prefix.encode("utf-8")).hexdigest()[:32]
+
+
 class Prompter:
     _DIR = Path(__file__).parent
+    # Templates put this line between the shared prefix and the per-job input.
+    SPLIT = "<!-- per-job input -->\n"
 
     @staticmethod
     def load(name: str) -> str:
         path = Prompter._DIR / f"{name}.txt"
         return path.read_text(encoding="utf-8")
+
+    @staticmethod
+    def render(name: str, **fields: str) -> Prompt:
+        """Fill in a prompt template, keeping the split between shared prefix and per-job input."""
+        prefix, _, suffix = Prompter.load(name).partition(Prompter.SPLIT)
+        return Prompt(prefix.format(**fields), suffix.format(**fields))
+
+    @staticmethod
+    @functools.cache
+    def version(name: str) -> str:
+        """Short content hash of a prompt, so edits invalidate results produced with the old text."""
+        return hashlib.sha256(Prompter.load(name).encode("utf-8")).hexdigest()[:16]
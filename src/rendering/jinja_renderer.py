@@ -1,8 +1,10 @@
+import hashlib
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from src.rendering.provider import TemplateRenderer
 
@@ -10,18 +12,61 @@ logger = logging.getLogger(__name__)
 
 
 class Jinja2TemplateRenderer(TemplateRenderer):
-    def __init__(self, template_path: Path) -> None:
+    """Keeps one environment and compiled template, recompiling only when the file changes.
+
+    A change is detected by mtime/size and confirmed by content hash, so touching
+    the file without editing it does not trigger a recompile. With
+    ``bytecode_cache_dir`` set, compiled bytecode survives process restarts.
+    """
+
+    def __init__(self, template_path: Path, bytecode_cache_dir: Path | None = None) -> None:
         self._template_path = Path(template_path)
+        self._bytecode_cache_dir = Path(bytecode_cache_dir) if bytecode_cache_dir else None
+        self._lock = threading.Lock()
+        self._env: Environment | None = None
+        self._template: Template | None = None
+        self._stat_signature: tuple[int, int] | None = None
+        self._digest: str | None = None
 
     def render(self, data: Dict[str, Any]) -> str:
-        if not self._template_path.exists():
-            raise FileNotFoundError(f"Template not found: {self._template_path}")
+        return self._get_template().render(**data)
+
+    def render_many(self, items: Iterable[Dict[str, Any]]) -> list[str]:
+        template = self._get_template()
+        return [template.render(**data) for data in items]
+
+    def _get_template(self) -> Template:
+        try:
+            stat = self._template_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template not found: {self._template_path}") from None
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            if self._template is not None and signature == self._stat_signature:
+                return self._template
 
-        env = Environment(
-            loader=FileSystemLoader(self._template_path.parent),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        tpl = env.get_template(self._template_path.name)
+            digest = hashlib.sha256(self._template_path.read_bytes()).hexdigest()
+            if self._template is None or digest != self._digest:
+                env = self._environment()
+                env.cache.clear()
+                self._template = env.get_template(self._template_path.name)
+                self._digest = digest
+                logger.debug("Compiled template %s", self._template_path)
+            self._stat_signature = signature
+            return self._template
 
-        return tpl.render(**data)
+    def _environment(self) -> Environment:
+        if self._env is None:
+            bytecode_cache = None
+            if self._bytecode_cache_dir is not None:
+                self._bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(self._bytecode_cache_dir))
+            self._env = Environment(
+                loader=FileSystemLoader(self._template_path.parent),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                auto_reload=False,
+                bytecode_cache=bytecode_cache,
+            )
+        return self._env
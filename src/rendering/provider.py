@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 
 class TemplateRenderer(ABC):
@@ -7,3 +7,7 @@ class TemplateRenderer(ABC):
     def render(self, data: Dict[str, Any]) -> str:
         """Render data using a template and return the rendered content."""
         ...
+
+    def render_many(self, items: Iterable[Dict[str, Any]]) -> list[str]:
+        """Render each data dict with the same template."""
+        return [self.render(data) for data in items]
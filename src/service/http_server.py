@@ -0,0 +1,186 @@
+import asyncio
+import json
+import logging
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import ValidationError
+
+from src.models.job_request import JobRequest
+from src.service.jobs import JobManager, JobRecord
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 1024 * 1024
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".json": "application/json",
+    ".md": "text/markdown; charset=utf-8",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str | None = None) -> None:
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+class _Request:
+    def __init__(self, method: str, target: str, headers: dict[str, str], body: bytes) -> None:
+        parts = urlsplit(target)
+        self.method = method
+        self.path = [segment for segment in parts.path.split("/") if segment]
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        self.headers = headers
+        self.body = body
+
+
+class TailoringHTTPServer:
+    """Minimal asyncio HTTP/1.1 front end for :class:`JobManager`.
+
+    Routes:
+        GET  /health
+        POST /jobs                          {"url": ...} or {"text": ...}; ``?wait=true`` blocks until done
+        GET  /jobs/<id>                     current status
+        GET  /jobs/<id>/events              NDJSON stream of status changes until the job finishes
+        GET  /jobs/<id>/artifacts/<name>    resume.pdf, resume.md, keywords.json, gaps.json, ...
+
+    Every response closes the connection; the server is meant for local or
+    reverse-proxied use.
+    """
+
+    def __init__(self, manager: JobManager, host: str = "127.0.0.1", port: int = 7777) -> None:
+        self._manager = manager
+        self._host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        if self._server is None or not self._server.sockets:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        logger.info("Serving on http://%s:%d", self._host, self.port)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await self._read_request(reader)
+            await self._dispatch(request, writer)
+        except HTTPError as exc:
+            await self._send_json(writer, exc.status, {"error": str(exc)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception:
+            logger.exception("Unhandled error while serving request")
+            await self._send_json(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"})
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> _Request:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "malformed request line") from None
+        headers: dict[str, str] = {}
+        while (line := (await reader.readline()).decode("latin-1").strip()):
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", "0") or 0)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from None
+        if length < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        body = await reader.readexactly(length) if length else b""
+        return _Request(method.upper(), target, headers, body)
+
+    async def _dispatch(self, request: _Request, writer: asyncio.StreamWriter) -> None:
+        match request.method, request.path:
+            case "GET", ["health"]:
+                await self._send_json(writer, HTTPStatus.OK, {"status": "ok"})
+            case "POST", ["jobs"]:
+                await self._submit(request, writer)
+            case "GET", ["jobs", job_id]:
+                await self._send_json(writer, HTTPStatus.OK, self._record(job_id).status.model_dump(mode="json"))
+            case "GET", ["jobs", job_id, "events"]:
+                await self._stream_events(self._record(job_id), writer)
+            case "GET", ["jobs", job_id, "artifacts", name]:
+                await self._send_artifact(self._record(job_id), name, writer)
+            case _, ["health"] | ["jobs", *_]:
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            case _:
+                raise HTTPError(HTTPStatus.NOT_FOUND)
+
+    async def _submit(self, request: _Request, writer: asyncio.StreamWriter) -> None:
+        try:
+            job_request = JobRequest.model_validate_json(request.body)
+        except ValidationError as exc:
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, exc.errors(include_url=False)[0]["msg"]) from None
+        record = self._manager.submit(job_request)
+        if request.query.get("wait", "").lower() in {"1", "true", "yes"}:
+            status = await self._manager.wait(record)
+            await self._send_json(writer, HTTPStatus.OK, status.model_dump(mode="json"))
+            return
+        await self._send_json(writer, HTTPStatus.ACCEPTED, record.status.model_dump(mode="json"))
+
+    async def _stream_events(self, record: JobRecord, writer: asyncio.StreamWriter) -> None:
+        self._write_head(writer, HTTPStatus.OK, "application/x-ndjson")
+        async for status in self._manager.watch(record):
+            writer.write(status.model_dump_json().encode() + b"\n")
+            await writer.drain()
+
+    async def _send_artifact(self, record: JobRecord, name: str, writer: asyncio.StreamWriter) -> None:
+        # Only names listed for the job are served, which also rules out path traversal.
+        content = await self._manager.read_artifact(record, name)
+        if content is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No artifact {name!r} for job {record.status.id}")
+        content_type = CONTENT_TYPES.get(Path(name).suffix, "application/octet-stream")
+        self._write_head(writer, HTTPStatus.OK, content_type, len(content))
+        writer.write(content)
+        await writer.drain()
+
+    def _record(self, job_id: str) -> JobRecord:
+        record = self._manager.get(job_id)
+        if record is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown job {job_id}")
+        return record
+
+    async def _send_json(self, writer: asyncio.StreamWriter, status: HTTPStatus, payload: object) -> None:
+        body = json.dumps(payload).encode()
+        self._write_head(writer, status, "application/json", len(body))
+        writer.write(body)
+        await writer.drain()
+
+    @staticmethod
+    def _write_head(
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        content_type: str,
+        length: int | None = None,
+    ) -> None:
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}", f"Content-Type: {content_type}", "Connection: close"]
+        if length is not None:
+            lines.append(f"Content-Length: {length}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
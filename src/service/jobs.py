@@ -0,0 +1,147 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Literal
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from src.models.job_request import JobRequest
+from src.storage.file_storage import FileStorage
+from src.storage.local_file_storage import LocalFileFileStorage
+
+logger = logging.getLogger(__name__)
+
+JobState = Literal["queued", "running", "succeeded", "failed"]
+TERMINAL_STATES: frozenset[JobState] = frozenset({"succeeded", "failed"})
+
+
+class JobStatus(BaseModel):
+    id: str
+    state: JobState = "queued"
+    source: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    artifacts: list[str] = Field(default_factory=list)
+
+    @property
+    def done(self) -> bool:
+        return self.state in TERMINAL_STATES
+
+
+class JobRecord:
+    def __init__(self, request: JobRequest) -> None:
+        self.request = request
+        self.status = JobStatus(id=uuid4().hex, source=request.label)
+        self.output_dir: Path | None = None
+        self.history: list[JobStatus] = [self.status.model_copy()]
+        self._changed = asyncio.Event()
+
+    def update(self, **fields: object) -> None:
+        self.status = self.status.model_copy(update=fields)
+        self.history.append(self.status.model_copy())
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def changed(self) -> None:
+        await self._changed.wait()
+
+
+class JobManager:
+    """Runs submitted jobs in the background and keeps their status for polling and streaming.
+
+    At most ``max_concurrent`` jobs run at once; the most recent
+    ``max_finished`` finished jobs stay queryable. ``artifacts`` returns the
+    storage holding a finished job's artifacts; by default, its output folder.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[JobRequest], Awaitable[Path]],
+        max_concurrent: int = 4,
+        max_finished: int = 1000,
+        artifacts: Callable[[Path], Awaitable[FileStorage]] | None = None,
+    ) -> None:
+        self._run = run
+        self._artifacts = artifacts or _output_folder
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._max_finished = max_finished
+        self._records: OrderedDict[str, JobRecord] = OrderedDict()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def submit(self, request: JobRequest) -> JobRecord:
+        record = JobRecord(request)
+        self._records[record.status.id] = record
+        task = asyncio.get_running_loop().create_task(self._execute(record))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self._prune()
+        return record
+
+    def get(self, job_id: str) -> JobRecord | None:
+        return self._records.get(job_id)
+
+    async def read_artifact(self, record: JobRecord, name: str) -> bytes | None:
+        """Content of one of a finished job's listed artifacts; None for names it did not produce."""
+        if record.output_dir is None or name not in record.status.artifacts:
+            return None
+        storage = await self._artifacts(record.output_dir)
+        return await asyncio.to_thread(storage.load_bytes, Path(name))
+
+    async def wait(self, record: JobRecord) -> JobStatus:
+        while not record.status.done:
+            await record.changed()
+        return record.status
+
+    async def watch(self, record: JobRecord) -> AsyncIterator[JobStatus]:
+        """Yield every status change of a job, starting from its history, until it finishes."""
+        seen = 0
+        while True:
+            while seen < len(record.history):
+                yield record.history[seen]
+                seen += 1
+            if record.status.done:
+                return
+            await record.changed()
+
+    async def aclose(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _execute(self, record: JobRecord) -> None:
+        async with self._slots:
+            record.update(state="running", started_at=datetime.now(tz=timezone.utc))
+            try:
+                output_path = await self._run(record.request)
+                storage = await self._artifacts(output_path.parent)
+                artifacts = await asyncio.to_thread(storage.list_names)
+            except Exception as exc:
+                logger.exception("Job %s failed: %s", record.status.id, record.status.source)
+                record.update(
+                    state="failed",
+                    error=f"{type(exc).__name__}: {exc}",
+                    finished_at=datetime.now(tz=timezone.utc),
+                )
+                return
+            record.output_dir = output_path.parent
+            record.update(
+                state="succeeded",
+                artifacts=artifacts,
+                finished_at=datetime.now(tz=timezone.utc),
+            )
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, record in self._records.items() if record.status.done]
+        for job_id in finished[: max(len(finished) - self._max_finished, 0)]:
+            del self._records[job_id]
+
+
+async def _output_folder(output_dir: Path) -> FileStorage:
+    return LocalFileFileStorage(base_dir=output_dir)
@@ -3,9 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Callable, Literal
 
-from pydantic import Field, SecretStr
+from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict, TomlConfigSettingsSource
 
+from src.tracing.pricing import ModelPrice
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 CONFIG_FILE = BASE_DIR / "config.toml"
 ENV_FILE = BASE_DIR / ".env"
@@ -48,24 +50,86 @@ class StrictTomlConfigSettingsSource(TomlConfigSettingsSource):
         return data
 
 
+class LLMBackend(BaseModel):
+    """One routable LLM backend; the key is read from ``api_key_env`` or falls back to LLM_API_KEY."""
+
+    provider: Literal["gemini", "openai"]
+    model: str | None = None
+    api_key_env: str | None = None
+
+
 class Settings(BaseSettings):
     llm_api_key: SecretStr = Field(validation_alias="LLM_API_KEY")
 
     llm_provider: Literal["gemini", "openai"]
     md_j2_template: Path
+    template_bytecode_cache_dir: Path | None = None
     master_json: Path
     personal_json: Path
     cli_converter_path: Path
     job_urls_file: Path | None = None
     output_dir: Path = Path("outputs")
     llm_model: str | None = None
+    llm_mode: Literal["online", "batch"] = "online"
+    llm_backends: dict[str, LLMBackend] = Field(default_factory=dict)
+    llm_stage_backends: dict[str, list[str]] = Field(default_factory=dict)
+    tailoring_mode: Literal["staged", "fused"] = "staged"
+    skill_gap_mode: Literal["llm", "hybrid"] = "llm"
+    adjust_output: Literal["patch", "full"] = "patch"
+    prompt_resume_token_budget: int | None = Field(default=None, ge=1)
+    llm_batch_collect_window_s: float = 5.0
+    llm_batch_poll_interval_s: float = 30.0
+    llm_batch_max_size: int = Field(default=1000, ge=1)
+    llm_requests_per_minute: float | None = Field(default=None, gt=0)
+    llm_tokens_per_minute: float | None = Field(default=None, gt=0)
+    llm_max_retries: int = Field(default=5, ge=0)
+    llm_backoff_base_s: float = 1.0
+    llm_backoff_max_s: float = 60.0
+    llm_context_cache_ttl_s: float | None = Field(default=None, ge=0)
+    llm_context_cache_min_tokens: int = Field(default=1024, ge=0)
+    llm_validation_retries: int = Field(default=2, ge=0)
+    llm_hedge_percentile: float | None = Field(default=None, gt=0, le=100)
     pdf_paper_size: str = "A4"
     pdf_font_size: int = 12
     pdf_filename: str = "resume.pdf"
+    pdf_workers: int = Field(default=0, ge=0)
+    pdf_job_timeout_s: float = 120.0
+    pdf_worker_stylesheets: list[Path] = Field(default_factory=list)
     keywords_filename: str = "keywords.json"
     gaps_filename: str = "gaps.json"
+    adjusted_filename: str = "adjusted_resume.json"
+    job_description_filename: str = "job_description.md"
+    run_manifest_path: Path | None = None
+    posting_index_path: Path | None = None
+    run_store_path: Path | None = None
+    storage_write_behind: bool = True
+    storage_durability: Literal["write", "batch", "none"] = "none"
+    storage_max_batch: int = Field(default=64, ge=1)
+    near_duplicate_threshold: float = Field(default=0.85, gt=0, le=1)
     log_level: str = "INFO"
+    host: str = "127.0.0.1"
     port: int | None = None
+    max_concurrent_jobs: int = Field(default=4, ge=1)
+    docling_concurrency: int = Field(default=1, ge=1)
+    llm_concurrency: int = Field(default=8, ge=1)
+    pdf_concurrency: int = Field(default=2, ge=1)
+    docling_workers: int = Field(default=0, ge=0)
+    docling_max_documents_per_worker: int | None = 50
+    docling_max_rss_mb: int | None = None
+    html_extraction: bool = True
+    html_min_words: int = Field(default=120, ge=0)
+    markdown_cleaning: bool = True
+    job_description_token_budget: int | None = Field(default=4000, ge=1)
+    conversion_cache_dir: Path | None = None
+    conversion_cache_ttl_hours: float | None = 24.0
+    conversion_cache_max_mb: int | None = 512
+    conversion_cache_revalidate: bool = False
+    llm_cache_path: Path | None = None
+    llm_cache_mode: Literal["use", "bypass", "refresh"] = "use"
+    llm_cache_max_entries: int | None = 10_000
+    llm_cache_max_age_days: float | None = 30.0
+    trace_dir: Path | None = None
+    llm_prices: dict[str, ModelPrice] = Field(default_factory=dict)
 
     model_config = SettingsConfigDict(
         env_file=ENV_FILE,
@@ -94,8 +158,16 @@ class Settings(BaseSettings):
 
     def model_post_init(self, __context: Any) -> None:
         self.md_j2_template = _resolve_path(self.md_j2_template)
+        self.template_bytecode_cache_dir = _resolve_path(self.template_bytecode_cache_dir)
         self.master_json = _resolve_path(self.master_json)
         self.personal_json = _resolve_path(self.personal_json)
         self.cli_converter_path = _resolve_path(self.cli_converter_path)
+        self.pdf_worker_stylesheets = [_resolve_path(path) for path in self.pdf_worker_stylesheets]
         self.job_urls_file = _resolve_path(self.job_urls_file)
         self.output_dir = _resolve_path(self.output_dir)
+        self.conversion_cache_dir = _resolve_path(self.conversion_cache_dir)
+        self.llm_cache_path = _resolve_path(self.llm_cache_path)
+        self.trace_dir = _resolve_path(self.trace_dir)
+        self.run_manifest_path = _resolve_path(self.run_manifest_path)
+        self.posting_index_path = _resolve_path(self.posting_index_path)
+        self.run_store_path = _resolve_path(self.run_store_path)
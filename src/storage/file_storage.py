@@ -10,3 +10,35 @@ class FileStorage(ABC):
         """Serialize a Pydantic model (or list of models) to persistent storage."""
         ...
 
+    @abstractmethod
+    def load_model[T: BaseModel](self, model: type[T], path: Path) -> T | None:
+        """Load a model saved with ``save_model``; None if it is missing or no longer validates."""
+        ...
+
+    @abstractmethod
+    def save_text(self, text: str, path: Path) -> Path:
+        """Write a text artifact (e.g. the job description markdown)."""
+        ...
+
+    @abstractmethod
+    def load_text(self, path: Path) -> str | None:
+        """Read a text artifact; None if it is missing."""
+        ...
+
+    @abstractmethod
+    def load_bytes(self, path: Path) -> bytes | None:
+        """Raw content of an artifact, including files written next to the saved ones (the PDF); None if missing."""
+        ...
+
+    @abstractmethod
+    def list_names(self) -> list[str]:
+        """Names of every artifact, sorted."""
+        ...
+
+    @abstractmethod
+    def resolve(self, path: Path) -> Path:
+        """Full location of an artifact, as returned by ``save_model``/``save_text``."""
+        ...
+
+    def sync(self, path: Path) -> None:
+        """Force a saved artifact to stable storage. Backends with their own durability do nothing."""
@@ -1,10 +1,12 @@
 import json
 import logging
+import os
 from pathlib import Path
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from src.storage.file_storage import FileStorage
+from src.tracing.tracer import span
 
 logger = logging.getLogger(__name__)
 
@@ -14,20 +16,63 @@ class LocalFileFileStorage(FileStorage):
         self._base_dir = base_dir
 
     def save_model(self, data: BaseModel | list[BaseModel], path: Path) -> Path:
-        resolved = self._resolve_and_prepare(path)
-        if isinstance(data, list):
-            text = json.dumps(
-                [item.model_dump(mode="json") for item in data],
-                indent=2,
-                ensure_ascii=False
-            )
-        else:
-            text = data.model_dump_json(indent=2)
-        resolved.write_text(text, encoding="utf-8")
+        with span("storage", path=str(path)):
+            resolved = self._resolve_and_prepare(path)
+            if isinstance(data, list):
+                text = json.dumps(
+                    [item.model_dump(mode="json") for item in data],
+                    indent=2,
+                    ensure_ascii=False
+                )
+            else:
+                text = data.model_dump_json(indent=2)
+            resolved.write_text(text, encoding="utf-8")
         logger.info("Saved model data to %s", resolved)
         return resolved
 
+    def load_model[T: BaseModel](self, model: type[T], path: Path) -> T | None:
+        resolved = self.resolve(path)
+        if not resolved.exists():
+            return None
+        try:
+            return model.model_validate_json(resolved.read_text(encoding="utf-8"))
+        except ValidationError:
+            logger.warning("Ignoring %s: it no longer matches %s", resolved, model.__name__)
+            return None
+
+    def save_text(self, text: str, path: Path) -> Path:
+        with span("storage", path=str(path)):
+            resolved = self._resolve_and_prepare(path)
+            resolved.write_text(text, encoding="utf-8")
+        logger.info("Saved text to %s", resolved)
+        return resolved
+
+    def load_text(self, path: Path) -> str | None:
+        resolved = self.resolve(path)
+        if not resolved.exists():
+            return None
+        return resolved.read_text(encoding="utf-8")
+
+    def load_bytes(self, path: Path) -> bytes | None:
+        resolved = self.resolve(path)
+        return resolved.read_bytes() if resolved.is_file() else None
+
+    def list_names(self) -> list[str]:
+        if not self._base_dir.is_dir():
+            return []
+        return sorted(path.name for path in self._base_dir.iterdir() if path.is_file())
+
+    def resolve(self, path: Path) -> Path:
+        return path if path.is_absolute() else self._base_dir / path
+
+    def sync(self, path: Path) -> None:
+        fd = os.open(self.resolve(path), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
     def _resolve_and_prepare(self, path: Path) -> Path:
-        resolved = path if path.is_absolute() else self._base_dir / path
+        resolved = self.resolve(path)
         resolved.parent.mkdir(parents=True, exist_ok=True)
         return resolved
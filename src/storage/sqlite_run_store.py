@@ -0,0 +1,289 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from src.extraction.markdown_cache import normalize_url
+from src.models.extraction_run import JobKeywordResult
+from src.storage.file_storage import FileStorage
+from src.tracing.tracer import span
+
+logger = logging.getLogger(__name__)
+
+
+def url_hash(source: str) -> str:
+    """Stable key for a job source; URLs are normalized first so tracking parameters do not matter."""
+    key = normalize_url(source) if source.startswith(("http://", "https://")) else source
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _escape_like(text: str) -> str:
+    """Match ``%`` and ``_`` literally in a ``LIKE ... ESCAPE '\\'`` pattern."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class RunRecord(BaseModel):
+    job_dir: Path
+    source: str | None
+    company: str | None
+    title: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+class RunStore:
+    """All per-job artifacts of every run in one SQLite database.
+
+    Artifacts are addressed like files, by job output directory and file name,
+    so the pipeline and :class:`RunManifest` work unchanged. Model artifacts are
+    stored as compact JSON, and saving a :class:`JobKeywordResult` indexes the
+    job by company, title, source URL hash and date for :meth:`find_runs`.
+    Writes commit individually unless grouped with :meth:`batch`.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            job_dir TEXT PRIMARY KEY,
+            source TEXT,
+            url_hash TEXT,
+            company TEXT COLLATE NOCASE,
+            title TEXT COLLATE NOCASE,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS runs_company ON runs (company, created_at);
+        CREATE INDEX IF NOT EXISTS runs_title ON runs (title, created_at);
+        CREATE INDEX IF NOT EXISTS runs_url_hash ON runs (url_hash);
+        CREATE INDEX IF NOT EXISTS runs_created_at ON runs (created_at);
+        CREATE TABLE IF NOT EXISTS artifacts (
+            job_dir TEXT NOT NULL,
+            name TEXT NOT NULL,
+            kind TEXT NOT NULL CHECK (kind IN ('json', 'text')),
+            body TEXT NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (job_dir, name)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+
+    def storage(self, job_dir: Path) -> "RunStoreStorage":
+        return RunStoreStorage(self, job_dir)
+
+    @contextmanager
+    def batch(self) -> Iterator["RunStore"]:
+        """Group writes into one transaction; nested batches join the outermost one."""
+        with self._lock:
+            if self._batch_depth == 0:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._conn.execute("COMMIT")
+
+    def put(self, job_dir: Path, name: str, body: str, kind: str = "json") -> None:
+        now = time.time()
+        with self.batch():
+            self._conn.execute(
+                "INSERT INTO artifacts (job_dir, name, kind, body, updated_at) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (job_dir, name) DO UPDATE SET kind = excluded.kind, body = excluded.body,"
+                " updated_at = excluded.updated_at",
+                (str(job_dir), name, kind, body, now),
+            )
+            self._conn.execute(
+                "INSERT INTO runs (job_dir, created_at, updated_at) VALUES (?, ?, ?)"
+                " ON CONFLICT (job_dir) DO UPDATE SET updated_at = excluded.updated_at",
+                (str(job_dir), now, now),
+            )
+
+    def get(self, job_dir: Path, name: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM artifacts WHERE job_dir = ? AND name = ?", (str(job_dir), name)
+            ).fetchone()
+        return row[0] if row else None
+
+    def names(self, job_dir: Path) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT name FROM artifacts WHERE job_dir = ?", (str(job_dir),)).fetchall()
+        return [name for (name,) in rows]
+
+    def has(self, path: Path) -> bool:
+        """Whether ``path`` is a stored artifact or, like the rendered PDF, a file on disk."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM artifacts WHERE job_dir = ? AND name = ?", (str(path.parent), path.name)
+            ).fetchone()
+        return row is not None or path.exists()
+
+    def index_keywords(self, job_dir: Path, result: JobKeywordResult) -> None:
+        with self.batch():
+            self._conn.execute(
+                "UPDATE runs SET source = ?, url_hash = ?, company = ?, title = ? WHERE job_dir = ?",
+                (
+                    result.source_url,
+                    url_hash(result.source_url),
+                    result.keywords.company_name,
+                    result.keywords.job_title,
+                    str(job_dir),
+                ),
+            )
+
+    def find_runs(
+        self,
+        company: str | None = None,
+        title: str | None = None,
+        url: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[RunRecord]:
+        """Runs matching every given filter, newest first. Company and title match case-insensitive substrings."""
+        clauses: list[str] = []
+        params: list[object] = []
+        if company is not None:
+            clauses.append("company LIKE ? ESCAPE '\\'")
+            params.append(f"%{_escape_like(company)}%")
+        if title is not None:
+            clauses.append("title LIKE ? ESCAPE '\\'")
+            params.append(f"%{_escape_like(title)}%")
+        if url is not None:
+            clauses.append("url_hash = ?")
+            params.append(url_hash(url))
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(until.timestamp())
+        query = "SELECT job_dir, source, company, title, created_at, updated_at FROM runs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            RunRecord(
+                job_dir=Path(job_dir),
+                source=source,
+                company=company_name,
+                title=job_title,
+                created_at=datetime.fromtimestamp(created_at, tz=timezone.utc),
+                updated_at=datetime.fromtimestamp(updated_at, tz=timezone.utc),
+            )
+            for job_dir, source, company_name, job_title, created_at, updated_at in rows
+        ]
+
+    def export_folders(self, destination: Path | None = None, runs: list[RunRecord] | None = None) -> int:
+        """Write artifacts in the per-job folder layout of :class:`LocalFileFileStorage`.
+
+        Each run goes to its own ``job_dir``, or to ``destination/<job_dir name>``
+        when a destination is given. Returns the number of files written.
+        """
+        written = 0
+        for run in runs if runs is not None else self.find_runs():
+            target = destination / run.job_dir.name if destination is not None else run.job_dir
+            target.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT name, kind, body FROM artifacts WHERE job_dir = ?", (str(run.job_dir),)
+                ).fetchall()
+            for name, kind, body in rows:
+                text = json.dumps(json.loads(body), indent=2, ensure_ascii=False) if kind == "json" else body
+                (target / name).write_text(text, encoding="utf-8")
+                written += 1
+        logger.info("Exported %d artifact(s) to per-job folders", written)
+        return written
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RunStoreStorage(FileStorage):
+    """FileStorage view of one job's artifacts in a :class:`RunStore`."""
+
+    def __init__(self, store: RunStore, job_dir: Path) -> None:
+        self._store = store
+        self._job_dir = Path(job_dir)
+
+    def save_model(self, data: BaseModel | list[BaseModel], path: Path) -> Path:
+        job_dir, name = self._locate(path)
+        with span("storage", path=str(path), backend="run_store"):
+            if isinstance(data, list):
+                body = json.dumps([item.model_dump(mode="json") for item in data], ensure_ascii=False)
+            else:
+                body = data.model_dump_json()
+            with self._store.batch():
+                self._store.put(job_dir, name, body)
+                if isinstance(data, JobKeywordResult):
+                    self._store.index_keywords(job_dir, data)
+        logger.debug("Stored %s for %s", name, job_dir)
+        return job_dir / name
+
+    def load_model[T: BaseModel](self, model: type[T], path: Path) -> T | None:
+        body = self._store.get(*self._locate(path))
+        if body is None:
+            return None
+        try:
+            return model.model_validate_json(body)
+        except ValidationError:
+            logger.warning("Ignoring stored %s: it no longer matches %s", path, model.__name__)
+            return None
+
+    def save_text(self, text: str, path: Path) -> Path:
+        job_dir, name = self._locate(path)
+        with span("storage", path=str(path), backend="run_store"):
+            self._store.put(job_dir, name, text, kind="text")
+        return job_dir / name
+
+    def load_text(self, path: Path) -> str | None:
+        return self._store.get(*self._locate(path))
+
+    def load_bytes(self, path: Path) -> bytes | None:
+        body = self._store.get(*self._locate(path))
+        if body is not None:
+            return body.encode("utf-8")
+        # Rendered PDFs are written to the job folder, not the store.
+        resolved = self.resolve(path)
+        return resolved.read_bytes() if resolved.is_file() else None
+
+    def list_names(self) -> list[str]:
+        on_disk = {path.name for path in self._job_dir.iterdir() if path.is_file()} if self._job_dir.is_dir() else set()
+        return sorted(on_disk.union(self._store.names(self._job_dir)))
+
+    def resolve(self, path: Path) -> Path:
+        return path if path.is_absolute() else self._job_dir / path
+
+    def _locate(self, path: Path) -> tuple[Path, str]:
+        resolved = self.resolve(path)
+        return resolved.parent, resolved.name
@@ -0,0 +1,266 @@
+import asyncio
+import atexit
+import contextvars
+import logging
+import queue
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from contextlib import AbstractContextManager, nullcontext, suppress
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel
+
+from src.storage.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+Durability = Literal["write", "batch", "none"]
+
+_CLOSE = object()
+
+
+class _Write:
+    __slots__ = ("storage", "path", "key", "apply", "context", "future")
+
+    def __init__(self, storage: FileStorage, path: Path, apply: Callable[[], Path]) -> None:
+        self.storage = storage
+        self.path = path
+        self.key = storage.resolve(path)
+        self.apply = apply
+        # Storage spans still belong to the job that queued the write.
+        self.context = contextvars.copy_context()
+        self.future: Future[Path] = Future()
+
+
+class WriteBehindWriter:
+    """Saves artifacts on a worker thread so the event loop never waits on the disk.
+
+    Queued writes are applied in batches of up to ``max_batch``: writes to the
+    same artifact within a batch coalesce into the last one, and each batch
+    runs inside ``transaction`` (one SQLite transaction with the run store).
+    ``durability`` decides when saved files are fsynced: after every write,
+    once per batch, or never (left to the OS). With ``write_behind`` off, saves
+    still run on the worker thread but wait for their write to finish.
+
+    Loads wait for pending writes of the same artifact, so readers always see
+    the latest save. Failed writes stay pending until :meth:`settle` or
+    :meth:`flush` reports them. :meth:`aclose` drains the queue; a writer that
+    is never closed is drained at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        durability: Durability = "none",
+        max_batch: int = 64,
+        max_pending: int = 1024,
+        write_behind: bool = True,
+        transaction: Callable[[], AbstractContextManager[object]] | None = None,
+    ) -> None:
+        self.durability = durability
+        self._max_batch = max_batch
+        self._max_pending = max_pending
+        self._write_behind = write_behind
+        self._transaction = transaction or nullcontext
+        self._queue: queue.SimpleQueue[_Write | object] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        # Latest queued write per artifact, and every unfinished write in submission order.
+        self._pending: dict[Path, _Write] = {}
+        self._unfinished: dict[Future[Path], None] = {}
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.batches = 0
+        self.writes = 0
+
+    async def save_model(self, storage: FileStorage, data: BaseModel | list[BaseModel], path: Path) -> Path:
+        return await self._submit(_Write(storage, path, lambda: storage.save_model(data, path)))
+
+    async def save_text(self, storage: FileStorage, text: str, path: Path) -> Path:
+        return await self._submit(_Write(storage, path, lambda: storage.save_text(text, path)))
+
+    async def load_model[T: BaseModel](self, storage: FileStorage, model: type[T], path: Path) -> T | None:
+        await self._settled(storage.resolve(path))
+        return await asyncio.to_thread(storage.load_model, model, path)
+
+    async def load_text(self, storage: FileStorage, path: Path) -> str | None:
+        await self._settled(storage.resolve(path))
+        return await asyncio.to_thread(storage.load_text, path)
+
+    def after(self, storage: FileStorage, paths: Iterable[Path], callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the pending writes of ``paths`` have succeeded; skip it if one fails.
+
+        Runs immediately when nothing is pending, otherwise on the worker thread.
+        """
+        with self._lock:
+            futures = [write.future for path in paths if (write := self._pending.get(storage.resolve(path)))]
+        if not futures:
+            callback()
+            return
+        remaining = [len(futures)]
+        failed = [False]
+
+        def done(future: Future[Path]) -> None:
+            with self._lock:
+                remaining[0] -= 1
+                failed[0] = failed[0] or future.exception() is not None
+                if remaining[0] or failed[0]:
+                    return
+            try:
+                callback()
+            except Exception:
+                logger.exception("Callback after saving %s failed", ", ".join(str(path) for path in paths))
+
+        for future in futures:
+            future.add_done_callback(done)
+
+    async def settle(self, storage: FileStorage, paths: Iterable[Path]) -> None:
+        """Wait for the pending writes of ``paths``; re-raises the first that failed."""
+        with self._lock:
+            writes = [write for path in paths if (write := self._pending.get(storage.resolve(path)))]
+        await self._report(writes)
+
+    async def flush(self) -> None:
+        """Wait for every write queued so far; re-raises the first failure not reported yet."""
+        with self._lock:
+            writes = list(self._pending.values())
+        await self._report(writes)
+
+    async def idle(self) -> None:
+        """Wait for every write queued so far, leaving failures to :meth:`settle` and :meth:`flush`."""
+        with self._lock:
+            futures = list(self._unfinished)
+        if futures:
+            await asyncio.shield(
+                asyncio.gather(*(asyncio.wrap_future(future) for future in futures), return_exceptions=True)
+            )
+
+    async def aclose(self) -> None:
+        """Drain the queue and stop the worker thread. Cancelling the caller does not drop queued writes."""
+        await asyncio.shield(asyncio.to_thread(self.close))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        atexit.unregister(self.close)
+        if thread is not None:
+            self._queue.put(_CLOSE)
+            thread.join()
+        unreported = sum(1 for write in self._pending.values() if write.future.exception() is not None)
+        if unreported:
+            logger.error("%d artifact write(s) failed; their stages will run again", unreported)
+        logger.debug("Write-behind storage applied %d write(s) in %d batch(es)", self.writes, self.batches)
+
+    async def _submit(self, write: _Write) -> Path:
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Write-behind storage is closed")
+                if len(self._unfinished) < self._max_pending:
+                    self._enqueue(write)
+                    break
+                oldest = next(iter(self._unfinished))
+            # Back-pressure: let the worker catch up before queueing more.
+            with suppress(Exception):
+                await asyncio.shield(asyncio.wrap_future(oldest))
+        if self._write_behind:
+            return write.key
+        await self._report([write])
+        return write.future.result()
+
+    def _enqueue(self, write: _Write) -> None:
+        """Queue a write; the caller holds the lock."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+        self._pending[write.key] = write
+        self._unfinished[write.future] = None
+        write.future.add_done_callback(self._finished)
+        self._queue.put(write)
+
+    def _finished(self, future: Future[Path]) -> None:
+        with self._lock:
+            self._unfinished.pop(future, None)
+
+    async def _report(self, writes: list[_Write]) -> None:
+        """Wait for ``writes`` and raise the first failure; reported failures are no longer pending."""
+        if writes:
+            await asyncio.shield(
+                asyncio.gather(*(asyncio.wrap_future(write.future) for write in writes), return_exceptions=True)
+            )
+        failures = []
+        with self._lock:
+            for write in writes:
+                if (exc := write.future.exception()) is not None:
+                    failures.append(exc)
+                    if self._pending.get(write.key) is write:
+                        del self._pending[write.key]
+        if failures:
+            raise failures[0]
+
+    async def _settled(self, key: Path) -> None:
+        with self._lock:
+            write = self._pending.get(key)
+        if write is not None:
+            with suppress(Exception):
+                await asyncio.shield(asyncio.wrap_future(write.future))
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            writes = [item for item in batch if item is not _CLOSE]
+            if writes:
+                self._apply(writes)
+            if len(writes) < len(batch):
+                return
+
+    def _apply(self, writes: list[_Write]) -> None:
+        latest: dict[Path, _Write] = {}
+        for write in writes:
+            latest.pop(write.key, None)
+            latest[write.key] = write
+        outcomes: dict[Path, Path | BaseException] = {}
+        try:
+            # Durability per write means committing each write on its own.
+            transaction = nullcontext() if self.durability == "write" else self._transaction()
+            with transaction:
+                for key, write in latest.items():
+                    try:
+                        outcomes[key] = write.context.run(write.apply)
+                        if self.durability == "write":
+                            write.storage.sync(write.path)
+                    except Exception as exc:
+                        outcomes[key] = exc
+            if self.durability == "batch":
+                for key, write in latest.items():
+                    if not isinstance(outcomes[key], BaseException):
+                        try:
+                            write.storage.sync(write.path)
+                        except OSError as exc:
+                            outcomes[key] = exc
+        except Exception as exc:
+            outcomes = dict.fromkeys(latest, exc)
+
+        self.batches += 1
+        self.writes += len(latest)
+        for write in writes:
+            outcome = outcomes[write.key]
+            with self._lock:
+                # A failed write stays pending until reported, so later ``after`` calls see the failure.
+                if not isinstance(outcome, BaseException) and self._pending.get(write.key) is write:
+                    del self._pending[write.key]
+            if isinstance(outcome, BaseException):
+                if write is latest[write.key]:
+                    logger.error("Failed to save %s: %s", write.key, outcome)
+                write.future.set_exception(outcome)
+            else:
+                write.future.set_result(outcome)
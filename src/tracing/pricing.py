@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+
+
+class ModelPrice(BaseModel):
+    input_per_mtok: float
+    output_per_mtok: float
+    cached_input_per_mtok: float | None = None
+
+
+# USD per million tokens, list prices at the time of writing. Override via Settings.llm_prices.
+DEFAULT_PRICES: dict[str, ModelPrice] = {
+    "gpt-5": ModelPrice(input_per_mtok=1.25, output_per_mtok=10.0, cached_input_per_mtok=0.125),
+    "gpt-5.1": ModelPrice(input_per_mtok=1.25, output_per_mtok=10.0, cached_input_per_mtok=0.125),
+    "gpt-5-mini": ModelPrice(input_per_mtok=0.25, output_per_mtok=2.0, cached_input_per_mtok=0.025),
+    "gpt-5-nano": ModelPrice(input_per_mtok=0.05, output_per_mtok=0.4, cached_input_per_mtok=0.005),
+    "gemini-2.5-flash": ModelPrice(input_per_mtok=0.30, output_per_mtok=2.50, cached_input_per_mtok=0.03),
+    "gemini-2.5-pro": ModelPrice(input_per_mtok=1.25, output_per_mtok=10.0, cached_input_per_mtok=0.125),
+    "gemini-3-flash-preview": ModelPrice(input_per_mtok=0.50, output_per_mtok=3.0, cached_input_per_mtok=0.05),
+}
+
+
+def estimate_cost(
+    model: str | None,
+    input_tokens: int,
+    output_tokens: int,
+    cached_tokens: int = 0,
+    prices: dict[str, ModelPrice] | None = None,
+) -> float | None:
+    """Estimated USD cost of one call, or None when the model has no known price."""
+    table = {**DEFAULT_PRICES, **(prices or {})}
+    price = table.get(model or "")
+    if price is None:
+        return None
+    cached_rate = price.cached_input_per_mtok if price.cached_input_per_mtok is not None else price.input_per_mtok
+    uncached = max(input_tokens - cached_tokens, 0)
+    return (
+        uncached * price.input_per_mtok + cached_tokens * cached_rate + output_tokens * price.output_per_mtok
+    ) / 1_000_000
@@ -0,0 +1,224 @@
+import itertools
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from src.tracing.pricing import ModelPrice, estimate_cost
+
+
+class Span(BaseModel):
+    run_id: str
+    span_id: int
+    parent_id: int | None = None
+    job: str | None = None
+    stage: str
+    started_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    duration_s: float = 0.0
+    status: Literal["ok", "error"] = "ok"
+    error: str | None = None
+    provider: str | None = None
+    model: str | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cached_tokens: int | None = None
+    retries: int = 0
+    cost_usd: float | None = None
+    attributes: dict[str, Any] = Field(default_factory=dict)
+
+
+MAX_DURATION_SAMPLES = 10_000
+
+_current_tracer: ContextVar["Tracer | None"] = ContextVar("current_tracer", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class _StageStats:
+    """Totals per stage; latencies are a fixed-size reservoir sample so long runs stay bounded."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_s = 0.0
+        self.durations: list[float] = []
+        self.errors = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cached_tokens = 0
+        self.retries = 0
+        self.cost_usd = 0.0
+
+    def add_duration(self, duration: float) -> None:
+        self.count += 1
+        self.total_s += duration
+        if len(self.durations) < MAX_DURATION_SAMPLES:
+            self.durations.append(duration)
+        elif (slot := random.randrange(self.count)) < MAX_DURATION_SAMPLES:
+            self.durations[slot] = duration
+
+
+class Tracer:
+    """Collects per-stage spans for one run and appends them to ``<trace_dir>/<run_id>.jsonl``.
+
+    Spans are opened with the module-level :func:`span` helper, which finds the
+    tracer through a context variable, so stages deep in the call stack can be
+    traced without passing the tracer around.
+    """
+
+    def __init__(
+        self,
+        run_id: str | None = None,
+        trace_dir: Path | None = None,
+        prices: dict[str, ModelPrice] | None = None,
+    ) -> None:
+        self.run_id = run_id or datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        self._prices = prices
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._stats: dict[str, _StageStats] = defaultdict(_StageStats)
+        self._file = None
+        self.path: Path | None = None
+        if trace_dir is not None:
+            Path(trace_dir).mkdir(parents=True, exist_ok=True)
+            self.path = Path(trace_dir) / f"{self.run_id}.jsonl"
+            self._file = self.path.open("a", encoding="utf-8")
+
+    @contextmanager
+    def activate(self) -> Iterator["Tracer"]:
+        token = _current_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _current_tracer.reset(token)
+
+    @contextmanager
+    def span(self, stage: str, job: str | None = None, **attributes: Any) -> Iterator[Span]:
+        parent = _current_span.get()
+        current = Span(
+            run_id=self.run_id,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent else None,
+            job=job or (parent.job if parent else None),
+            stage=stage,
+            attributes=attributes,
+        )
+        token = _current_span.set(current)
+        started = time.perf_counter()
+        try:
+            yield current
+        except BaseException as exc:
+            current.status = "error"
+            current.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            current.duration_s = time.perf_counter() - started
+            _current_span.reset(token)
+            self._finish(current)
+
+    def summary(self) -> str:
+        """Per-stage table with call counts, p50/p95 latency, tokens and estimated cost."""
+        header = f"{'stage':<28} {'calls':>6} {'errors':>6} {'p50 s':>8} {'p95 s':>8} {'total s':>9} " \
+                 f"{'in tok':>9} {'out tok':>9} {'cached':>8} {'retries':>7} {'cost $':>9}"
+        lines = [f"Trace summary for run {self.run_id}", header, "-" * len(header)]
+        with self._lock:
+            for stage, stats in sorted(self._stats.items()):
+                lines.append(
+                    f"{stage:<28} {stats.count:>6} {stats.errors:>6} "
+                    f"{percentile(stats.durations, 50):>8.2f} {percentile(stats.durations, 95):>8.2f} "
+                    f"{stats.total_s:>9.2f} {stats.input_tokens:>9} {stats.output_tokens:>9} "
+                    f"{stats.cached_tokens:>8} {stats.retries:>7} {stats.cost_usd:>9.4f}"
+                )
+        return "\n".join(lines)
+
+    def stage_durations(self) -> dict[str, list[float]]:
+        with self._lock:
+            return {stage: list(stats.durations) for stage, stats in self._stats.items()}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _finish(self, current: Span) -> None:
+        if current.input_tokens is not None or current.output_tokens is not None:
+            current.cost_usd = estimate_cost(
+                current.model,
+                current.input_tokens or 0,
+                current.output_tokens or 0,
+                current.cached_tokens or 0,
+                self._prices,
+            )
+        with self._lock:
+            stats = self._stats[current.stage]
+            stats.add_duration(current.duration_s)
+            stats.errors += current.status == "error"
+            stats.input_tokens += current.input_tokens or 0
+            stats.output_tokens += current.output_tokens or 0
+            stats.cached_tokens += current.cached_tokens or 0
+            stats.retries += current.retries
+            stats.cost_usd += current.cost_usd or 0.0
+            if self._file is not None:
+                self._file.write(current.model_dump_json() + "\n")
+                self._file.flush()
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@contextmanager
+def span(stage: str, job: str | None = None, **attributes: Any) -> Iterator[Span | None]:
+    """Open a span on the active tracer; a no-op when tracing is not active."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(stage, job=job, **attributes) as current:
+        yield current
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def record_usage(
+    input_tokens: int | None = None,
+    output_tokens: int | None = None,
+    cached_tokens: int | None = None,
+) -> None:
+    """Attach token counts reported by a provider response to the current span."""
+    current = _current_span.get()
+    if current is None:
+        return
+    if input_tokens is not None:
+        current.input_tokens = (current.input_tokens or 0) + input_tokens
+    if output_tokens is not None:
+        current.output_tokens = (current.output_tokens or 0) + output_tokens
+    if cached_tokens is not None:
+        current.cached_tokens = (current.cached_tokens or 0) + cached_tokens
+
+
+def record_retry() -> None:
+    current = _current_span.get()
+    if current is not None:
+        current.retries += 1
+
+
+def set_attribute(key: str, value: Any) -> None:
+    current = _current_span.get()
+    if current is not None:
+        current.attributes[key] = value
@@ -0,0 +1,134 @@
+import pytest
+from pydantic import BaseModel
+
+from src.agents.adjust_data import PatchError, adjust_data, apply_patch
+from src.llm.provider import LLMProvider
+from src.matching.relevance import trim_to_budget
+from src.models.experience_data import ExperienceData, ExperienceEntry, Skills
+from src.models.job_keywords import JobDescriptionKeywords
+from src.models.resume_patch import BulletOrder, BulletRewrite, ResumePatch
+from src.models.skill_gap import SkillGapAnalysis
+
+
+def _experience() -> ExperienceData:
+    return ExperienceData(
+        summary="Engineer — generalist.",
+        experience=[
+            ExperienceEntry(
+                title="Barista",
+                company="Cafe — Downtown",
+                date="2015 - 2016",
+                bullets=["Made coffee — fast", "Trained new staff on the espresso machine"],
+            ),
+            ExperienceEntry(
+                title="Backend Engineer",
+                company="Acme",
+                date="2021 - Present",
+                bullets=[
+                    "Organized the office book club",
+                    "Built Kubernetes operators in Go for Postgres failover",
+                    "Cut Postgres query latency by rewriting hot paths",
+                ],
+            ),
+        ],
+        skills=Skills(languages=["Python", "Go"], tools=["Docker", "Kubernetes"]),
+    )
+
+
+def _keywords() -> JobDescriptionKeywords:
+    return JobDescriptionKeywords(
+        job_title="Platform Engineer",
+        seniority_level="Senior",
+        years_of_experience="5+",
+        company_name="Example",
+        department_or_team="Infra",
+        skill_requirements=[],
+        key_responsibilities=["Operate Postgres clusters on Kubernetes"],
+        industry_domain="Cloud",
+        keywords_for_ats=["Kubernetes", "Postgres"],
+        summary_of_role="Run databases.",
+    )
+
+
+class ScriptedProvider(LLMProvider):
+    def __init__(self, *responses: BaseModel) -> None:
+        self.responses = list(responses)
+        self.prompts: list[str] = []
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        self.prompts.append(prompt)
+        response = self.responses.pop(0)
+        assert isinstance(response, output_model)
+        return response
+
+
+def test_applies_edits_and_replaces_em_dashes_only_where_touched() -> None:
+    original = _experience()
+    patch = ResumePatch(
+        summary="Platform engineer — Kubernetes and Postgres.",
+        entry_order=[1, 0],
+        bullet_rewrites=[BulletRewrite(entry=1, bullet=2, text="Cut Postgres p95 latency — rewrote hot paths")],
+        bullet_orders=[BulletOrder(entry=1, order=[1, 2, 0])],
+        skills=Skills(languages=["Go", "Python"], tools=["Kubernetes", "Docker"]),
+    )
+
+    adjusted = apply_patch(original, patch)
+
+    assert adjusted.summary == "Platform engineer - Kubernetes and Postgres."
+    assert [entry.title for entry in adjusted.experience] == ["Backend Engineer", "Barista"]
+    assert adjusted.experience[0].bullets == [
+        "Built Kubernetes operators in Go for Postgres failover",
+        "Cut Postgres p95 latency - rewrote hot paths",
+        "Organized the office book club",
+    ]
+    assert adjusted.experience[1] == original.experience[0]
+    assert adjusted.experience[1].company == "Cafe — Downtown"
+    assert adjusted.skills.languages == ["Go", "Python"]
+    assert original.summary == "Engineer — generalist."
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        ResumePatch(entry_order=[0, 0]),
+        ResumePatch(bullet_rewrites=[BulletRewrite(entry=2, bullet=0, text="x")]),
+        ResumePatch(bullet_rewrites=[BulletRewrite(entry=0, bullet=5, text="x")]),
+        ResumePatch(bullet_orders=[BulletOrder(entry=1, order=[0, 1])]),
+        ResumePatch(skills=Skills(languages=["Go", "Rust"], tools=["Docker", "Kubernetes"])),
+    ],
+)
+def test_rejects_patches_that_do_not_fit(patch: ResumePatch) -> None:
+    with pytest.raises(PatchError):
+        apply_patch(_experience(), patch)
+
+
+def test_trimmed_indices_map_back_to_the_full_resume() -> None:
+    original = _experience()
+    trimmed = trim_to_budget(original, _keywords(), token_budget=120)
+    assert trimmed.entry_indices == [1]
+    sent = trimmed.bullet_indices[1]
+
+    patch = ResumePatch(
+        entry_order=[0],
+        bullet_rewrites=[BulletRewrite(entry=0, bullet=0, text="Rewritten")],
+        bullet_orders=[BulletOrder(entry=0, order=list(reversed(range(len(sent)))))],
+    )
+    adjusted = apply_patch(original, patch, trimmed)
+
+    assert [entry.title for entry in adjusted.experience] == ["Backend Engineer", "Barista"]
+    backend = adjusted.experience[0].bullets
+    assert sorted(backend) == sorted(
+        ["Rewritten", *(bullet for i, bullet in enumerate(original.experience[1].bullets) if i != sent[0])]
+    )
+    assert backend[len(sent) - 1] == "Rewritten"
+
+
+async def test_falls_back_to_full_regeneration_for_an_invalid_patch() -> None:
+    regenerated = _experience().model_copy(update={"summary": "Regenerated — summary."})
+    provider = ScriptedProvider(ResumePatch(entry_order=[5]), regenerated)
+
+    adjusted = await adjust_data(_experience(), _keywords(), SkillGapAnalysis(gaps=[]), provider)
+
+    assert adjusted.summary == "Regenerated - summary."
+    assert '"bullet": 1' in provider.prompts[0]
+    assert '"bullet"' not in provider.prompts[1]
@@ -0,0 +1,134 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from src.llm.batch_provider import BatchLLMProvider
+from src.llm.batch_transport import BatchRequest, BatchResult, BatchStatus, BatchTransport
+from src.pipeline.runtime import stage_limits
+from src.pipeline.scheduler import PipelineScheduler
+from src.settings import Settings
+
+
+class _Keywords(BaseModel):
+    title: str
+
+
+class _Gaps(BaseModel):
+    count: int
+
+
+class _FakeBatchServer(BatchTransport):
+    """In-memory stand-in for a provider batch API that completes after a few polls."""
+
+    name = "fake"
+    model = "fake-batch"
+
+    def __init__(self, polls_until_done: int = 2, final_status: BatchStatus = "completed") -> None:
+        self.submitted: list[list[BatchRequest]] = []
+        self._polls: dict[str, int] = {}
+        self._polls_until_done = polls_until_done
+        self._final_status = final_status
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        self.submitted.append(requests)
+        batch_id = f"batch-{len(self.submitted)}"
+        self._polls[batch_id] = 0
+        return batch_id
+
+    async def status(self, batch_id: str) -> BatchStatus:
+        self._polls[batch_id] += 1
+        return self._final_status if self._polls[batch_id] > self._polls_until_done else "running"
+
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        requests = self.submitted[int(batch_id.split("-")[1]) - 1]
+        results = []
+        for request in requests:
+            if request.prompt == "drop":
+                continue
+            if request.prompt == "invalid":
+                results.append(BatchResult(custom_id=request.custom_id, text="{}"))
+            elif request.output_model is _Keywords:
+                results.append(BatchResult(custom_id=request.custom_id, text=json.dumps({"title": request.prompt})))
+            else:
+                results.append(BatchResult(custom_id=request.custom_id, text=json.dumps({"count": len(request.prompt)})))
+        return results
+
+
+def _provider(server: _FakeBatchServer, **kwargs) -> BatchLLMProvider:
+    return BatchLLMProvider(server, collect_window=0.05, poll_interval=0.001, **kwargs)
+
+
+async def test_concurrent_calls_are_submitted_as_one_batch_per_stage() -> None:
+    server = _FakeBatchServer()
+    provider = _provider(server)
+
+    async def job(i: int) -> tuple[str, int]:
+        keywords = await provider.generate_structured(f"job-{i}", _Keywords)
+        gaps = await provider.generate_structured(keywords.title * 2, _Gaps)
+        return keywords.title, gaps.count
+
+    results = await asyncio.gather(*(job(i) for i in range(5)))
+
+    assert results == [(f"job-{i}", len(f"job-{i}") * 2) for i in range(5)]
+    assert [len(batch) for batch in server.submitted] == [5, 5]
+    assert {request.output_model for request in server.submitted[0]} == {_Keywords}
+    assert {request.output_model for request in server.submitted[1]} == {_Gaps}
+
+
+async def test_max_batch_size_splits_batches() -> None:
+    server = _FakeBatchServer(polls_until_done=0)
+    provider = _provider(server, max_batch_size=2)
+    await asyncio.gather(*(provider.generate_structured(str(i), _Keywords) for i in range(5)))
+    assert sorted(len(batch) for batch in server.submitted) == [1, 2, 2]
+
+
+async def test_per_request_failures_do_not_fail_the_batch() -> None:
+    server = _FakeBatchServer(polls_until_done=0)
+    provider = _provider(server)
+    ok, dropped, invalid = await asyncio.gather(
+        provider.generate_structured("ok", _Keywords),
+        provider.generate_structured("drop", _Keywords),
+        provider.generate_structured("invalid", _Keywords),
+        return_exceptions=True,
+    )
+    assert ok == _Keywords(title="ok")
+    assert isinstance(dropped, RuntimeError)
+    assert isinstance(invalid, ValidationError)
+
+
+async def test_failed_batch_fails_every_call() -> None:
+    provider = _provider(_FakeBatchServer(polls_until_done=0, final_status="expired"))
+    with pytest.raises(RuntimeError, match="expired"):
+        await provider.generate_structured("x", _Keywords)
+
+
+async def test_batch_mode_runs_enough_jobs_for_one_batch_per_stage() -> None:
+    server = _FakeBatchServer(polls_until_done=0)
+    settings = Settings.model_construct(
+        llm_mode="batch",
+        max_concurrent_jobs=2,
+        llm_concurrency=2,
+        md_j2_template=None,
+        master_json=None,
+        personal_json=None,
+        cli_converter_path=None,
+    )
+    scheduler = PipelineScheduler(stage_limits(settings))
+    provider = scheduler.limit_llm(_provider(server))
+
+    async def job(i: int) -> Path:
+        keywords = await provider.generate_structured(f"job-{i}", _Keywords)
+        await provider.generate_structured(keywords.title, _Gaps)
+        await provider.generate_structured(keywords.title, _Keywords)
+        return Path(keywords.title)
+
+    try:
+        outcomes = await scheduler.run(range(10), job)
+    finally:
+        scheduler.shutdown()
+
+    assert all(outcome.succeeded for outcome in outcomes)
+    assert [len(batch) for batch in server.submitted] == [10, 10, 10]
@@ -0,0 +1,35 @@
+import argparse
+import os
+import shutil
+
+import pytest
+
+from benchmarks.fakes import FixtureJobServer
+from benchmarks.pipeline import CORPUS_DIR, _run_batch, _usable_pages
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="the stub PDF CLI needs node")
+async def test_offline_pipeline_benchmark_runs_end_to_end(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(os.environ, "FAKE_PDF_DELAY_MS", "0")
+    args = argparse.Namespace(
+        llm_latency_ms=1.0,
+        llm_latency_sigma=0.2,
+        input_tokens=100,
+        output_tokens=50,
+        tailoring_mode="staged",
+        concurrency=4,
+        llm_concurrency=8,
+        pdf_concurrency=2,
+        caches=False,
+    )
+    pages = _usable_pages(CORPUS_DIR)
+    assert "javascript_shell.html" not in pages
+
+    with FixtureJobServer(CORPUS_DIR) as server:
+        result = await _run_batch(5, server, pages, args)
+
+    assert result["failed"] == 0
+    assert result["llm_calls"] == 15
+    assert result["stages"]["job"]["count"] == 5
+    assert result["stages"]["pdf"]["count"] == 5
+    assert result["jobs_per_s"] > 0 and result["peak_rss_mb"] > 0
@@ -0,0 +1,100 @@
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from src.llm.cached_provider import CachingLLMProvider, ResponseCacheStore
+from src.llm.provider import LLMProvider
+
+
+class _Answer(BaseModel):
+    value: str
+
+
+class _OtherAnswer(BaseModel):
+    value: str
+    score: int = 0
+
+
+class _CountingProvider(LLMProvider):
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def model(self) -> str:
+        return "fake-1"
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        self.calls += 1
+        return output_model.model_validate({"value": f"{prompt}#{self.calls}"})
+
+
+async def test_repeated_prompt_is_served_from_cache(tmp_path: Path) -> None:
+    inner = _CountingProvider()
+    provider = CachingLLMProvider(inner, ResponseCacheStore(tmp_path / "cache.sqlite3"))
+
+    first = await provider.generate_structured("prompt", _Answer)
+    second = await provider.generate_structured("prompt", _Answer)
+
+    assert first == second == _Answer(value="prompt#1")
+    assert inner.calls == 1
+    assert (provider.hits, provider.misses) == (1, 1)
+
+
+async def test_output_schema_is_part_of_the_key(tmp_path: Path) -> None:
+    inner = _CountingProvider()
+    provider = CachingLLMProvider(inner, ResponseCacheStore(tmp_path / "cache.sqlite3"))
+
+    await provider.generate_structured("prompt", _Answer)
+    other = await provider.generate_structured("prompt", _OtherAnswer)
+
+    assert isinstance(other, _OtherAnswer)
+    assert inner.calls == 2
+
+
+async def test_cache_persists_across_store_instances(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    await CachingLLMProvider(_CountingProvider(), ResponseCacheStore(path)).generate_structured("p", _Answer)
+
+    inner = _CountingProvider()
+    result = await CachingLLMProvider(inner, ResponseCacheStore(path)).generate_structured("p", _Answer)
+    assert result.value == "p#1"
+    assert inner.calls == 0
+
+
+async def test_refresh_skips_reads_but_stores(tmp_path: Path) -> None:
+    store = ResponseCacheStore(tmp_path / "cache.sqlite3")
+    inner = _CountingProvider()
+    await CachingLLMProvider(inner, store).generate_structured("p", _Answer)
+
+    refreshed = await CachingLLMProvider(inner, store, mode="refresh").generate_structured("p", _Answer)
+    reused = await CachingLLMProvider(inner, store).generate_structured("p", _Answer)
+
+    assert refreshed.value == reused.value == "p#2"
+    assert inner.calls == 2
+
+
+async def test_bypass_neither_reads_nor_writes(tmp_path: Path) -> None:
+    store = ResponseCacheStore(tmp_path / "cache.sqlite3")
+    inner = _CountingProvider()
+    provider = CachingLLMProvider(inner, store, mode="bypass")
+
+    await provider.generate_structured("p", _Answer)
+    await provider.generate_structured("p", _Answer)
+
+    assert inner.calls == 2
+    assert len(store) == 0
+
+
+async def test_evicts_least_recently_used_and_expired(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    store = ResponseCacheStore(path)
+    provider = CachingLLMProvider(_CountingProvider(), store)
+    for prompt in ("a", "b", "c"):
+        await provider.generate_structured(prompt, _Answer)
+    await provider.generate_structured("a", _Answer)
+    store.close()
+
+    assert len(ResponseCacheStore(path, max_entries=2)) == 2
+    assert len(ResponseCacheStore(path, max_age_seconds=0)) == 0
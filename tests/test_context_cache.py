@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from src.llm.context_cache import SharedPrefixCache
+from src.prompts.prompter import Prompt, Prompter
+
+
+class FakeBackend:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.created: list[str] = []
+        self.refreshed: list[str] = []
+        self.deleted: list[str] = []
+
+    async def create(self, prefix: str, ttl_s: float) -> str:
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("caching unavailable")
+        self.created.append(prefix)
+        return f"cache-{len(self.created)}"
+
+    async def refresh(self, handle: str, ttl_s: float) -> None:
+        self.refreshed.append(handle)
+
+    async def delete(self, handle: str) -> None:
+        self.deleted.append(handle)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(backend: FakeBackend, **kwargs) -> SharedPrefixCache[str]:
+    return SharedPrefixCache(backend.create, backend.refresh, backend.delete, min_tokens=10, **kwargs)
+
+
+LONG = Prompt("instructions and resume " * 10, "job one")
+
+
+@pytest.mark.parametrize("name", ["adjust_data", "adjust_data_patch", "analyze_skill_gaps", "tailor_resume"])
+def test_resume_is_part_of_the_shared_prefix(name: str) -> None:
+    fields = {
+        "experience_data": "<resume>",
+        "job_keywords": "<keywords>",
+        "skill_gaps": "<gaps>",
+        "markdown_content": "<job>",
+    }
+    prompt = Prompter.render(name, **fields)
+
+    assert "<resume>" in prompt.prefix
+    assert not any(value in prompt.prefix for value in ("<keywords>", "<gaps>", "<job>"))
+    assert Prompter.SPLIT not in prompt
+    assert prompt == prompt.prefix + prompt.suffix
+
+
+def test_prompts_for_different_jobs_share_a_prefix_key() -> None:
+    first = Prompter.render("extract_job_keywords", markdown_content="job one")
+    second = Prompter.render("extract_job_keywords", markdown_content="job two")
+
+    assert first.prefix_key == second.prefix_key
+    assert first.suffix != second.suffix
+
+
+async def test_caches_a_prefix_once_it_is_reused() -> None:
+    backend = FakeBackend()
+    cache = _cache(backend)
+
+    assert await cache.handle(Prompt("short", "job")) is None
+    assert await cache.handle(LONG) is None
+    handles = await asyncio.gather(*(cache.handle(Prompt(LONG.prefix, f"job {i}")) for i in range(5)))
+
+    assert handles == ["cache-1"] * 5
+    assert backend.created == [LONG.prefix]
+
+
+async def test_prompts_without_a_suffix_are_sent_uncached() -> None:
+    backend = FakeBackend()
+    cache = _cache(backend)
+
+    for _ in range(3):
+        assert await cache.handle(Prompt(LONG.prefix, " \n")) is None
+    assert backend.created == []
+
+
+async def test_renews_the_cache_near_expiry() -> None:
+    backend = FakeBackend()
+    clock = FakeClock()
+    cache = _cache(backend, ttl_s=100, min_uses=1, clock=clock)
+
+    assert await cache.handle(LONG) == "cache-1"
+    clock.now = 50
+    assert await cache.handle(LONG) == "cache-1"
+    assert backend.refreshed == []
+    clock.now = 90
+    assert await cache.handle(LONG) == "cache-1"
+
+    assert backend.refreshed == ["cache-1"]
+    assert cache.created == 1
+
+
+async def test_failed_creation_is_not_retried() -> None:
+    backend = FakeBackend(fail=True)
+    cache = _cache(backend, min_uses=1)
+
+    assert await cache.handle(LONG) is None
+    backend.fail = False
+    assert await cache.handle(LONG) is None
+    assert backend.created == []
+
+
+async def test_invalidated_and_closed_caches() -> None:
+    backend = FakeBackend()
+    cache = _cache(backend, min_uses=1)
+
+    assert await cache.handle(LONG) == "cache-1"
+    cache.invalidate(LONG)
+    assert await cache.handle(LONG) == "cache-2"
+    await cache.aclose()
+
+    assert backend.deleted == ["cache-2"]
@@ -0,0 +1,93 @@
+import asyncio
+import multiprocessing
+import os
+
+import pytest
+
+from src.extraction.docling_worker_pool import DoclingWorkerPool
+
+
+def _fake_converter_factory():
+    def convert(source: str) -> str:
+        if source == "broken":
+            raise ValueError("unsupported document")
+        return f"{os.getpid()}:{source}"
+
+    return convert
+
+
+def _flaky_converter_factory():
+    if os.environ.get("DOCLING_TEST_FAIL_START"):
+        raise RuntimeError("converter unavailable")
+    return _fake_converter_factory()
+
+
+def _pid(markdown: str) -> str:
+    return markdown.split(":", 1)[0]
+
+
+async def test_workers_are_recycled_after_max_documents() -> None:
+    pool = DoclingWorkerPool(
+        workers=1,
+        max_documents_per_worker=2,
+        converter_factory=_fake_converter_factory,
+    )
+    async with pool:
+        results = [await pool.convert(f"doc-{i}") for i in range(5)]
+
+    assert [result.split(":", 1)[1] for result in results] == [f"doc-{i}" for i in range(5)]
+    pids = [_pid(result) for result in results]
+    assert pids[0] == pids[1]
+    assert pids[1] != pids[2]
+    assert pids[2] == pids[3]
+    assert pids[3] != pids[4]
+
+
+async def test_workers_are_recycled_past_rss_ceiling() -> None:
+    pool = DoclingWorkerPool(
+        workers=1,
+        max_documents_per_worker=None,
+        max_rss_mb=1,
+        converter_factory=_fake_converter_factory,
+    )
+    async with pool:
+        first = await pool.convert("a")
+        second = await pool.convert("b")
+    assert _pid(first) != _pid(second)
+
+
+async def test_convert_many_reports_failures_in_place() -> None:
+    pool = DoclingWorkerPool(workers=2, converter_factory=_fake_converter_factory)
+    async with pool:
+        results = await pool.convert_many(["a", "broken", "b"])
+        assert (await pool.convert("c")).endswith(":c")
+
+    assert results[0].endswith(":a")
+    assert isinstance(results[1], RuntimeError)
+    assert "unsupported document" in str(results[1])
+    assert results[2].endswith(":b")
+
+
+def test_rejects_empty_pool() -> None:
+    with pytest.raises(ValueError):
+        DoclingWorkerPool(workers=0)
+
+
+async def test_lost_worker_fails_convert_instead_of_blocking(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = DoclingWorkerPool(
+        workers=1,
+        max_documents_per_worker=1,
+        converter_factory=_flaky_converter_factory,
+        respawn_attempts=2,
+        respawn_backoff_s=0.01,
+    )
+    async with pool:
+        monkeypatch.setenv("DOCLING_TEST_FAIL_START", "1")
+        assert (await pool.convert("a")).endswith(":a")
+        with pytest.raises(RuntimeError, match="No Docling worker available") as failure:
+            await asyncio.wait_for(pool.convert("b"), timeout=60)
+        assert "converter unavailable" in str(failure.value.__cause__)
+        assert multiprocessing.active_children() == []
+
+        monkeypatch.delenv("DOCLING_TEST_FAIL_START")
+        assert (await asyncio.wait_for(pool.convert("c"), timeout=60)).endswith(":c")
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from src.extraction.html_extractor import HTMLMarkdownExtractor
+from src.extraction.provider import ExtractionError, converter_version
+
+CORPUS = Path(__file__).resolve().parents[1] / "benchmarks" / "corpus"
+
+
+def test_extracts_main_content_without_boilerplate() -> None:
+    markdown = HTMLMarkdownExtractor().extract(str(CORPUS / "board_listing_layout.html"))
+
+    assert markdown.startswith("# Senior Backend Engineer")
+    assert "- Design and build **Python** and **Go** services" in markdown
+    assert "Salary | EUR 85,000 - 105,000" in markdown
+    for boilerplate in ("Similar jobs", "Sign in", "Privacy", "dataLayer", ".job-post"):
+        assert boilerplate not in markdown
+
+
+def test_prefers_structured_job_posting() -> None:
+    markdown = HTMLMarkdownExtractor().extract(str(CORPUS / "structured_data_posting.html"))
+
+    assert markdown.startswith("# Machine Learning Engineer")
+    assert "**Location:** Amsterdam, NL" in markdown
+    assert "### Requirements" in markdown
+    assert "enable JavaScript" not in markdown
+
+
+@pytest.mark.parametrize(
+    ("page", "reason"),
+    [("javascript_shell.html", "words of content"), ("link_directory.html", "links")],
+)
+def test_rejects_pages_failing_quality_checks(page: str, reason: str) -> None:
+    with pytest.raises(ExtractionError, match=reason):
+        HTMLMarkdownExtractor().extract(str(CORPUS / page))
+
+
+def test_leaves_documents_to_docling() -> None:
+    extractor = HTMLMarkdownExtractor()
+    with pytest.raises(ExtractionError, match="pdf"):
+        extractor.extract("https://jobs.example.com/postings/backend-engineer.pdf")
+    with pytest.raises(ExtractionError):
+        extractor.extract("notes.txt")
+
+
+def test_converter_version_tracks_fast_path() -> None:
+    assert converter_version(None).startswith("docling-")
+    assert converter_version(HTMLMarkdownExtractor()).startswith("html-2+docling-")
+
+
+def test_implied_end_tags_close_siblings() -> None:
+    items = "".join(f"<li>Requirement {i}" for i in range(1500))
+    page = f"""<html><body><main><h1>Backend Engineer</h1><p>About the role<p>What you will do
+    <ul>{items}</ul><table><tr><td>a<td>b<tr><td>c<td>d</table></main></body></html>"""
+
+    markdown = HTMLMarkdownExtractor(min_words=10).convert(page)
+
+    assert "About the role\n\nWhat you will do" in markdown
+    assert "- Requirement 0\n- Requirement 1\n" in markdown
+    assert markdown.count("\n- Requirement") == 1500
+    assert "a | b\nc | d" in markdown
+
+
+def test_deeply_nested_markup_does_not_exhaust_the_stack() -> None:
+    page = "<div>" * 5000 + "Python " * 200 + "</div>" * 5000
+
+    assert HTMLMarkdownExtractor().convert(page).startswith("Python Python")
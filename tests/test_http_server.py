@@ -0,0 +1,131 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.job_request import JobRequest
+from src.service.http_server import TailoringHTTPServer
+from src.service.jobs import JobManager
+from src.storage.file_storage import FileStorage
+from src.storage.sqlite_run_store import RunStore
+
+
+async def _request(port: int, method: str, path: str, body: dict | None = None) -> tuple[int, bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), content
+
+
+@pytest.fixture
+async def server(tmp_path: Path):
+    release = asyncio.Event()
+
+    async def run(request: JobRequest) -> Path:
+        await release.wait()
+        if request.text == "fail":
+            raise RuntimeError("model unavailable")
+        (tmp_path / "keywords.json").write_text("{}", encoding="utf-8")
+        output = tmp_path / "resume.pdf"
+        output.write_bytes(b"%PDF-1.7")
+        return output
+
+    manager = JobManager(run, max_concurrent=2)
+    http_server = TailoringHTTPServer(manager, port=0)
+    await http_server.start()
+    yield http_server, release
+    await http_server.close()
+    await manager.aclose()
+
+
+async def test_submit_poll_and_download_artifacts(server) -> None:
+    http_server, release = server
+    status, body = await _request(http_server.port, "POST", "/jobs", {"text": "Senior Python engineer"})
+    assert status == 202
+    job = json.loads(body)
+    assert job["state"] == "queued"
+
+    release.set()
+    status, body = await _request(http_server.port, "POST", "/jobs?wait=true", {"url": "https://example.com/job"})
+    assert status == 200
+    assert json.loads(body)["artifacts"] == ["keywords.json", "resume.pdf"]
+
+    status, body = await _request(http_server.port, "GET", f"/jobs/{job['id']}")
+    assert json.loads(body)["state"] == "succeeded"
+    status, body = await _request(http_server.port, "GET", f"/jobs/{job['id']}/artifacts/resume.pdf")
+    assert (status, body) == (200, b"%PDF-1.7")
+    status, _ = await _request(http_server.port, "GET", f"/jobs/{job['id']}/artifacts/..%2Fsecret")
+    assert status == 404
+
+
+async def test_event_stream_ends_with_terminal_state(server) -> None:
+    http_server, release = server
+    _, body = await _request(http_server.port, "POST", "/jobs", {"text": "fail"})
+    job_id = json.loads(body)["id"]
+
+    stream = asyncio.create_task(_request(http_server.port, "GET", f"/jobs/{job_id}/events"))
+    await asyncio.sleep(0.05)
+    release.set()
+    status, body = await stream
+    states = [json.loads(line)["state"] for line in body.splitlines()]
+    assert status == 200
+    assert states == ["queued", "running", "failed"]
+
+
+async def test_rejects_invalid_requests(server) -> None:
+    http_server, _ = server
+    status, _ = await _request(http_server.port, "POST", "/jobs", {"url": "https://a", "text": "b"})
+    assert status == 422
+    status, _ = await _request(http_server.port, "GET", "/jobs/missing")
+    assert status == 404
+    status, _ = await _request(http_server.port, "DELETE", "/jobs")
+    assert status == 405
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", http_server.port)
+    writer.write(b"POST /jobs HTTP/1.1\r\nContent-Length: lots\r\n\r\n")
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    assert response.startswith(b"HTTP/1.1 400")
+
+
+async def test_lists_and_serves_artifacts_kept_in_the_run_store(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "runs.sqlite3")
+    job_dir = tmp_path / "job"
+
+    async def run(request: JobRequest) -> Path:
+        store.storage(job_dir).save_text("# Posting", Path("job_description.md"))
+        job_dir.mkdir()
+        (job_dir / "resume.pdf").write_bytes(b"%PDF-1.7")
+        return job_dir / "resume.pdf"
+
+    async def artifacts(output_dir: Path) -> FileStorage:
+        return store.storage(output_dir)
+
+    manager = JobManager(run, artifacts=artifacts)
+    http_server = TailoringHTTPServer(manager, port=0)
+    await http_server.start()
+    try:
+        status, body = await _request(http_server.port, "POST", "/jobs?wait=true", {"text": "Senior engineer"})
+        job = json.loads(body)
+        assert job["artifacts"] == ["job_description.md", "resume.pdf"]
+        status, body = await _request(http_server.port, "GET", f"/jobs/{job['id']}/artifacts/job_description.md")
+        assert (status, body) == (200, b"# Posting")
+    finally:
+        await http_server.close()
+        await manager.aclose()
+        store.close()
+
+
+def test_job_request_requires_exactly_one_input() -> None:
+    assert JobRequest(text="desc").label == "inline-text"
+    with pytest.raises(ValidationError):
+        JobRequest()
@@ -0,0 +1,46 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.rendering.jinja_renderer import Jinja2TemplateRenderer
+
+
+def _write_template(path: Path, text: str, mtime_ns: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_recompiles_only_when_template_changes(tmp_path: Path) -> None:
+    template = tmp_path / "resume.md.j2"
+    _write_template(template, "Hello {{ name }}", 1_000_000_000)
+    renderer = Jinja2TemplateRenderer(template)
+
+    assert renderer.render({"name": "Ada"}) == "Hello Ada"
+    compiled = renderer._template
+    os.utime(template, ns=(2_000_000_000, 2_000_000_000))
+    assert renderer.render({"name": "Ada"}) == "Hello Ada"
+    assert renderer._template is compiled
+
+    _write_template(template, "Hi {{ name }}!", 3_000_000_000)
+    assert renderer.render({"name": "Ada"}) == "Hi Ada!"
+
+
+def test_render_many_uses_one_template(tmp_path: Path) -> None:
+    template = tmp_path / "resume.md.j2"
+    template.write_text("{{ n }}", encoding="utf-8")
+    renderer = Jinja2TemplateRenderer(template)
+    assert renderer.render_many([{"n": 1}, {"n": 2}, {"n": 3}]) == ["1", "2", "3"]
+
+
+def test_bytecode_cache_is_written(tmp_path: Path) -> None:
+    template = tmp_path / "resume.md.j2"
+    template.write_text("{{ n }}", encoding="utf-8")
+    cache_dir = tmp_path / "bytecode"
+    Jinja2TemplateRenderer(template, bytecode_cache_dir=cache_dir).render({"n": 1})
+    assert any(cache_dir.iterdir())
+
+
+def test_missing_template_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="Template not found"):
+        Jinja2TemplateRenderer(tmp_path / "missing.j2").render({})
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+import pytest
+
+from src.pipeline.job_source import parse_job_line, read_job_requests
+
+
+def test_parse_job_line_accepts_urls_and_objects() -> None:
+    assert parse_job_line('"https://example.com/job"').url == "https://example.com/job"
+    request = parse_job_line('{"text": "Python developer", "source": "board-1", "metadata": {"id": 7}}')
+    assert request.label == "board-1"
+    assert request.metadata == {"id": 7}
+    assert parse_job_line("   ") is None
+    assert parse_job_line("# comment") is None
+    with pytest.raises(ValueError):
+        parse_job_line('{"url": "https://a", "text": "b"}')
+
+
+async def test_read_job_requests_skips_invalid_lines(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.jsonl"
+    path.write_text(
+        '"https://example.com/1"\n{not json\n\n{"url": "https://example.com/2"}\n{"text": ""}\n',
+        encoding="utf-8",
+    )
+
+    requests = [request async for request in read_job_requests(path)]
+
+    assert [request.url for request in requests] == ["https://example.com/1", "https://example.com/2", None]
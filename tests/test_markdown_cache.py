@@ -0,0 +1,74 @@
+import time
+from pathlib import Path
+
+from src.extraction.markdown_cache import MarkdownCache, normalize_url
+
+
+def test_normalize_url_drops_tracking_and_fragment() -> None:
+    assert normalize_url("HTTPS://Example.com/jobs/42/?utm_source=x&b=2&a=1#apply") == (
+        "https://example.com/jobs/42?a=1&b=2"
+    )
+
+
+def test_hit_after_put_and_stats(tmp_path: Path) -> None:
+    cache = MarkdownCache(tmp_path, converter_version="v1")
+    assert cache.get("https://example.com/a") is None
+    cache.put("https://example.com/a", "# Job", conversion_seconds=2.5)
+
+    assert cache.get("https://example.com/a/?utm_campaign=z") == "# Job"
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+    assert stats.bytes_served == len("# Job")
+    assert stats.conversion_seconds_saved == 2.5
+
+
+def test_converter_version_is_part_of_the_key(tmp_path: Path) -> None:
+    MarkdownCache(tmp_path, converter_version="v1").put("https://example.com/a", "old")
+    assert MarkdownCache(tmp_path, converter_version="v2").get("https://example.com/a") is None
+    assert MarkdownCache(tmp_path, converter_version="v1").get("https://example.com/a") == "old"
+
+
+def test_expired_entries_miss_unless_revalidated(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    def revalidate(url: str, entry) -> bool:
+        calls.append(url)
+        return url.endswith("/fresh")
+
+    cache = MarkdownCache(tmp_path, converter_version="v1", ttl_seconds=0.01, revalidate=revalidate)
+    cache.put("https://example.com/fresh", "kept")
+    cache.put("https://example.com/stale", "dropped")
+    time.sleep(0.02)
+
+    assert cache.get("https://example.com/fresh") == "kept"
+    assert cache.get("https://example.com/stale") is None
+    assert len(calls) == 2
+    assert cache.stats.revalidated == 1
+    assert cache.stats.expired == 1
+
+
+def test_evicts_least_recently_used_past_size_limit(tmp_path: Path) -> None:
+    cache = MarkdownCache(tmp_path, converter_version="v1", max_bytes=20)
+    cache.put("https://example.com/a", "a" * 8)
+    cache.put("https://example.com/b", "b" * 8)
+    assert cache.get("https://example.com/a") is not None
+    cache.put("https://example.com/c", "c" * 8)
+
+    assert cache.get("https://example.com/b") is None
+    assert cache.get("https://example.com/a") == "a" * 8
+    assert cache.get("https://example.com/c") == "c" * 8
+    assert cache.size_bytes() <= 20
+    assert cache.stats.evictions == 1
+
+
+def test_save_stats_accumulates_across_sessions(tmp_path: Path) -> None:
+    first = MarkdownCache(tmp_path, converter_version="v1")
+    first.put("https://example.com/a", "x", conversion_seconds=1.0)
+    first.get("https://example.com/a")
+    first.save_stats()
+
+    second = MarkdownCache(tmp_path, converter_version="v1")
+    second.get("https://example.com/a")
+    totals = second.save_stats()
+    assert totals.hits == 2
+    assert totals.conversion_seconds_saved == 2.0
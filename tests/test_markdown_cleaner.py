@@ -0,0 +1,116 @@
+from src.extraction.markdown_cleaner import CleaningStats, clean_job_markdown
+
+POSTING = """
+Northwind Analytics helps retailers forecast demand for millions of products every day. Our platform
+ingests point-of-sale data, weather signals and promotions to produce forecasts that planners trust.
+"""
+
+PAGE = f"""
+[Skip to content](#main)
+
+- [Jobs](/jobs)
+- [Companies](/companies)
+- [Sign in](/login)
+
+<!-- image -->
+
+We use cookies to improve your experience. Accept all
+
+# Senior Backend Engineer
+
+Berlin (Hybrid)
+
+{POSTING}
+
+## Requirements
+
+- 5+ years building backend systems in Python or Go.
+- [Kubernetes](https://kubernetes.io), Terraform and AWS in production.
+
+## Salary
+
+EUR 85,000 - 105,000
+
+[Apply now](/apply)
+
+## Similar jobs
+
+Data Engineer at Contoso, a long description of another role that should never reach the prompt at all.
+
+- [Backend Engineer at Fabrikam](/jobs/2)
+
+## Share
+
+{POSTING}
+
+© 2026 Northwind. All rights reserved. [Privacy](/privacy)
+"""
+
+
+def test_keeps_posting_and_drops_page_chrome() -> None:
+    result = clean_job_markdown(PAGE)
+
+    assert result.markdown.startswith("# Senior Backend Engineer\n\nBerlin (Hybrid)")
+    assert "- [Kubernetes](https://kubernetes.io), Terraform and AWS in production." in result.markdown
+    assert result.markdown.endswith("## Salary\n\nEUR 85,000 - 105,000")
+    for chrome in ("Skip to content", "Sign in", "cookies", "image", "Apply now", "Contoso", "Fabrikam", "©"):
+        assert chrome not in result.markdown
+    assert result.markdown.count("Northwind Analytics helps") == 1
+    assert result.tokens_after < result.tokens_before / 2
+    assert not result.truncated
+
+
+def test_caps_length_at_block_boundary() -> None:
+    paragraphs = [f"Paragraph {i}" + " describing the role in some detail" * 10 for i in range(20)]
+    result = clean_job_markdown("\n\n".join(paragraphs), token_budget=200)
+
+    assert result.truncated
+    assert result.tokens_after <= 200
+    assert result.markdown.split("\n\n") == paragraphs[: len(result.markdown.split("\n\n"))]
+
+
+def test_returns_original_when_nothing_survives() -> None:
+    assert clean_job_markdown("[Jobs](/jobs) [Login](/login)").markdown == "[Jobs](/jobs) [Login](/login)"
+
+
+def test_stats_summarize_savings_per_board() -> None:
+    stats = CleaningStats()
+    stats.add("jobs.example.com", clean_job_markdown(PAGE))
+    stats.add("jobs.example.com", clean_job_markdown(PAGE))
+
+    summary = stats.summary()
+    assert len(stats) == 1
+    assert "jobs.example.com" in summary and "    2 " in summary
+
+
+def test_keeps_requirements_that_mention_boilerplate_words() -> None:
+    requirements = (
+        "- 5+ years of Python\n"
+        "- PostgreSQL\n"
+        "- Experience building login and SSO flows\n"
+        "- Built newsletter subscribe and sign up funnels"
+    )
+    page = f"Accept all cookies\n\n# Backend Engineer\n\n{POSTING}\n\n## Requirements\n\n{requirements}\n\nSign in"
+
+    result = clean_job_markdown(page)
+
+    assert result.markdown.endswith(f"## Requirements\n\n{requirements}")
+    assert "cookies" not in result.markdown
+    assert "Sign in" not in result.markdown
+
+
+def test_keeps_every_short_header_line_above_the_body() -> None:
+    header = [
+        "# Senior Backend Engineer",
+        "Northwind Analytics",
+        "Berlin, Germany",
+        "Full-time",
+        "EUR 85,000 - 105,000",
+        "Posted 3 days ago",
+    ]
+    page = "\n\n".join(["We use cookies to improve your experience. Accept all", *header, POSTING.strip()])
+
+    result = clean_job_markdown(page)
+
+    assert result.markdown.startswith("\n\n".join(header))
+    assert "cookies" not in result.markdown
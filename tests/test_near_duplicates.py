@@ -0,0 +1,66 @@
+import random
+import time
+from pathlib import Path
+
+from src.matching.near_duplicates import MinHasher, PostingIndex, similarity
+
+POSTING = """
+# Senior Platform Engineer
+
+We are looking for a senior platform engineer to design, build and operate the
+infrastructure that powers our data products. You will own our Kubernetes
+clusters, improve CI/CD pipelines, and work closely with product teams to ship
+reliable services. Requirements: 5+ years of experience with Go or Python,
+production Kubernetes, Terraform, PostgreSQL and observability tooling such as
+Prometheus and Grafana. Nice to have: experience with Kafka and on-call rotations.
+"""
+
+REPOST = POSTING.replace("# Senior Platform Engineer", "## Senior Platform Engineer (Remote)") + "\nApply via our site."
+
+UNRELATED = """
+# Pastry Chef
+
+Our bakery is hiring a pastry chef to prepare croissants, tarts and seasonal
+desserts. You will manage ingredient orders, train apprentices and keep the
+kitchen spotless. Requirements: culinary diploma and three years in a bakery.
+"""
+
+
+def test_signatures_estimate_similarity() -> None:
+    hasher = MinHasher(num_perm=64)
+    original = hasher.signature(POSTING)
+    assert similarity(original, hasher.signature(REPOST)) > 0.8
+    assert similarity(original, hasher.signature(UNRELATED)) < 0.2
+    assert hasher.signature(POSTING) == original
+
+
+def test_index_finds_near_duplicates_above_threshold(tmp_path: Path) -> None:
+    index = PostingIndex(tmp_path / "postings.sqlite3", threshold=0.8)
+    index.add(index.hasher.signature(POSTING), "https://a.example/1", tmp_path / "job1", gaps_key="g1")
+    index.add(index.hasher.signature(UNRELATED), "https://a.example/2", tmp_path / "job2")
+
+    match = index.find(index.hasher.signature(REPOST))
+    assert match is not None
+    assert match.source == "https://a.example/1"
+    assert match.gaps_key == "g1"
+    assert index.find(index.hasher.signature("Completely different text about gardening and tomatoes.")) is None
+    index.close()
+
+    reopened = PostingIndex(tmp_path / "postings.sqlite3", threshold=0.8)
+    assert len(reopened) == 2
+    assert reopened.find(reopened.hasher.signature(REPOST)).output_dir == tmp_path / "job1"
+    reopened.close()
+
+
+def test_lookup_cost_does_not_grow_with_index_size(tmp_path: Path) -> None:
+    index = PostingIndex(tmp_path / "postings.sqlite3")
+    rng = random.Random(0)
+    for i in range(5000):
+        index.add(tuple(rng.randrange(1 << 61) for _ in range(64)), f"job-{i}", tmp_path)
+    probe = index.hasher.signature(POSTING)
+
+    started = time.perf_counter()
+    for _ in range(200):
+        index.find(probe)
+    assert (time.perf_counter() - started) / 200 < 0.002
+    index.close()
@@ -0,0 +1,214 @@
+import asyncio
+import re
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from src.export.node_worker_pdf_exporter import WORKER_SCRIPT, NodeWorkerPDFExporter
+from src.export.node_worker_pool import NodeWorkerPool
+from src.export.markdown_to_pdf_exporter import MarkdownToPDFExporter
+from src.rendering.provider import TemplateRenderer
+from src.settings import BASE_DIR
+
+_FAKE_WORKER = """
+import json, os, sys, time
+print(json.dumps({"ready": True}), flush=True)
+for line in sys.stdin:
+    job = json.loads(line)
+    if job["markdown"] == "crash":
+        os._exit(1)
+    if job["markdown"] == "hang":
+        time.sleep(60)
+    if job["markdown"] == "huge":
+        print(json.dumps({"id": job["id"], "ok": False, "error": "x" * 200_000}), flush=True)
+        continue
+    if job["markdown"] == "stale":
+        print(json.dumps({"id": job["id"] - 1, "ok": True}), flush=True)
+        continue
+    if job["markdown"] == "fail":
+        print(json.dumps({"id": job["id"], "ok": False, "error": "bad markdown"}), flush=True)
+        continue
+    with open(job["output"], "w") as f:
+        f.write(f"{os.getpid()}|{job['paper']}|{job['markdown']}")
+    print(json.dumps({"id": job["id"], "ok": True}), flush=True)
+"""
+
+
+class _EchoRenderer(TemplateRenderer):
+    def render(self, data: Dict[str, Any]) -> str:
+        return data["markdown"]
+
+
+@pytest.fixture
+def worker_command(tmp_path: Path) -> list[str]:
+    script = tmp_path / "fake_worker.py"
+    script.write_text(_FAKE_WORKER, encoding="utf-8")
+    return [sys.executable, str(script)]
+
+
+def _exporter(command: list[str], **kwargs: Any) -> NodeWorkerPDFExporter:
+    return NodeWorkerPDFExporter(
+        renderer=_EchoRenderer(),
+        cli_path=Path("md-resume.js"),
+        paper="Letter",
+        command=command,
+        **kwargs,
+    )
+
+
+async def test_export_many_reuses_warm_workers(worker_command: list[str], tmp_path: Path) -> None:
+    exporter = _exporter(worker_command, workers=2)
+    jobs = [({"markdown": f"resume {i}"}, tmp_path / f"{i}.pdf") for i in range(6)]
+    try:
+        results = await exporter.export_many(jobs)
+    finally:
+        await exporter.close()
+
+    contents = [path.read_text() for path in results]
+    assert [content.split("|", 2)[2] for content in contents] == [f"resume {i}" for i in range(6)]
+    assert all(content.split("|")[1] == "Letter" for content in contents)
+    assert len({content.split("|")[0] for content in contents}) <= 2
+
+
+async def test_crashed_worker_is_replaced_and_job_retried(worker_command: list[str], tmp_path: Path) -> None:
+    pool = NodeWorkerPool(worker_command, size=1)
+    async with pool:
+        with pytest.raises(RuntimeError, match="crashed twice"):
+            await pool.submit({"markdown": "crash", "output": str(tmp_path / "x.pdf"), "paper": "A4"})
+        response = await pool.submit({"markdown": "ok", "output": str(tmp_path / "y.pdf"), "paper": "A4"})
+    assert response["ok"]
+
+
+async def test_out_of_turn_response_discards_worker(worker_command: list[str], tmp_path: Path) -> None:
+    pool = NodeWorkerPool(worker_command, size=1)
+    async with pool:
+        with pytest.raises(RuntimeError, match="twice"):
+            await pool.submit({"markdown": "stale", "output": str(tmp_path / "x.pdf"), "paper": "A4"})
+        response = await pool.submit({"markdown": "ok", "output": str(tmp_path / "y.pdf"), "paper": "A4"})
+    assert response["ok"]
+
+
+async def test_oversized_response_discards_worker(worker_command: list[str], tmp_path: Path) -> None:
+    pool = NodeWorkerPool(worker_command, size=1)
+    async with pool:
+        with pytest.raises(ValueError):
+            await pool.submit({"markdown": "huge", "output": str(tmp_path / "x.pdf"), "paper": "A4"})
+        response = await asyncio.wait_for(
+            pool.submit({"markdown": "ok", "output": str(tmp_path / "y.pdf"), "paper": "A4"}), timeout=10
+        )
+    assert response["ok"]
+
+
+async def test_timed_out_job_kills_worker(worker_command: list[str], tmp_path: Path) -> None:
+    exporter = _exporter(worker_command, job_timeout=0.5)
+    try:
+        with pytest.raises(RuntimeError, match="timed out"):
+            await exporter.export_async({"markdown": "hang"}, tmp_path / "a.pdf")
+        assert await exporter.export_async({"markdown": "after"}, tmp_path / "b.pdf") == (tmp_path / "b.pdf")
+    finally:
+        await exporter.close()
+
+
+async def test_worker_error_is_reported(worker_command: list[str], tmp_path: Path) -> None:
+    exporter = _exporter(worker_command)
+    try:
+        with pytest.raises(RuntimeError, match="bad markdown"):
+            await exporter.export_async({"markdown": "fail"}, tmp_path / "a.pdf")
+    finally:
+        await exporter.close()
+
+
+_FAKE_PUPPETEER = """
+const fs = require("node:fs");
+exports.launch = async () => ({
+  newPage: async () => {
+    let html = "";
+    return {
+      setContent: async (content, options) => { html = `${options.waitUntil}\\n${content}`; },
+      waitForFunction: async () => {},
+      pdf: async ({ path }) => fs.writeFileSync(path, html),
+      close: async () => {},
+    };
+  },
+  close: async () => {},
+});
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+async def test_worker_uses_md_resume_theme_and_local_iconify(tmp_path: Path) -> None:
+    package = tmp_path / "md-resume"
+    modules = package / "node_modules"
+    for name, source in {
+        "puppeteer": _FAKE_PUPPETEER,
+        "markdown-it": "module.exports = class { render(source) { return `<h1>${source}</h1>`; } };",
+        "@iconify/iconify": "window.Iconify = {};",
+    }.items():
+        (modules / name).mkdir(parents=True)
+        (modules / name / "index.js").write_text(source, encoding="utf-8")
+    (package / "package.json").write_text("{}", encoding="utf-8")
+    (package / "themes").mkdir()
+    (package / "themes" / "default.css").write_text("h1 { color: teal; }", encoding="utf-8")
+    (package / "bin").mkdir()
+    cli = package / "bin" / "md-resume.js"
+    cli.write_text("", encoding="utf-8")
+
+    exporter = NodeWorkerPDFExporter(
+        renderer=_EchoRenderer(), cli_path=cli, command=["node", str(WORKER_SCRIPT), str(cli)]
+    )
+    try:
+        output = await exporter.export_async({"markdown": "Ada Lovelace"}, tmp_path / "resume.pdf")
+    finally:
+        await exporter.close()
+
+    html = output.read_text(encoding="utf-8")
+    assert html.startswith("load\n")
+    assert "h1 { color: teal; }" in html
+    assert "window.Iconify = {};" in html
+    assert "<h1>Ada Lovelace</h1>" in html
+    assert "https://" not in html
+
+
+_MD_RESUME_CLI = BASE_DIR / "external/markdown_resume/packages/pdf-cli/bin/md-resume.js"
+_PARITY_RESUME = """# Ada Lovelace
+
+London · ada@example.com
+
+## Experience
+
+### Analyst, Analytical Engine Project
+*1842 - 1843*
+
+- Translated and annotated Menabrea's paper on the Analytical Engine
+- Wrote the first published algorithm for Bernoulli numbers
+
+## Skills
+
+Mathematics, Programming, Technical writing
+"""
+
+
+def _page_boxes(pdf: bytes) -> list[bytes]:
+    return re.findall(rb"/MediaBox\s*\[([^\]]*)\]", pdf)
+
+
+@pytest.mark.skipif(
+    shutil.which("node") is None or not _MD_RESUME_CLI.exists(), reason="needs node and the md-resume submodule"
+)
+async def test_worker_pdf_matches_cli_pdf(tmp_path: Path) -> None:
+    renderer = _EchoRenderer()
+    cli_pdf = MarkdownToPDFExporter(renderer=renderer, cli_path=_MD_RESUME_CLI).export(
+        {"markdown": _PARITY_RESUME}, tmp_path / "cli" / "resume.pdf"
+    )
+    exporter = NodeWorkerPDFExporter(renderer=renderer, cli_path=_MD_RESUME_CLI)
+    try:
+        worker_pdf = await exporter.export_async({"markdown": _PARITY_RESUME}, tmp_path / "worker" / "resume.pdf")
+    finally:
+        await exporter.close()
+
+    cli_boxes, worker_boxes = _page_boxes(cli_pdf.read_bytes()), _page_boxes(worker_pdf.read_bytes())
+    assert cli_boxes
+    assert worker_boxes == cli_boxes
@@ -0,0 +1,94 @@
+from src.matching.relevance import bm25_scores, restore_trimmed, trim_to_budget
+from src.models.experience_data import AwardEntry, ExperienceData, ExperienceEntry, PublicationEntry, Skills
+from src.models.job_keywords import JobDescriptionKeywords, SkillRequirement
+
+
+def _experience() -> ExperienceData:
+    return ExperienceData(
+        summary="Engineer.",
+        experience=[
+            ExperienceEntry(
+                title="Backend Engineer",
+                company="Acme",
+                date="2021 - Present",
+                bullets=[
+                    "Organized the office book club",
+                    "Built Kubernetes operators in Go for Postgres failover",
+                    "Cut Postgres query latency by rewriting hot paths",
+                ],
+            ),
+            ExperienceEntry(
+                title="Barista",
+                company="Cafe",
+                date="2015 - 2016",
+                bullets=["Made coffee for early customers", "Trained new staff on the espresso machine"],
+            ),
+        ],
+        skills=Skills(languages=["Go"], tools=["Kubernetes"]),
+        publications=[PublicationEntry(id="p1", title="Coffee foam dynamics", authors="Me", conference="CafeConf")],
+        awards=[AwardEntry(title="Best Postgres talk", award="KubeCon", year=2022)],
+    )
+
+
+def _keywords() -> JobDescriptionKeywords:
+    return JobDescriptionKeywords(
+        job_title="Platform Engineer",
+        seniority_level="Senior",
+        years_of_experience="5+",
+        company_name="Example",
+        department_or_team="Infra",
+        skill_requirements=[
+            SkillRequirement(skills=["Kubernetes", "PostgreSQL", "Go"], category="technical", importance="required")
+        ],
+        key_responsibilities=["Operate Postgres clusters on Kubernetes"],
+        industry_domain="Cloud",
+        keywords_for_ats=["Kubernetes", "Postgres"],
+        summary_of_role="Run databases.",
+    )
+
+
+def test_bm25_prefers_job_relevant_text() -> None:
+    scores = bm25_scores(
+        ["Organized the office book club", "Built Kubernetes operators for Postgres failover"], _keywords()
+    )
+    assert scores[1] > scores[0] == 0.0
+
+
+def test_trim_keeps_top_items_in_original_order() -> None:
+    trimmed = trim_to_budget(_experience(), _keywords(), token_budget=130)
+
+    assert trimmed.entry_indices == [0]
+    assert len(trimmed.data.experience) == 1
+    assert trimmed.data.experience[0].bullets == [
+        "Built Kubernetes operators in Go for Postgres failover",
+        "Cut Postgres query latency by rewriting hot paths",
+    ]
+    assert [award.title for award in trimmed.data.awards] == ["Best Postgres talk"]
+    assert trimmed.data.publications == []
+    assert trimmed.held_back_bullets == 3
+
+
+def test_large_budget_sends_everything() -> None:
+    trimmed = trim_to_budget(_experience(), _keywords(), token_budget=100_000)
+    assert trimmed.data == _experience()
+    assert not trimmed.trimmed
+
+
+def test_restore_carries_unsent_items_through_unchanged() -> None:
+    original = _experience()
+    trimmed = trim_to_budget(original, _keywords(), token_budget=130)
+    adjusted = trimmed.data.model_copy(deep=True)
+    adjusted.summary = "Platform engineer."
+    adjusted.experience[0].bullets = list(reversed(adjusted.experience[0].bullets))
+
+    restored = restore_trimmed(adjusted, trimmed, original)
+
+    assert restored.summary == "Platform engineer."
+    assert restored.experience[0].bullets == [
+        "Cut Postgres query latency by rewriting hot paths",
+        "Built Kubernetes operators in Go for Postgres failover",
+        "Organized the office book club",
+    ]
+    assert restored.experience[1] == original.experience[1]
+    assert restored.publications == original.publications
+    assert restored.awards == original.awards
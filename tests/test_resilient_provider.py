@@ -0,0 +1,139 @@
+import asyncio
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from src.llm.provider import LLMProvider
+from src.llm.resilient_provider import (
+    ProviderRateLimiter,
+    RateLimits,
+    ResilientLLMProvider,
+    TokenBucket,
+    is_retryable,
+    retry_after_seconds,
+)
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class _Response:
+    def __init__(self, headers: dict[str, str]) -> None:
+        self.headers = headers
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after: str | None = None) -> None:
+        super().__init__("rate limited")
+        self.status_code = 429
+        self.response = _Response({"retry-after": retry_after} if retry_after else {})
+
+
+class BadRequestError(Exception):
+    status_code = 400
+
+
+class ScriptedProvider(LLMProvider):
+    name = "fake"
+
+    def __init__(self, steps: list) -> None:
+        self.steps = steps
+        self.calls = 0
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        step = self.steps[min(self.calls, len(self.steps) - 1)]
+        self.calls += 1
+        if isinstance(step, float):
+            await asyncio.sleep(step)
+            return output_model.model_validate({"value": self.calls})
+        if isinstance(step, Exception):
+            raise step
+        return output_model.model_validate_json(step)
+
+
+async def test_retries_rate_limits_honoring_retry_after() -> None:
+    inner = ScriptedProvider([RateLimitError(retry_after="0.05"), '{"value": 7}'])
+    provider = ResilientLLMProvider(inner, backoff_base=10.0)
+
+    started = time.perf_counter()
+    assert (await provider.generate_structured("p", Answer)).value == 7
+    assert 0.05 <= time.perf_counter() - started < 1.0
+    assert inner.calls == 2
+    assert provider.retries == 1
+
+
+async def test_non_retryable_errors_are_raised_immediately() -> None:
+    inner = ScriptedProvider([BadRequestError()])
+    provider = ResilientLLMProvider(inner, backoff_base=0.0)
+
+    with pytest.raises(BadRequestError):
+        await provider.generate_structured("p", Answer)
+    assert inner.calls == 1
+
+
+async def test_invalid_responses_are_retried_up_to_the_limit() -> None:
+    inner = ScriptedProvider(['{"value": "x"}'])
+    provider = ResilientLLMProvider(inner, validation_retries=2)
+
+    with pytest.raises(ValueError):
+        await provider.generate_structured("p", Answer)
+    assert inner.calls == 3
+
+
+async def test_slow_calls_are_hedged() -> None:
+    inner = ScriptedProvider([0.01] * 5 + [1.0, 0.01])
+    provider = ResilientLLMProvider(inner, hedge_percentile=50, hedge_min_samples=5)
+    for _ in range(5):
+        await provider.generate_structured("p", Answer)
+
+    started = time.perf_counter()
+    result = await provider.generate_structured("p", Answer)
+    assert time.perf_counter() - started < 0.5
+    assert result.value == 7
+    assert provider.hedges == 1
+
+
+async def test_cancelling_a_hedgeable_call_cancels_the_request() -> None:
+    inner = ScriptedProvider([0.05] * 5 + [5.0])
+    provider = ResilientLLMProvider(inner, hedge_percentile=99, hedge_min_samples=5)
+    for _ in range(5):
+        await provider.generate_structured("p", Answer)
+
+    call = asyncio.ensure_future(provider.generate_structured("p", Answer))
+    await asyncio.sleep(0.01)
+    request = next(
+        task for task in asyncio.all_tasks() if task.get_coro().__qualname__ == "ResilientLLMProvider._call"
+    )
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    await asyncio.sleep(0)
+    assert request.cancelled()
+    assert provider.hedges == 0
+
+
+async def test_token_bucket_throttles_to_rate() -> None:
+    bucket = TokenBucket(per_minute=600, capacity=1)
+    started = time.perf_counter()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.perf_counter() - started >= 0.18
+
+
+async def test_limiter_uses_per_provider_limits_and_pauses() -> None:
+    limiter = ProviderRateLimiter(limits={"fake:m": RateLimits(requests_per_minute=6000)})
+    limiter.pause("fake", "m", 0.05)
+    started = time.perf_counter()
+    await limiter.acquire("fake", "m", tokens=10)
+    assert time.perf_counter() - started >= 0.04
+    await limiter.acquire("other", "m", tokens=10)
+
+
+def test_error_classification() -> None:
+    assert is_retryable(RateLimitError())
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(BadRequestError())
+    assert retry_after_seconds(RateLimitError(retry_after="3")) == 3.0
+    assert retry_after_seconds(RateLimitError()) is None
@@ -0,0 +1,157 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, SecretStr
+
+from src.llm.provider import LLMProvider
+from src.llm.routing_provider import RoutingLLMProvider, stage_for
+from src.models.job_keywords import JobDescriptionKeywords
+from src.pipeline import runtime as runtime_module
+from src.pipeline.runtime import PipelineRuntime
+from src.settings import LLMBackend, Settings
+
+
+class Answer(BaseModel):
+    value: str
+
+
+class FakeBackend(LLMProvider):
+    name = "fake"
+
+    def __init__(self, label: str, delay: float = 0.0, fail: bool = False) -> None:
+        self.label = label
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.label} is down")
+        return output_model.model_validate({"value": self.label})
+
+
+async def test_prefers_faster_backend_after_exploring() -> None:
+    slow, fast = FakeBackend("slow", delay=0.02), FakeBackend("fast", delay=0.0)
+    router = RoutingLLMProvider({"slow": slow, "fast": fast}, min_samples=2)
+
+    results = [(await router.generate_structured("p", Answer)).value for _ in range(10)]
+
+    assert slow.calls == 2
+    assert results[-6:] == ["fast"] * 6
+    assert router.ranking("Answer") == ["fast", "slow"]
+
+
+async def test_fails_over_and_demotes_failing_backend() -> None:
+    broken, healthy = FakeBackend("broken", fail=True), FakeBackend("healthy", delay=0.001)
+    router = RoutingLLMProvider({"broken": broken, "healthy": healthy}, min_samples=1)
+
+    for _ in range(5):
+        assert (await router.generate_structured("p", Answer)).value == "healthy"
+
+    assert broken.calls == 1
+    assert router.stats()["broken/Answer"]["error_rate"] == 1.0
+
+
+async def test_pins_stage_to_backend_order() -> None:
+    cheap, strong = FakeBackend("cheap"), FakeBackend("strong")
+    router = RoutingLLMProvider({"cheap": cheap, "strong": strong}, pins={"Answer": ["strong", "cheap"]})
+
+    for _ in range(5):
+        assert (await router.generate_structured("p", Answer)).value == "strong"
+    assert cheap.calls == 0
+
+    strong.fail = True
+    assert (await router.generate_structured("p", Answer)).value == "cheap"
+
+
+async def test_raises_last_error_when_every_backend_fails() -> None:
+    router = RoutingLLMProvider({"a": FakeBackend("a", fail=True), "b": FakeBackend("b", fail=True)})
+    with pytest.raises(RuntimeError):
+        await router.generate_structured("p", Answer)
+
+
+def test_rejects_unknown_pins() -> None:
+    with pytest.raises(ValueError, match="missing"):
+        RoutingLLMProvider({"a": FakeBackend("a")}, pins={"keywords": ["missing"]})
+    assert stage_for(JobDescriptionKeywords) == "keywords"
+
+
+class _Unavailable(Exception):
+    status_code = 503
+
+
+class _ModelBackend(LLMProvider):
+    name = "fake"
+
+    def __init__(self, model: str) -> None:
+        self._model = model
+        self.down = False
+        self.calls = 0
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        self.calls += 1
+        if self.down:
+            raise _Unavailable(f"{self._model} is overloaded")
+        return output_model.model_validate({"value": self._model})
+
+
+def _routed_provider(
+    monkeypatch: pytest.MonkeyPatch, backends: dict[str, _ModelBackend], cache_path: Path | None = None
+) -> tuple[PipelineRuntime, LLMProvider]:
+    monkeypatch.setattr(runtime_module, "create_llm_provider", lambda model, **_: backends[model])
+    settings = Settings.model_construct(
+        llm_api_key=SecretStr("key"),
+        llm_backends={name: LLMBackend(provider="openai", model=name) for name in backends},
+        llm_stage_backends={"Answer": list(backends)},
+        llm_max_retries=3,
+        llm_backoff_base_s=0.001,
+        llm_backoff_max_s=0.001,
+        llm_cache_path=cache_path,
+        md_j2_template=None,
+        master_json=None,
+        personal_json=None,
+        cli_converter_path=None,
+    )
+    runtime = PipelineRuntime.__new__(PipelineRuntime)
+    runtime.settings = settings
+    runtime.response_cache = None
+    runtime.caching_providers = []
+    return runtime, runtime._build_provider()
+
+
+async def test_runtime_router_fails_over_before_retrying(monkeypatch: pytest.MonkeyPatch) -> None:
+    primary, secondary = _ModelBackend("primary"), _ModelBackend("secondary")
+    primary.down = True
+    _, provider = _routed_provider(monkeypatch, {"primary": primary, "secondary": secondary})
+
+    assert (await provider.generate_structured("p", Answer)).value == "secondary"
+    assert primary.calls == 1
+
+    secondary.down = True
+    with pytest.raises(_Unavailable):
+        await provider.generate_structured("p", Answer)
+    assert secondary.calls == 1 + 4
+
+
+async def test_runtime_caches_responses_per_backend(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    primary, secondary = _ModelBackend("primary"), _ModelBackend("secondary")
+    cache_path = tmp_path / "cache.sqlite"
+    runtime, provider = _routed_provider(monkeypatch, {"primary": primary, "secondary": secondary}, cache_path)
+    assert (await provider.generate_structured("p", Answer)).value == "primary"
+    assert (await provider.generate_structured("p", Answer)).value == "primary"
+    assert primary.calls == 1
+    runtime.response_cache.close()
+
+    # Preferring the other backend must not serve the first backend's cached answer.
+    runtime, provider = _routed_provider(monkeypatch, {"secondary": secondary, "primary": primary}, cache_path)
+    assert (await provider.generate_structured("p", Answer)).value == "secondary"
+    assert secondary.calls == 1
+    assert sum(caching.hits for caching in runtime.caching_providers) == 0
+    runtime.response_cache.close()
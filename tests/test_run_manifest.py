@@ -0,0 +1,194 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from src.export.document_exporter import DocumentExporter
+from src.llm.provider import LLMProvider
+from src.models.experience_data import ExperienceData
+from src.models.job_keywords import JobDescriptionKeywords
+from src.models.job_request import JobRequest
+from src.models.resume_patch import ResumePatch
+from src.models.skill_gap import SkillGapAnalysis
+from src.pipeline.job_pipeline import JobPipeline
+from src.pipeline.run_manifest import RunManifest, content_hash
+from src.pipeline.scheduler import PipelineScheduler
+from src.settings import BASE_DIR, Settings
+from src.storage.local_file_storage import LocalFileFileStorage
+from src.storage.write_behind import WriteBehindWriter
+
+MASTER_JSON = BASE_DIR / "data" / "example_master_data.json"
+
+KEYWORDS = JobDescriptionKeywords(
+    job_title="Platform Engineer",
+    seniority_level="Senior",
+    years_of_experience="5+",
+    company_name="Example",
+    department_or_team="Infra",
+    skill_requirements=[],
+    key_responsibilities=["Run the platform"],
+    industry_domain="SaaS",
+    keywords_for_ats=[],
+    summary_of_role="Own the platform.",
+)
+
+
+class CountingProvider(LLMProvider):
+    def __init__(self, experience_data: ExperienceData) -> None:
+        self.experience_data = experience_data
+        self.calls: list[str] = []
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        self.calls.append(output_model.__name__)
+        await asyncio.sleep(0.01)
+        if output_model is JobDescriptionKeywords:
+            return KEYWORDS
+        if output_model is SkillGapAnalysis:
+            return SkillGapAnalysis(gaps=[])
+        if output_model is ResumePatch:
+            return ResumePatch()
+        return self.experience_data.model_copy(deep=True)
+
+
+class FakeExporter(DocumentExporter):
+    def __init__(self) -> None:
+        self.exports = 0
+
+    def export(self, data: dict, output_path: Path) -> Path:
+        self.exports += 1
+        output_path.write_bytes(b"%PDF")
+        return output_path
+
+
+def _pipeline(
+    tmp_path: Path,
+    experience_data: ExperienceData,
+    provider: LLMProvider,
+    exporter: DocumentExporter,
+    writer: WriteBehindWriter | None = None,
+):
+    template = tmp_path / "template.md.j2"
+    template.write_text("# {{ name }}", encoding="utf-8")
+    settings = Settings.model_construct(
+        llm_provider="openai",
+        md_j2_template=template,
+        master_json=MASTER_JSON,
+        personal_json=MASTER_JSON,
+        cli_converter_path=tmp_path / "cli.js",
+        output_dir=tmp_path / "outputs",
+        run_manifest_path=tmp_path / "manifest.jsonl",
+    )
+    scheduler = PipelineScheduler()
+    pipeline = JobPipeline(
+        settings=settings,
+        provider=provider,
+        exporter=exporter,
+        experience_data=experience_data,
+        personal_data={"name": "Ada"},
+        scheduler=scheduler,
+        manifest=RunManifest(settings.run_manifest_path),
+        writer=writer,
+    )
+    return pipeline, scheduler
+
+
+async def test_rerun_skips_completed_stages(tmp_path: Path) -> None:
+    experience_data = ExperienceData.model_validate_json(MASTER_JSON.read_text(encoding="utf-8"))
+    provider, exporter = CountingProvider(experience_data), FakeExporter()
+    pipeline, scheduler = _pipeline(tmp_path, experience_data, provider, exporter)
+    first = await pipeline.process_request(JobRequest(text="Senior platform engineer"))
+    scheduler.shutdown()
+    assert provider.calls == ["JobDescriptionKeywords", "SkillGapAnalysis", "ResumePatch"]
+    assert (first.parent / "adjusted_resume.json").exists()
+    assert (first.parent / "job_description.md").exists()
+
+    provider.calls.clear()
+    pipeline, scheduler = _pipeline(tmp_path, experience_data, provider, exporter)
+    second = await pipeline.process_request(JobRequest(text="Senior platform engineer"))
+    scheduler.shutdown()
+    assert second == first
+    assert provider.calls == []
+    assert exporter.exports == 1
+
+
+async def test_resume_change_invalidates_dependent_stages_only(tmp_path: Path) -> None:
+    experience_data = ExperienceData.model_validate_json(MASTER_JSON.read_text(encoding="utf-8"))
+    provider, exporter = CountingProvider(experience_data), FakeExporter()
+    pipeline, scheduler = _pipeline(tmp_path, experience_data, provider, exporter)
+    await pipeline.process_request(JobRequest(text="Senior platform engineer"))
+    scheduler.shutdown()
+
+    provider.calls.clear()
+    edited = experience_data.model_copy(update={"summary": "Platform engineer."})
+    pipeline, scheduler = _pipeline(tmp_path, edited, provider, exporter)
+    await pipeline.process_request(JobRequest(text="Senior platform engineer"))
+    scheduler.shutdown()
+    assert provider.calls == ["SkillGapAnalysis", "ResumePatch"]
+
+
+async def test_identical_postings_are_processed_once(tmp_path: Path) -> None:
+    experience_data = ExperienceData.model_validate_json(MASTER_JSON.read_text(encoding="utf-8"))
+    provider, exporter = CountingProvider(experience_data), FakeExporter()
+    pipeline, scheduler = _pipeline(tmp_path, experience_data, provider, exporter)
+    paths = await asyncio.gather(
+        pipeline.process_request(JobRequest(text="Same posting", source="https://a.example/1")),
+        pipeline.process_request(JobRequest(text="Same posting", source="https://b.example/2")),
+    )
+    scheduler.shutdown()
+    assert paths[0] == paths[1]
+    assert len(provider.calls) == 3
+
+
+async def test_same_role_postings_get_separate_folders(tmp_path: Path) -> None:
+    experience_data = ExperienceData.model_validate_json(MASTER_JSON.read_text(encoding="utf-8"))
+    provider, exporter = CountingProvider(experience_data), FakeExporter()
+    pipeline, scheduler = _pipeline(tmp_path, experience_data, provider, exporter)
+    paths = await asyncio.gather(
+        pipeline.process_request(JobRequest(text="Platform engineer, team A")),
+        pipeline.process_request(JobRequest(text="Platform engineer, team B")),
+    )
+    scheduler.shutdown()
+    assert paths[0].parent != paths[1].parent
+
+
+async def test_failed_artifact_write_fails_the_job(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    save_model = LocalFileFileStorage.save_model
+
+    def failing_save_model(self: LocalFileFileStorage, data: BaseModel, path: Path) -> Path:
+        if path.name == "gaps.json":
+            raise OSError("disk full")
+        return save_model(self, data, path)
+
+    monkeypatch.setattr(LocalFileFileStorage, "save_model", failing_save_model)
+    experience_data = ExperienceData.model_validate_json(MASTER_JSON.read_text(encoding="utf-8"))
+    writer = WriteBehindWriter()
+    pipeline, scheduler = _pipeline(
+        tmp_path, experience_data, CountingProvider(experience_data), FakeExporter(), writer=writer
+    )
+    with pytest.raises(OSError, match="disk full"):
+        await pipeline.process_request(JobRequest(text="Senior platform engineer"))
+    await writer.aclose()
+    scheduler.shutdown()
+
+    manifest = RunManifest(tmp_path / "manifest.jsonl")
+    assert manifest.output_dir("text:" + content_hash("Senior platform engineer")) is not None
+    assert "gaps" not in (tmp_path / "manifest.jsonl").read_text(encoding="utf-8")
+
+
+def test_manifest_requires_matching_hash_and_artifacts(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.jsonl"
+    (tmp_path / "keywords.json").write_text("{}", encoding="utf-8")
+    manifest = RunManifest(path)
+    manifest.record("https://example.com/job", "keywords", content_hash("a"), tmp_path, "keywords.json")
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"source": "trunc')
+
+    reloaded = RunManifest(path)
+    assert len(reloaded) == 1
+    assert reloaded.completed("https://example.com/job", "keywords", content_hash("a")) is not None
+    assert reloaded.completed("https://example.com/job", "keywords", content_hash("b")) is None
+    assert reloaded.output_dir("https://example.com/job") == tmp_path
+
+    (tmp_path / "keywords.json").unlink()
+    assert reloaded.completed("https://example.com/job", "keywords", content_hash("a")) is None
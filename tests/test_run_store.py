@@ -0,0 +1,119 @@
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.models.extraction_run import JobKeywordResult
+from src.models.job_keywords import JobDescriptionKeywords
+from src.models.skill_gap import SkillGap, SkillGapAnalysis
+from src.pipeline.run_manifest import RunManifest
+from src.storage.local_file_storage import LocalFileFileStorage
+from src.storage.sqlite_run_store import RunStore
+
+
+def _keywords(company: str, title: str) -> JobDescriptionKeywords:
+    return JobDescriptionKeywords(
+        job_title=title,
+        seniority_level="Senior",
+        years_of_experience="5+",
+        company_name=company,
+        department_or_team="",
+        skill_requirements=[],
+        key_responsibilities=[],
+        industry_domain="",
+        keywords_for_ats=[],
+        summary_of_role="",
+    )
+
+
+def _save_run(store: RunStore, job_dir: Path, company: str, title: str, url: str) -> None:
+    storage = store.storage(job_dir)
+    with store.batch():
+        storage.save_model(JobKeywordResult(source_url=url, keywords=_keywords(company, title)), Path("keywords.json"))
+        storage.save_text(f"# {title}", Path("job_description.md"))
+
+
+def test_round_trips_artifacts_by_job_folder(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "runs.sqlite3")
+    storage = store.storage(tmp_path / "job1")
+    gaps = SkillGapAnalysis(gaps=[SkillGap(skill="Go", category="technical", importance="required", context="x")])
+
+    storage.save_model(gaps, Path("gaps.json"))
+    storage.save_text("# Posting", Path("job_description.md"))
+
+    assert store.storage(tmp_path / "job1").load_model(SkillGapAnalysis, Path("gaps.json")) == gaps
+    assert storage.load_model(SkillGapAnalysis, tmp_path / "job1" / "gaps.json") == gaps
+    assert storage.load_text(Path("job_description.md")) == "# Posting"
+    assert storage.load_model(JobKeywordResult, Path("gaps.json")) is None
+    assert store.storage(tmp_path / "job2").load_text(Path("job_description.md")) is None
+    assert not (tmp_path / "job1").exists()
+    store.close()
+
+
+def test_queries_runs_by_company_title_url_and_date(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "runs.sqlite3")
+    _save_run(store, tmp_path / "a", "Northwind Analytics", "Backend Engineer", "https://jobs.example.com/1")
+    _save_run(store, tmp_path / "b", "Contoso", "Data Engineer", "https://jobs.example.com/2")
+    _save_run(store, tmp_path / "c", "Northwind Analytics", "Data Engineer", "https://jobs.example.com/3")
+
+    assert {run.job_dir.name for run in store.find_runs(company="northwind")} == {"a", "c"}
+    assert {run.job_dir.name for run in store.find_runs(title="data", company="contoso")} == {"b"}
+    [run] = store.find_runs(url="https://JOBS.example.com/2?utm_source=feed")
+    assert run.title == "Data Engineer" and run.source == "https://jobs.example.com/2"
+    assert len(store.find_runs(since=datetime.now(tz=timezone.utc) - timedelta(minutes=1))) == 3
+    assert store.find_runs(until=datetime.now(tz=timezone.utc) - timedelta(minutes=1)) == []
+    assert len(store.find_runs(limit=2)) == 2
+    store.close()
+
+
+def test_filters_match_like_wildcards_literally(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "runs.sqlite3")
+    _save_run(store, tmp_path / "a", "100% Remote", "Data_Engineer", "https://jobs.example.com/1")
+    _save_run(store, tmp_path / "b", "1000 Robots", "Data Engineer", "https://jobs.example.com/2")
+
+    assert {run.job_dir.name for run in store.find_runs(company="100%")} == {"a"}
+    assert {run.job_dir.name for run in store.find_runs(title="data_")} == {"a"}
+    store.close()
+
+
+def test_batch_is_one_transaction(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "runs.sqlite3")
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            _save_run(store, tmp_path / "a", "Northwind", "Engineer", "https://jobs.example.com/1")
+            raise RuntimeError("interrupted")
+    assert len(store) == 0
+
+    with store.batch():
+        for i in range(500):
+            store.storage(tmp_path / f"job{i}").save_text("x", Path("job_description.md"))
+    store.close()
+    assert len(RunStore(tmp_path / "runs.sqlite3")) == 500
+
+
+def test_exports_per_job_folder_layout(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "runs.sqlite3")
+    _save_run(store, tmp_path / "outputs" / "job1", "Northwind", "Engineer", "https://jobs.example.com/1")
+
+    assert store.export_folders(tmp_path / "export") == 2
+    exported = tmp_path / "export" / "job1"
+    assert (exported / "job_description.md").read_text(encoding="utf-8") == "# Engineer"
+    keywords = LocalFileFileStorage(base_dir=exported).load_model(JobKeywordResult, Path("keywords.json"))
+    assert keywords.keywords.company_name == "Northwind"
+    assert (exported / "keywords.json").read_text(encoding="utf-8").startswith("{\n  ")
+    assert json.loads((exported / "keywords.json").read_text(encoding="utf-8"))["source_url"].endswith("/1")
+    store.close()
+
+
+def test_manifest_resumes_from_stored_artifacts(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "runs.sqlite3")
+    manifest = RunManifest(tmp_path / "manifest.jsonl", artifact_exists=store.has)
+    _save_run(store, tmp_path / "job1", "Northwind", "Engineer", "https://jobs.example.com/1")
+    manifest.record("src", "keywords", "h", tmp_path / "job1", "keywords.json", "job_description.md")
+
+    assert manifest.completed("src", "keywords", "h") is not None
+    assert RunManifest(tmp_path / "manifest.jsonl").completed("src", "keywords", "h") is None
+    manifest.record("src", "pdf", "h", tmp_path / "job1", "resume.pdf")
+    assert manifest.completed("src", "pdf", "h") is None
+    store.close()
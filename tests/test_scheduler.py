@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from src.llm.provider import LLMProvider
+from src.pipeline.scheduler import PipelineScheduler, StageLimits, summarize_outcomes
+
+
+class _Answer(BaseModel):
+    value: str
+
+
+class _SlowProvider(LLMProvider):
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return output_model.model_validate({"value": prompt})
+
+
+async def test_run_isolates_failures() -> None:
+    scheduler = PipelineScheduler(StageLimits(jobs=3))
+
+    async def job(source: str) -> Path:
+        if source == "bad":
+            raise RuntimeError("boom")
+        return Path(source)
+
+    try:
+        outcomes = await scheduler.run(["a", "bad", "b", "c"], job)
+    finally:
+        scheduler.shutdown()
+
+    by_source = {outcome.source: outcome for outcome in outcomes}
+    assert len(outcomes) == 4
+    assert by_source["a"].output_path == Path("a")
+    assert not by_source["bad"].succeeded
+    assert "RuntimeError: boom" in by_source["bad"].error
+    assert "3 succeeded, 1 failed" in summarize_outcomes(outcomes)
+
+
+async def test_limits_llm_calls_in_flight() -> None:
+    scheduler = PipelineScheduler(StageLimits(jobs=10, llm=2))
+    inner = _SlowProvider()
+    provider = scheduler.limit_llm(inner)
+
+    async def job(source: str) -> Path:
+        await provider.generate_structured(source, _Answer)
+        return Path(source)
+
+    try:
+        outcomes = await scheduler.run([str(i) for i in range(10)], job)
+    finally:
+        scheduler.shutdown()
+
+    assert all(outcome.succeeded for outcome in outcomes)
+    assert inner.peak == 2
+
+
+async def test_offload_runs_off_the_event_loop() -> None:
+    scheduler = PipelineScheduler(StageLimits(pdf=1))
+    loop_thread = threading.get_ident()
+    try:
+        worker_thread = await scheduler.offload("pdf", threading.get_ident)
+    finally:
+        scheduler.shutdown()
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+async def test_jobs_limit_bounds_concurrency(jobs: int) -> None:
+    scheduler = PipelineScheduler(StageLimits(jobs=jobs))
+    state = {"in_flight": 0, "peak": 0}
+
+    async def job(source: str) -> Path:
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.005)
+        state["in_flight"] -= 1
+        return Path(source)
+
+    try:
+        await scheduler.run([str(i) for i in range(12)], job)
+    finally:
+        scheduler.shutdown()
+    assert state["peak"] == jobs
+
+
+async def test_stream_pulls_async_sources_only_when_a_worker_is_free() -> None:
+    scheduler = PipelineScheduler(StageLimits(jobs=2))
+    pulled = 0
+    finished = 0
+    max_ahead = 0
+
+    async def sources():
+        nonlocal pulled, max_ahead
+        for i in range(20):
+            pulled += 1
+            max_ahead = max(max_ahead, pulled - finished)
+            yield f"job-{i}"
+
+    async def job(source: str) -> Path:
+        nonlocal finished
+        await asyncio.sleep(0.001)
+        finished += 1
+        if source == "job-3":
+            raise RuntimeError("boom")
+        return Path(source)
+
+    try:
+        outcomes = [outcome async for outcome in scheduler.stream(sources(), job)]
+    finally:
+        scheduler.shutdown()
+
+    assert len(outcomes) == 20
+    assert max_ahead <= 2
+    assert [outcome.source for outcome in outcomes if not outcome.succeeded] == ["job-3"]
@@ -0,0 +1,127 @@
+from pydantic import BaseModel
+
+from src.agents.analyze_skill_gaps import analyze_skill_gaps
+from src.llm.provider import LLMProvider
+from src.matching.skill_index import SkillIndex, normalize_skill
+from src.models.experience_data import ExperienceData, ExperienceEntry, Skills
+from src.models.job_keywords import JobDescriptionKeywords, SkillRequirement
+from src.models.skill_gap import SkillGap, SkillGapAnalysis
+
+
+def _experience() -> ExperienceData:
+    return ExperienceData(
+        summary="Backend engineer focused on data platforms.",
+        experience=[
+            ExperienceEntry(
+                title="Software Engineer",
+                company="Acme",
+                date="2020 - Present",
+                bullets=[
+                    "Migrated 40 services to K8s and cut deploy time in half",
+                    "Tuned Postgres queries behind the billing API",
+                    "Built Google Cloud Platform data pipelines with Apache Beam",
+                ],
+            )
+        ],
+        skills=Skills(languages=["Python", "Go"], tools=["Terraform", "Docker"]),
+    )
+
+
+def _keywords(requirements: list[SkillRequirement]) -> JobDescriptionKeywords:
+    return JobDescriptionKeywords(
+        job_title="Platform Engineer",
+        seniority_level="Senior",
+        years_of_experience="5+",
+        company_name="Example",
+        department_or_team="Infra",
+        skill_requirements=requirements,
+        key_responsibilities=["Run the platform"],
+        industry_domain="SaaS",
+        keywords_for_ats=[],
+        summary_of_role="Own the platform.",
+    )
+
+
+class _RecordingProvider(LLMProvider):
+    def __init__(self, gaps: list[SkillGap]) -> None:
+        self.prompts: list[str] = []
+        self._gaps = gaps
+
+    async def generate_structured[T: BaseModel](self, prompt: str, output_model: type[T]) -> T:
+        self.prompts.append(prompt)
+        return SkillGapAnalysis(gaps=self._gaps)
+
+
+def test_normalize_skill_maps_aliases() -> None:
+    assert normalize_skill("k8s") == "kubernetes"
+    assert normalize_skill(" Postgres ") == "postgresql"
+    assert normalize_skill("GCP") == "google cloud"
+    assert normalize_skill("Node.js") == "node.js"
+    assert normalize_skill("TF") == "tf"
+
+
+def test_classify_decides_clear_cases_locally() -> None:
+    index = SkillIndex(_experience())
+    assert index.classify("Kubernetes", "technical") == "present"
+    assert index.classify("PostgreSQL", "technical") == "present"
+    assert index.classify("GCP", "technical") == "present"
+    assert index.classify("Rust", "technical") == "missing"
+    assert index.classify("Terraform", "technical") == "uncertain"
+    assert index.classify("Apache Kafka", "technical") == "uncertain"
+    assert index.classify("Communication", "soft") == "uncertain"
+
+
+def test_classify_defers_short_and_common_word_skills_without_strong_evidence() -> None:
+    experience = _experience()
+    experience.experience[0].bullets.append("Coordinated the go-live of the new R&D portal in spring 2023")
+    experience.experience[0].bullets.append("Ported the reporting jobs from SAS to R")
+    experience.experience[0].bullets.append("Rewrote the scheduler in go for lower latency")
+    index = SkillIndex(experience)
+
+    assert index.classify("Spring", "technical") == "uncertain"
+    assert index.classify("spring", "technical") == "uncertain"
+    assert index.classify("R", "technical") == "present"
+    assert index.classify("Go", "technical") == "present"
+
+
+def test_classify_defers_ambiguous_abbreviations() -> None:
+    experience = _experience()
+    experience.experience[0].bullets.append("Trained TF models for demand forecasting")
+    index = SkillIndex(experience)
+
+    assert index.classify("Terraform", "technical") == "uncertain"
+    assert index.classify("TensorFlow", "technical") == "uncertain"
+
+
+async def test_hybrid_analysis_sends_only_uncertain_skills_to_the_llm() -> None:
+    keywords = _keywords(
+        [
+            SkillRequirement(skills=["k8s", "Rust", "Terraform"], category="technical", importance="required"),
+            SkillRequirement(skills=["Mentoring"], category="soft", importance="preferred"),
+        ]
+    )
+    provider = _RecordingProvider(
+        [
+            SkillGap(skill="Terraform", category="technical", importance="required", context="not in bullets"),
+            SkillGap(skill="Kubernetes", category="technical", importance="required", context="duplicate"),
+        ]
+    )
+
+    analysis = await analyze_skill_gaps(_experience(), keywords, provider, SkillIndex(_experience()))
+
+    assert [gap.skill for gap in analysis.gaps] == ["Rust", "Terraform"]
+    assert len(provider.prompts) == 1
+    assert '"Terraform"' in provider.prompts[0]
+    assert '"Mentoring"' in provider.prompts[0]
+    assert '"Rust"' not in provider.prompts[0]
+    assert '"k8s"' not in provider.prompts[0]
+
+
+async def test_hybrid_analysis_skips_the_llm_when_everything_is_decided() -> None:
+    keywords = _keywords([SkillRequirement(skills=["Kubernetes", "Haskell"], category="technical", importance="required")])
+    provider = _RecordingProvider([])
+
+    analysis = await analyze_skill_gaps(_experience(), keywords, provider, SkillIndex(_experience()))
+
+    assert [gap.skill for gap in analysis.gaps] == ["Haskell"]
+    assert provider.prompts == []
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_PACKAGES = {"openai", "google", "docling", "jinja2"}
+# Cumulative import time of `main`, measured with -X importtime; generous enough for slow CI machines.
+MAIN_IMPORT_BUDGET_S = 1.0
+
+
+def _import_profile(module: str) -> tuple[set[str], dict[str, float]]:
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+            _, cumulative_us, name = line.removeprefix("import time:").split("|")
+            cumulative[name.strip()] = int(cumulative_us) / 1e6
+    return set(result.stdout.split()), cumulative
+
+
+def test_cli_import_skips_heavy_dependencies() -> None:
+    modules, cumulative = _import_profile("main")
+    assert not {name.split(".")[0] for name in modules} & HEAVY_PACKAGES
+    assert "src.pipeline.runtime" not in modules
+    assert cumulative["main"] < MAIN_IMPORT_BUDGET_S
+
+
+@pytest.mark.parametrize("module", ["src.pipeline.runtime", "src.llm.factory"])
+def test_pipeline_import_defers_provider_sdks(module: str) -> None:
+    modules, _ = _import_profile(module)
+    assert not {name.split(".")[0] for name in modules} & {"openai", "google", "docling"}
+
+
+def test_help_runs_without_settings() -> None:
+    result = subprocess.run([sys.executable, "main.py", "--help"], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0
+    assert "serve" in result.stdout
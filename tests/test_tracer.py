@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.pipeline.scheduler import PipelineScheduler
+from src.tracing.pricing import ModelPrice, estimate_cost
+from src.tracing.tracer import Tracer, current_span, percentile, record_usage, span
+
+
+def test_span_is_noop_without_active_tracer() -> None:
+    with span("docling") as current:
+        assert current is None
+        record_usage(10, 5)
+
+
+def test_spans_nest_and_are_written_as_jsonl(tmp_path: Path) -> None:
+    tracer = Tracer(run_id="run", trace_dir=tmp_path, prices={"m": ModelPrice(input_per_mtok=1, output_per_mtok=2)})
+    with tracer.activate():
+        with span("job", job="https://example.com/1"):
+            with span("llm.Keywords") as llm:
+                llm.model = "m"
+                record_usage(1000, 500)
+            with pytest.raises(ValueError):
+                with span("pdf"):
+                    raise ValueError("boom")
+    tracer.close()
+
+    records = [json.loads(line) for line in (tmp_path / "run.jsonl").read_text().splitlines()]
+    by_stage = {record["stage"]: record for record in records}
+    assert [record["stage"] for record in records] == ["llm.Keywords", "pdf", "job"]
+    assert by_stage["llm.Keywords"]["parent_id"] == by_stage["job"]["span_id"]
+    assert by_stage["llm.Keywords"]["job"] == "https://example.com/1"
+    assert by_stage["llm.Keywords"]["cost_usd"] == pytest.approx(0.002)
+    assert by_stage["pdf"]["status"] == "error"
+    assert "boom" in by_stage["pdf"]["error"]
+
+
+async def test_offloaded_work_inherits_current_span() -> None:
+    tracer = Tracer(run_id="run")
+    scheduler = PipelineScheduler()
+    try:
+        with tracer.activate():
+            with span("job") as job:
+                parent = await scheduler.offload("docling", lambda: current_span())
+        assert parent is job
+    finally:
+        scheduler.shutdown()
+
+
+def test_summary_reports_percentiles_per_stage() -> None:
+    tracer = Tracer(run_id="run")
+    with tracer.activate():
+        for _ in range(3):
+            with span("render"):
+                pass
+
+    assert len(tracer.stage_durations()["render"]) == 3
+    summary = tracer.summary()
+    assert "render" in summary
+    assert "p95" in summary
+
+
+def test_percentile_and_cost_helpers() -> None:
+    assert percentile([], 95) == 0.0
+    assert percentile([4.0, 1.0, 3.0, 2.0], 50) == 2.0
+    assert percentile([float(i) for i in range(1, 101)], 95) == 95.0
+    assert estimate_cost("unknown-model", 100, 100) is None
+    assert estimate_cost("gpt-5-mini", 1_000_000, 0, cached_tokens=1_000_000) == pytest.approx(0.025)
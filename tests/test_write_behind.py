@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.models.skill_gap import SkillGap, SkillGapAnalysis
+from src.storage.local_file_storage import LocalFileFileStorage
+from src.storage.write_behind import WriteBehindWriter
+
+
+class SlowStorage(LocalFileFileStorage):
+    def __init__(self, base_dir: Path, delay: float = 0.0, fail: str | None = None) -> None:
+        super().__init__(base_dir=base_dir)
+        self.delay = delay
+        self.fail = fail
+        self.threads: set[str] = set()
+        self.synced: list[Path] = []
+
+    def save_text(self, text: str, path: Path) -> Path:
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        if path.name == self.fail:
+            raise OSError("disk full")
+        return super().save_text(text, path)
+
+    def sync(self, path: Path) -> None:
+        self.synced.append(path)
+        super().sync(path)
+
+
+async def test_saves_off_the_event_loop_and_reads_its_own_writes(tmp_path: Path) -> None:
+    storage = SlowStorage(tmp_path, delay=0.05)
+    writer = WriteBehindWriter()
+
+    started = time.perf_counter()
+    for i in range(5):
+        assert await writer.save_text(storage, f"v{i}", Path("a.md")) == tmp_path / "a.md"
+    assert time.perf_counter() - started < 0.05
+
+    assert await writer.load_text(storage, Path("a.md")) == "v4"
+    gaps = SkillGapAnalysis(gaps=[SkillGap(skill="Go", category="technical", importance="required", context="x")])
+    await writer.save_model(storage, gaps, Path("gaps.json"))
+    assert await writer.load_model(storage, SkillGapAnalysis, Path("gaps.json")) == gaps
+    await writer.aclose()
+
+    assert storage.threads == {"write-behind"}
+    # Queued rewrites of a.md coalesce into fewer writes than saves.
+    assert writer.writes < 6
+
+
+async def test_after_waits_for_the_write_and_skips_failures(tmp_path: Path) -> None:
+    storage = SlowStorage(tmp_path, delay=0.02, fail="bad.md")
+    writer = WriteBehindWriter()
+    recorded: list[str] = []
+
+    await writer.save_text(storage, "ok", Path("good.md"))
+    await writer.save_text(storage, "ok", Path("bad.md"))
+    writer.after(storage, [Path("good.md")], lambda: recorded.append("good"))
+    writer.after(storage, [Path("good.md"), Path("bad.md")], lambda: recorded.append("both"))
+    writer.after(storage, [Path("other.md")], lambda: recorded.append("nothing pending"))
+    assert recorded == ["nothing pending"]
+
+    await asyncio.sleep(0.1)
+    writer.after(storage, [Path("bad.md")], lambda: recorded.append("late"))
+    with pytest.raises(OSError, match="disk full"):
+        await writer.flush()
+    assert recorded == ["nothing pending", "good"]
+    # Reported failures are no longer pending.
+    await writer.flush()
+    await writer.aclose()
+
+
+async def test_settle_reports_only_the_given_artifacts(tmp_path: Path) -> None:
+    storage = SlowStorage(tmp_path, delay=0.01, fail="bad.md")
+    writer = WriteBehindWriter()
+
+    await writer.save_text(storage, "x", Path("bad.md"))
+    await writer.save_text(storage, "x", Path("good.md"))
+    await writer.settle(storage, [Path("good.md")])
+    with pytest.raises(OSError, match="disk full"):
+        await writer.settle(storage, [Path("good.md"), Path("bad.md")])
+    await writer.settle(storage, [Path("bad.md")])
+    await writer.aclose()
+
+
+@pytest.mark.parametrize(("durability", "expected"), [("write", 3), ("batch", 3), ("none", 0)])
+async def test_durability_policy_controls_fsync(tmp_path: Path, durability: str, expected: int) -> None:
+    storage = SlowStorage(tmp_path)
+    writer = WriteBehindWriter(durability=durability, write_behind=False)
+    for name in ("a.md", "b.md", "c.md"):
+        await writer.save_text(storage, "x", Path(name))
+    await writer.aclose()
+    assert len(storage.synced) == expected
+
+
+async def test_close_drains_writes_of_a_cancelled_run(tmp_path: Path) -> None:
+    storage = SlowStorage(tmp_path, delay=0.01)
+    writer = WriteBehindWriter(max_batch=4)
+
+    async def run() -> None:
+        for i in range(20):
+            await writer.save_text(storage, "x", Path(f"{i}.md"))
+        await asyncio.sleep(10)
+
+    task = asyncio.create_task(run())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await writer.aclose()
+
+    assert len(list(tmp_path.glob("*.md"))) == 20
+    assert writer.batches >= 5
+    with pytest.raises(RuntimeError):
+        await writer.save_text(storage, "x", Path("late.md"))